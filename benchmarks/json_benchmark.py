@@ -0,0 +1,166 @@
+import argparse
+import json
+import tracemalloc
+from timeit import timeit
+from uuid import uuid4
+
+from core.kucoin_auto_sell import KuCoinAutoSell
+from utils import JSON_BACKEND
+from utils import JsonStruct
+from utils import KucoinSymbol
+from utils import PreparedRequest
+
+
+class KucoinSymbolsResponse(JsonStruct):
+    code: str
+    data: list[KucoinSymbol]
+
+
+def make_symbols_body(symbols_count: int) -> bytes:
+    return json.dumps({
+        'code': '200000',
+        'data': [
+            {
+                'symbol': f'FAKE{index}-USDT',
+                'name': f'FAKE{index}-USDT',
+                'baseCurrency': f'FAKE{index}',
+                'quoteCurrency': 'USDT',
+                'baseMinSize': '0.0001',
+                'quoteMinSize': '0.1',
+                'baseMaxSize': '10000000000',
+                'quoteMaxSize': '99999999',
+                'baseIncrement': '0.0001',
+                'quoteIncrement': '0.000001',
+                'priceIncrement': '0.0001',
+                'feeCurrency': 'USDT',
+                'enableTrading': True,
+                'isMarginEnabled': False
+            }
+            for index in range(symbols_count)
+        ]
+    }).encode('utf-8')
+
+
+def make_batch_order(orders_count: int) -> tuple[bytes, PreparedRequest]:
+    client_oids: list[str] = [str(uuid4()) for _ in range(orders_count)]
+    body: bytes = json.dumps({
+        'code': '200000',
+        'data': {
+            'data': [
+                {
+                    'symbol': 'TOKEN-USDT',
+                    'type': 'limit',
+                    'side': 'sell',
+                    'price': '1',
+                    'size': '1',
+                    'clientOid': client_oid,
+                    'id': str(uuid4()),
+                    'status': 'success',
+                    'failMsg': None
+                }
+                for client_oid in client_oids
+            ]
+        }
+    }).encode('utf-8')
+
+    return body, PreparedRequest(request_url='/api/v1/orders/multi',
+                                 body=b'',
+                                 headers={},
+                                 sign_payload=b'',
+                                 order_quantities={client_oid: 1 for client_oid in client_oids})
+
+
+def list_backends() -> dict:
+    backends: dict = {'json': json.loads}
+
+    try:
+        import orjson
+        backends['orjson'] = orjson.loads
+
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+        backends['msgspec'] = msgspec.json.Decoder().decode
+
+    except ImportError:
+        pass
+
+    return backends
+
+
+def list_typed_decoders(response_type: type) -> dict:
+    typed_decoders: dict = {}
+
+    try:
+        import msgspec
+        typed_decoders['msgspec'] = msgspec.json.Decoder(type=response_type,
+                                                         strict=False).decode
+
+    except ImportError:
+        pass
+
+    return typed_decoders
+
+
+def measure_peak_kb(function) -> float:
+    tracemalloc.start()
+    function()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak_bytes / 1024
+
+
+def report(name: str,
+           body: bytes,
+           parse,
+           iterations: int,
+           response_type: type | None = None,
+           parse_typed=None) -> None:
+    print(f'{name} ({len(body) / 1024:.0f} KB):')
+
+    for backend_name, decode in list_backends().items():
+        decode_us: float = timeit(lambda: decode(body), number=iterations) / iterations * 10 ** 6
+        typed_us: float = timeit(lambda: parse(decode(body)), number=iterations) / iterations * 10 ** 6
+        peak_kb: float = measure_peak_kb(function=lambda: parse(decode(body)))
+
+        print(f'  {backend_name:<8} decode: {decode_us:9.1f} us | typed: {typed_us:9.1f} us '
+              f'| peak: {peak_kb:8.0f} KB')
+
+    if response_type is None:
+        return
+
+    for backend_name, decode_typed in list_typed_decoders(response_type=response_type).items():
+        typed_us: float = timeit(lambda: parse_typed(decode_typed(body)), number=iterations) / iterations * 10 ** 6
+        peak_kb: float = measure_peak_kb(function=lambda: parse_typed(decode_typed(body)))
+
+        print(f'  {backend_name:<8} decode into structs  | typed: {typed_us:9.1f} us '
+              f'| peak: {peak_kb:8.0f} KB')
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Compares JSON backends on exchange-shaped responses, decoded into the typed objects the client uses')
+    parser.add_argument('--symbols', type=int, default=1500)
+    parser.add_argument('--orders', type=int, default=5)
+    parser.add_argument('--iterations', type=int, default=200)
+    parsed_arguments: argparse.Namespace = parser.parse_args()
+
+    print(f'Active Backend: {JSON_BACKEND}')
+
+    report(name='Symbols List',
+           body=make_symbols_body(symbols_count=parsed_arguments.symbols),
+           parse=lambda response_json: KuCoinAutoSell.parse_symbols(response_json=response_json),
+           iterations=parsed_arguments.iterations,
+           response_type=KucoinSymbolsResponse,
+           parse_typed=lambda response: [KuCoinAutoSell.parse_symbol_info(symbol=current_symbol)
+                                         for current_symbol in response.data])
+
+    batch_body, batch_request = make_batch_order(orders_count=parsed_arguments.orders)
+    report(name='Batch Order Ack',
+           body=batch_body,
+           parse=lambda response_json: KuCoinAutoSell.parse_order_results(response_json=response_json,
+                                                                          prepared_request=batch_request),
+           iterations=parsed_arguments.iterations * 100)
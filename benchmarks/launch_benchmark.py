@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import math
+from sys import stderr
+from time import time
+
+from benchmarks.mock_exchange import MockExchange
+from core.bybit_auto_sell import ByBitAutoSell
+from core.kucoin_auto_sell import KuCoinAutoSell
+from utils import logger
+from utils import TRANSPORTS
+
+
+def make_auto_sell(exchange: str,
+                   endpoint_url: str,
+                   start_sale_time: int,
+                   threads: int,
+                   requests_count: int,
+                   batch_orders_count: int,
+                   hedge_count: int,
+                   order_rate_limit: int,
+                   listing_stream: bool,
+                   order_websocket: bool,
+                   rehearse: bool,
+                   http_transport: str) -> KuCoinAutoSell | ByBitAutoSell:
+    if exchange == 'kucoin':
+        return KuCoinAutoSell(api_key='key',
+                              api_secret='secret',
+                              api_pass_phrase='pass_phrase',
+                              token_from='token',
+                              token_to='usdt',
+                              start_sale_time=start_sale_time,
+                              sale_price=1,
+                              threads=threads,
+                              requests_count=requests_count,
+                              endpoint_url=endpoint_url,
+                              proxy_str=None,
+                              batch_orders_count=batch_orders_count,
+                              hedge_count=hedge_count,
+                              order_rate_limit=order_rate_limit,
+                              listing_stream=listing_stream,
+                              rehearse=rehearse,
+                              http_transport=http_transport)
+
+    return ByBitAutoSell(api_key='key',
+                         api_secret='secret',
+                         token_from='token',
+                         token_to='usdt',
+                         start_sale_time=start_sale_time,
+                         sale_price=1,
+                         threads=threads,
+                         requests_count=requests_count,
+                         endpoint_url=endpoint_url,
+                         proxy_str=None,
+                         batch_orders_count=batch_orders_count,
+                         hedge_count=hedge_count,
+                         order_rate_limit=order_rate_limit,
+                         listing_stream=listing_stream,
+                         order_websocket=order_websocket,
+                         rehearse=rehearse,
+                         http_transport=http_transport)
+
+
+async def run_launch(arguments: argparse.Namespace,
+                     exchange: str,
+                     http_transport: str,
+                     threads: int,
+                     requests_count: int) -> dict:
+    start_sale_time: int = math.ceil(time()) + arguments.lead
+    mock_exchange: MockExchange = MockExchange(listing_time=start_sale_time + arguments.listing_delay_ms / 1000,
+                                               latency_distribution=arguments.latency_distribution,
+                                               latency_mean_ms=arguments.latency_ms,
+                                               latency_jitter_ms=arguments.jitter_ms,
+                                               rate_limit=arguments.rate_limit,
+                                               error_rate=arguments.error_rate,
+                                               clock_offset_ms=arguments.clock_offset_ms)
+    endpoint_url: str = await mock_exchange.start()
+
+    try:
+        auto_sell: KuCoinAutoSell | ByBitAutoSell = make_auto_sell(exchange=exchange,
+                                                                    endpoint_url=endpoint_url,
+                                                                    start_sale_time=start_sale_time,
+                                                                    threads=threads,
+                                                                    requests_count=requests_count,
+                                                                    batch_orders_count=arguments.batch_orders_count,
+                                                                    hedge_count=arguments.hedge_count,
+                                                                    order_rate_limit=arguments.order_rate_limit,
+                                                                    listing_stream=arguments.listing_stream,
+                                                                    order_websocket=arguments.order_websocket,
+                                                                    rehearse=arguments.rehearse,
+                                                                    http_transport=http_transport)
+        await auto_sell.main_work()
+
+    finally:
+        await mock_exchange.stop()
+
+    listing_time: float = mock_exchange.listing_time - mock_exchange.clock_offset_ms / 1000
+    burst_seconds: float = (mock_exchange.last_order_request_time or 0) - (mock_exchange.first_order_request_time or 0)
+
+    return {
+        'exchange': exchange,
+        'transport': http_transport,
+        'threads': threads,
+        'requests_count': requests_count,
+        'first_request_ms': ((mock_exchange.first_order_request_time or math.nan) - listing_time) * 1000,
+        'first_accepted_ms': ((mock_exchange.first_accepted_time or math.nan) - listing_time) * 1000,
+        'order_requests': mock_exchange.order_requests,
+        'wasted_requests': mock_exchange.order_requests - mock_exchange.accepted_order_requests,
+        'throughput': mock_exchange.order_requests / burst_seconds if burst_seconds > 0 else math.nan
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    results: list[dict] = []
+
+    for exchange in arguments.exchanges:
+        for http_transport in arguments.transports:
+            for threads in arguments.threads:
+                for requests_count in arguments.requests:
+                    results.append(await run_launch(arguments=arguments,
+                                                    exchange=exchange,
+                                                    http_transport=http_transport,
+                                                    threads=threads,
+                                                    requests_count=requests_count))
+
+    print(f'{"exchange":<8} {"transport":<9} {"threads":>7} {"requests":>8} {"first req ms":>12} {"first ack ms":>12} '
+          f'{"sent":>6} {"wasted":>6} {"req/s":>8}')
+
+    for result in results:
+        print(f'{result["exchange"]:<8} {result["transport"]:<9} {result["threads"]:>7} {result["requests_count"]:>8} '
+              f'{result["first_request_ms"]:>12.1f} {result["first_accepted_ms"]:>12.1f} '
+              f'{result["order_requests"]:>6} {result["wasted_requests"]:>6} {result["throughput"]:>8.1f}')
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Runs the full main_work flow against a local mock exchange for a matrix of settings')
+    parser.add_argument('--exchanges', nargs='+', default=['kucoin', 'bybit'], choices=['kucoin', 'bybit'])
+    parser.add_argument('--transports', nargs='+', default=['aiohttp'], choices=list(TRANSPORTS))
+    parser.add_argument('--threads', nargs='+', type=int, default=[1, 5, 20])
+    parser.add_argument('--requests', nargs='+', type=int, default=[10, 100])
+    parser.add_argument('--batch-orders-count', type=int, default=0)
+    parser.add_argument('--hedge-count', type=int, default=1)
+    parser.add_argument('--latency-distribution', default='normal', choices=['normal', 'lognormal', 'uniform'])
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--jitter-ms', type=float, default=5)
+    parser.add_argument('--rate-limit', type=int, default=0)
+    parser.add_argument('--order-rate-limit', type=int, default=0, help='order_rate_limit setting of the client')
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--clock-offset-ms', type=float, default=0)
+    parser.add_argument('--lead', type=int, default=2, help='seconds between start and listing time')
+    parser.add_argument('--listing-delay-ms', type=float, default=0, help='actual listing after start_sale_time')
+    parser.add_argument('--listing-stream', action='store_true')
+    parser.add_argument('--order-websocket', action='store_true', help='bybit only')
+    parser.add_argument('--rehearse', action='store_true', help='send the burst to order validation endpoints')
+    parser.add_argument('--verbose', action='store_true')
+    parsed_arguments: argparse.Namespace = parser.parse_args()
+
+    if not parsed_arguments.verbose:
+        logger.remove()
+        logger.add(stderr, level='CRITICAL')
+
+    asyncio.run(main(arguments=parsed_arguments))
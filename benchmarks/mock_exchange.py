@@ -0,0 +1,1014 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import random
+from json import loads
+from time import time
+from uuid import uuid4
+
+from aiohttp import web
+
+
+class MockExchange:
+    def __init__(self,
+                 listing_time: float,
+                 balance: float = 1000,
+                 token_from: str = 'TOKEN',
+                 token_to: str = 'USDT',
+                 base_increment: str = '0.0001',
+                 price_increment: str = '0.0001',
+                 latency_distribution: str = 'normal',
+                 latency_mean_ms: float = 20,
+                 latency_jitter_ms: float = 5,
+                 rate_limit: int = 0,
+                 rate_limit_window_ms: int = 1000,
+                 error_rate: float = 0,
+                 clock_offset_ms: float = 0,
+                 symbols_count: int = 1000,
+                 best_bid: float = 0,
+                 verify_signatures: bool = True,
+                 api_key: str = 'key',
+                 api_secret: str = 'secret',
+                 api_pass_phrase: str = 'pass_phrase'):
+        self.listing_time: float = listing_time
+        self.balance: float = balance
+        self.token_from: str = token_from.upper()
+        self.token_to: str = token_to.upper()
+        self.base_increment: str = base_increment
+        self.price_increment: str = price_increment
+        self.latency_distribution: str = latency_distribution
+        self.latency_mean_ms: float = latency_mean_ms
+        self.latency_jitter_ms: float = latency_jitter_ms
+        self.rate_limit: int = rate_limit
+        self.rate_limit_window_ms: int = rate_limit_window_ms
+        self.error_rate: float = error_rate
+        self.clock_offset_ms: float = clock_offset_ms
+        self.symbols_count: int = symbols_count
+        self.best_bid: float = best_bid
+        self.verify_signatures: bool = verify_signatures
+        self.api_key: str = api_key
+        self.api_secret: str = api_secret
+        self.api_pass_phrase: str = api_pass_phrase
+
+        self.order_requests: int = 0
+        self.accepted_order_requests: int = 0
+        self.orders_accepted: int = 0
+        self.orders_rejected: int = 0
+        self.first_order_request_time: float | None = None
+        self.last_order_request_time: float | None = None
+        self.first_accepted_time: float | None = None
+        self.accepted_client_ids: dict[str, str] = {}
+        self.orders: dict[str, dict] = {}
+        self.cancelled_orders: int = 0
+        self.kucoin_sockets: set[web.WebSocketResponse] = set()
+        self.bybit_sockets: set[web.WebSocketResponse] = set()
+        self.stream_sockets: set[web.WebSocketResponse] = set()
+        self.url: str | None = None
+        self.rate_limit_windows: dict[str, tuple[float, int]] = {}
+
+        self.runner: web.AppRunner | None = None
+        self.app: web.Application = web.Application()
+        self.app.router.add_get('/api/v1/timestamp', self.kucoin_timestamp)
+        self.app.router.add_get('/api/v1/accounts', self.kucoin_accounts)
+        self.app.router.add_get('/api/v2/symbols', self.kucoin_symbols)
+        self.app.router.add_get('/api/v2/symbols/{symbol}', self.kucoin_symbol)
+        self.app.router.add_post('/api/v1/orders', self.kucoin_order)
+        self.app.router.add_get('/api/v1/orders', self.kucoin_active_orders)
+        self.app.router.add_post('/api/v1/orders/multi', self.kucoin_batch_order)
+        self.app.router.add_post('/api/v1/orders/test', self.kucoin_test_order)
+        self.app.router.add_get('/api/v1/orders/{order_id}', self.kucoin_order_state)
+        self.app.router.add_delete('/api/v1/orders/{order_id}', self.kucoin_cancel_order)
+        self.app.router.add_get('/api/v1/market/orderbook/level1', self.kucoin_level1)
+        self.app.router.add_post('/api/v1/bullet-public', self.kucoin_bullet_public)
+        self.app.router.add_post('/api/v1/bullet-private', self.kucoin_bullet_private)
+        self.app.router.add_get('/kucoin/ws', self.kucoin_websocket)
+        self.app.router.add_get('/v3/public/time', self.bybit_time)
+        self.app.router.add_get('/v5/account/wallet-balance', self.bybit_wallet_balance)
+        self.app.router.add_get('/spot/v3/public/symbols', self.bybit_symbols)
+        self.app.router.add_get('/v5/market/instruments-info', self.bybit_instruments_info)
+        self.app.router.add_post('/v5/order/create', self.bybit_order)
+        self.app.router.add_post('/v5/order/create-batch', self.bybit_batch_order)
+        self.app.router.add_get('/v5/order/realtime', self.bybit_order_realtime)
+        self.app.router.add_get('/v5/order/history', self.bybit_order_history)
+        self.app.router.add_post('/v5/order/cancel', self.bybit_cancel_order)
+        self.app.router.add_get('/v5/market/tickers', self.bybit_tickers)
+        self.app.router.add_get('/v5/private', self.bybit_websocket)
+        self.app.router.add_get('/v5/public/spot', self.bybit_public_websocket)
+        self.app.router.add_get('/v5/trade', self.bybit_trade_websocket)
+
+    async def start(self,
+                    host: str = '127.0.0.1',
+                    port: int = 0) -> str:
+        self.runner: web.AppRunner = web.AppRunner(self.app)
+        await self.runner.setup()
+
+        site: web.TCPSite = web.TCPSite(self.runner, host, port)
+        await site.start()
+
+        self.url: str = f'http://{host}:{site._server.sockets[0].getsockname()[1]}'
+
+        return self.url
+
+    async def stop(self) -> None:
+        for websocket in self.kucoin_sockets | self.bybit_sockets | self.stream_sockets:
+            await websocket.close()
+
+        if self.runner:
+            await self.runner.cleanup()
+
+    def server_time_ms(self) -> int:
+        return int(time() * 1000 + self.clock_offset_ms)
+
+    async def wait_listing(self) -> None:
+        await asyncio.sleep(max(self.listing_time * 1000 - self.server_time_ms(), 0) / 1000)
+
+    async def simulate_latency(self) -> None:
+        if self.latency_distribution == 'lognormal' and self.latency_mean_ms > 0:
+            sigma: float = (self.latency_jitter_ms / self.latency_mean_ms) if self.latency_mean_ms else 0
+            latency_ms: float = random.lognormvariate(0, sigma) * self.latency_mean_ms
+
+        elif self.latency_distribution == 'uniform':
+            latency_ms: float = random.uniform(self.latency_mean_ms - self.latency_jitter_ms,
+                                               self.latency_mean_ms + self.latency_jitter_ms)
+
+        else:
+            latency_ms: float = random.gauss(self.latency_mean_ms, self.latency_jitter_ms)
+
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+    def take_rate_limit(self,
+                        path: str) -> tuple[bool, int, int]:
+        current_time_ms: float = self.server_time_ms()
+        window_start, window_used = self.rate_limit_windows.get(path, (0, 0))
+
+        if current_time_ms - window_start >= self.rate_limit_window_ms:
+            window_start, window_used = current_time_ms, 0
+
+        window_used += 1
+        self.rate_limit_windows[path] = window_start, window_used
+
+        return window_used <= self.rate_limit, max(self.rate_limit - window_used, 0), \
+            int(window_start + self.rate_limit_window_ms)
+
+    def is_kucoin_signature_valid(self,
+                                  request: web.Request,
+                                  body: bytes) -> bool:
+        if not self.verify_signatures:
+            return True
+
+        secret: bytes = self.api_secret.encode('utf-8')
+        str_to_sign: bytes = (request.headers.get('KC-API-TIMESTAMP', '') + request.method + request.path_qs).encode(
+            'utf-8') + body
+        signature: str = base64.b64encode(hmac.new(secret, str_to_sign, hashlib.sha256).digest()).decode()
+        passphrase: str = base64.b64encode(
+            hmac.new(secret, self.api_pass_phrase.encode('utf-8'), hashlib.sha256).digest()).decode()
+
+        return request.headers.get('KC-API-KEY') == self.api_key \
+            and request.headers.get('KC-API-SIGN') == signature \
+            and request.headers.get('KC-API-PASSPHRASE') == passphrase
+
+    def is_bybit_signature_valid(self,
+                                 request: web.Request,
+                                 body: bytes) -> bool:
+        if not self.verify_signatures:
+            return True
+
+        str_to_sign: bytes = (request.headers.get('X-BAPI-TIMESTAMP', '') + self.api_key
+                              + request.headers.get('X-BAPI-RECV-WINDOW', '')).encode('utf-8') \
+            + (body if request.method == 'POST' else request.query_string.encode('utf-8'))
+        signature: str = hmac.new(self.api_secret.encode('utf-8'), str_to_sign, hashlib.sha256).hexdigest()
+
+        return request.headers.get('X-BAPI-API-KEY') == self.api_key \
+            and request.headers.get('X-BAPI-SIGN') == signature
+
+    def fill_order(self,
+                   client_id: str,
+                   quantity: float,
+                   price: float) -> tuple[str | None, str]:
+        if client_id in self.accepted_client_ids:
+            return None, 'duplicate'
+
+        if self.server_time_ms() < self.listing_time * 1000:
+            return None, 'not_trading'
+
+        if quantity > self.balance + 1e-12:
+            return None, 'insufficient'
+
+        self.balance -= quantity
+        order_id: str = uuid4().hex
+        self.accepted_client_ids[client_id] = order_id
+        self.orders[order_id] = {
+            'order_id': order_id,
+            'price': price,
+            'quantity': quantity,
+            'filled': quantity if price <= self.best_bid else 0,
+            'active': price > self.best_bid,
+            'cancelled': False
+        }
+        self.publish_order(order=self.orders[order_id])
+
+        if self.first_accepted_time is None:
+            self.first_accepted_time: float = time()
+
+        return order_id, 'success'
+
+    def set_best_bid(self,
+                     best_bid: float) -> None:
+        self.best_bid: float = best_bid
+
+        for order in self.orders.values():
+            if order['active'] and order['price'] <= best_bid:
+                order['filled'] = order['quantity']
+                order['active'] = False
+                self.publish_order(order=order)
+
+    def cancel_order(self,
+                     order_id: str) -> bool:
+        order: dict | None = self.orders.get(order_id)
+
+        if not order or not order['active']:
+            return False
+
+        order['active'] = False
+        order['cancelled'] = True
+        self.balance += order['quantity'] - order['filled']
+        self.cancelled_orders += 1
+        self.publish_order(order=order)
+
+        return True
+
+    def publish_order(self,
+                      order: dict) -> None:
+        for websocket in self.kucoin_sockets:
+            asyncio.ensure_future(websocket.send_json({
+                'type': 'message',
+                'topic': '/spotMarket/tradeOrders',
+                'subject': 'orderChange',
+                'data': {
+                    'orderId': order['order_id'],
+                    'symbol': f'{self.token_from}-{self.token_to}',
+                    'price': str(order['price']),
+                    'size': str(order['quantity']),
+                    'filledSize': str(order['filled']),
+                    'remainSize': str(order['quantity'] - order['filled']),
+                    'status': 'open' if order['active'] else 'done',
+                    'type': 'open' if order['active'] else 'canceled' if order['cancelled'] else 'filled'
+                }
+            }))
+
+        for websocket in self.bybit_sockets:
+            asyncio.ensure_future(websocket.send_json({
+                'topic': 'order',
+                'creationTime': self.server_time_ms(),
+                'data': [self.make_bybit_order(order=order)]
+            }))
+
+    def count_order_request(self) -> None:
+        self.order_requests += 1
+        self.last_order_request_time: float = time()
+
+        if self.first_order_request_time is None:
+            self.first_order_request_time: float = self.last_order_request_time
+
+    def handle_order_request(self,
+                             handler,
+                             *args):
+        orders_accepted: int = self.orders_accepted
+        handler_result = handler(*args)
+
+        if self.orders_accepted > orders_accepted:
+            self.accepted_order_requests += 1
+
+        return handler_result
+
+    def make_symbols(self,
+                     make_entry) -> list[dict]:
+        return [make_entry(f'FAKE{index}', self.token_to) for index in range(self.symbols_count)] \
+            + [make_entry(self.token_from, self.token_to)]
+
+    async def kucoin_response(self,
+                              request: web.Request,
+                              handler,
+                              signed: bool = True) -> web.Response:
+        body: bytes = await request.read()
+        await self.simulate_latency()
+
+        headers: dict = {}
+
+        if self.rate_limit:
+            allowed, remaining, reset_ms = self.take_rate_limit(path=request.path)
+            headers: dict = {
+                'gw-ratelimit-limit': str(self.rate_limit),
+                'gw-ratelimit-remaining': str(remaining),
+                'gw-ratelimit-reset': str(int(reset_ms - self.server_time_ms()))
+            }
+
+            if not allowed:
+                return web.json_response({'code': '429000', 'msg': 'Too Many Requests'}, status=429, headers=headers)
+
+        if signed and not self.is_kucoin_signature_valid(request=request,
+                                                         body=body):
+            return web.json_response({'code': '400005', 'msg': 'Invalid KC-API-SIGN'}, status=401, headers=headers)
+
+        if random.random() < self.error_rate:
+            return web.json_response({'code': '500000', 'msg': 'Internal Server Error'}, status=500, headers=headers)
+
+        response_code, response_data = self.handle_order_request(handler, loads(body) if body else None)
+
+        return web.json_response({'code': response_code, **response_data}, headers=headers)
+
+    async def bybit_response(self,
+                             request: web.Request,
+                             handler,
+                             signed: bool = True) -> web.Response:
+        body: bytes = await request.read()
+        await self.simulate_latency()
+
+        headers: dict = {}
+
+        if self.rate_limit:
+            allowed, remaining, reset_ms = self.take_rate_limit(path=request.path)
+            headers: dict = {
+                'X-Bapi-Limit': str(self.rate_limit),
+                'X-Bapi-Limit-Status': str(remaining),
+                'X-Bapi-Limit-Reset-Timestamp': str(reset_ms)
+            }
+
+            if not allowed:
+                return web.json_response({'retCode': 10006, 'retMsg': 'Too many visits!'}, headers=headers)
+
+        if signed and not self.is_bybit_signature_valid(request=request,
+                                                        body=body):
+            return web.json_response({'retCode': 10004, 'retMsg': 'error sign!'}, headers=headers)
+
+        if random.random() < self.error_rate:
+            return web.json_response({'retCode': 10016, 'retMsg': 'Internal server error'}, headers=headers)
+
+        response_code, response_data = self.handle_order_request(handler, loads(body) if body else None)
+
+        return web.json_response({'retCode': response_code,
+                                  'retMsg': 'OK' if response_code == 0 else response_data.pop('retMsg', 'error'),
+                                  'time': self.server_time_ms(),
+                                  **response_data},
+                                 headers=headers)
+
+    async def kucoin_timestamp(self,
+                               request: web.Request) -> web.Response:
+        return await self.kucoin_response(request=request,
+                                          handler=lambda _: ('200000', {'data': self.server_time_ms()}),
+                                          signed=False)
+
+    async def kucoin_accounts(self,
+                              request: web.Request) -> web.Response:
+        return await self.kucoin_response(request=request,
+                                          handler=lambda _: ('200000', {'data': [{
+                                              'currency': self.token_from,
+                                              'type': 'trade',
+                                              'balance': str(self.balance),
+                                              'available': str(self.balance),
+                                              'holds': '0'
+                                          }]}))
+
+    def make_kucoin_symbol(self,
+                           base: str,
+                           quote: str) -> dict:
+        return {
+            'symbol': f'{base}-{quote}',
+            'baseCurrency': base,
+            'quoteCurrency': quote,
+            'baseIncrement': self.base_increment,
+            'priceIncrement': self.price_increment,
+            'baseMinSize': self.base_increment,
+            'baseMaxSize': '10000000000',
+            'enableTrading': True
+        }
+
+    async def kucoin_symbols(self,
+                             request: web.Request) -> web.Response:
+        return await self.kucoin_response(request=request,
+                                          handler=lambda _: ('200000', {'data': self.make_symbols(
+                                              make_entry=self.make_kucoin_symbol)}))
+
+    async def kucoin_symbol(self,
+                            request: web.Request) -> web.Response:
+        def handler(_) -> tuple[str, dict]:
+            if request.match_info['symbol'].upper() != f'{self.token_from}-{self.token_to}':
+                return '900001', {'msg': 'symbol not exists'}
+
+            return '200000', {'data': self.make_kucoin_symbol(base=self.token_from,
+                                                              quote=self.token_to)}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    def kucoin_place_order(self,
+                           order: dict) -> tuple[str | None, str]:
+        order_id, status = self.fill_order(client_id=order['clientOid'],
+                                           quantity=float(order['size']),
+                                           price=float(order['price']))
+
+        if order_id:
+            self.orders_accepted += 1
+
+        else:
+            self.orders_rejected += 1
+
+        return order_id, status
+
+    async def kucoin_order(self,
+                           request: web.Request) -> web.Response:
+        self.count_order_request()
+
+        def handler(order: dict) -> tuple[str, dict]:
+            order_id, status = self.kucoin_place_order(order=order)
+
+            if status == 'success':
+                return '200000', {'data': {'orderId': order_id}}
+
+            if status == 'duplicate':
+                return '400100', {'msg': 'clientOid duplicated'}
+
+            if status == 'not_trading':
+                return '400100', {'msg': 'The symbol is not trading'}
+
+            return '200004', {'msg': 'Balance insufficient!'}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    async def kucoin_batch_order(self,
+                                 request: web.Request) -> web.Response:
+        self.count_order_request()
+
+        def handler(batch: dict) -> tuple[str, dict]:
+            results: list[dict] = []
+
+            for order in batch['orderList']:
+                order_id, status = self.kucoin_place_order(order=order)
+                results.append({
+                    'symbol': batch['symbol'],
+                    'side': order['side'],
+                    'type': order['type'],
+                    'price': order['price'],
+                    'size': order['size'],
+                    'clientOid': order['clientOid'],
+                    'id': order_id,
+                    'status': 'success' if order_id else 'fail',
+                    'failMsg': None if order_id else 'clientOid duplicated' if status == 'duplicate' else status
+                })
+
+            return '200000', {'data': {'data': results}}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    async def kucoin_test_order(self,
+                                request: web.Request) -> web.Response:
+        self.count_order_request()
+
+        def handler(order: dict) -> tuple[str, dict]:
+            if order['symbol'] != f'{self.token_from}-{self.token_to}':
+                return '400100', {'msg': 'Unsupported trading pair.'}
+
+            return '200000', {'data': {'orderId': uuid4().hex}}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    async def kucoin_order_state(self,
+                                 request: web.Request) -> web.Response:
+        def handler(_) -> tuple[str, dict]:
+            order: dict | None = self.orders.get(request.match_info['order_id'])
+
+            if not order:
+                return '400100', {'msg': 'order not exist.'}
+
+            return '200000', {'data': self.make_kucoin_order(order=order)}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    def make_kucoin_order(self,
+                          order: dict) -> dict:
+        return {
+            'id': order['order_id'],
+            'symbol': f'{self.token_from}-{self.token_to}',
+            'price': str(order['price']),
+            'size': str(order['quantity']),
+            'dealSize': str(order['filled']),
+            'isActive': order['active'],
+            'cancelExist': order['cancelled']
+        }
+
+    async def kucoin_active_orders(self,
+                                   request: web.Request) -> web.Response:
+        def handler(_) -> tuple[str, dict]:
+            orders: list[dict] = [self.make_kucoin_order(order=order) for order in self.orders.values()
+                                  if order['active'] == (request.query.get('status') == 'active')]
+
+            return '200000', {'data': {
+                'currentPage': 1,
+                'pageSize': int(request.query.get('pageSize', 50)),
+                'totalNum': len(orders),
+                'totalPage': 1,
+                'items': orders[:int(request.query.get('pageSize', 50))]
+            }}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    async def kucoin_cancel_order(self,
+                                  request: web.Request) -> web.Response:
+        def handler(_) -> tuple[str, dict]:
+            if not self.cancel_order(order_id=request.match_info['order_id']):
+                return '400100', {'msg': 'order_not_exist_or_not_allow_to_cancel'}
+
+            return '200000', {'data': {'cancelledOrderIds': [request.match_info['order_id']]}}
+
+        return await self.kucoin_response(request=request,
+                                          handler=handler)
+
+    async def kucoin_level1(self,
+                            request: web.Request) -> web.Response:
+        return await self.kucoin_response(request=request,
+                                          handler=lambda _: ('200000', {'data': {
+                                              'time': self.server_time_ms(),
+                                              'bestBid': str(self.best_bid) if self.best_bid else None
+                                          }}),
+                                          signed=False)
+
+    def make_kucoin_bullet(self) -> tuple[str, dict]:
+        return '200000', {'data': {
+            'token': uuid4().hex,
+            'instanceServers': [{
+                'endpoint': f'ws{self.url[4:]}/kucoin/ws',
+                'protocol': 'websocket',
+                'encrypt': False,
+                'pingInterval': 18000,
+                'pingTimeout': 10000
+            }]
+        }}
+
+    async def kucoin_bullet_public(self,
+                                   request: web.Request) -> web.Response:
+        return await self.kucoin_response(request=request,
+                                          handler=lambda _: self.make_kucoin_bullet(),
+                                          signed=False)
+
+    async def kucoin_bullet_private(self,
+                                    request: web.Request) -> web.Response:
+        return await self.kucoin_response(request=request,
+                                          handler=lambda _: self.make_kucoin_bullet())
+
+    async def kucoin_websocket(self,
+                               request: web.Request) -> web.WebSocketResponse:
+        websocket: web.WebSocketResponse = web.WebSocketResponse()
+        await websocket.prepare(request)
+        await websocket.send_json({'id': request.query.get('connectId'),
+                                   'type': 'welcome'})
+        listing_tasks: list[asyncio.Task] = []
+
+        async for message in websocket:
+            message_json: dict = loads(message.data)
+
+            if message_json.get('type') == 'ping':
+                await websocket.send_json({'id': message_json['id'],
+                                           'type': 'pong'})
+
+            elif message_json.get('type') == 'subscribe':
+                if message_json['topic'].startswith('/market/'):
+                    self.stream_sockets.add(websocket)
+                    listing_tasks.append(asyncio.create_task(self.publish_kucoin_listing(websocket=websocket,
+                                                                                         topic=message_json['topic'])))
+
+                else:
+                    self.kucoin_sockets.add(websocket)
+
+                await websocket.send_json({'id': message_json['id'],
+                                           'type': 'ack'})
+
+        for listing_task in listing_tasks:
+            listing_task.cancel()
+
+        self.kucoin_sockets.discard(websocket)
+        self.stream_sockets.discard(websocket)
+
+        return websocket
+
+    async def publish_kucoin_listing(self,
+                                     websocket: web.WebSocketResponse,
+                                     topic: str) -> None:
+        if not topic.startswith('/market/ticker:'):
+            return
+
+        await self.wait_listing()
+        await websocket.send_json({
+            'type': 'message',
+            'topic': topic,
+            'subject': 'trade.ticker',
+            'data': {
+                'sequence': '1',
+                'price': str(self.best_bid),
+                'size': '0',
+                'bestBid': str(self.best_bid),
+                'bestBidSize': '0',
+                'bestAsk': '',
+                'bestAskSize': '0',
+                'time': self.server_time_ms()
+            }
+        })
+
+    async def bybit_time(self,
+                         request: web.Request) -> web.Response:
+        server_time_ms: int = self.server_time_ms()
+
+        return await self.bybit_response(request=request,
+                                         handler=lambda _: (0, {'result': {
+                                             'timeSecond': str(server_time_ms // 1000),
+                                             'timeNano': str(server_time_ms * 10 ** 6)
+                                         }}),
+                                         signed=False)
+
+    async def bybit_wallet_balance(self,
+                                   request: web.Request) -> web.Response:
+        return await self.bybit_response(request=request,
+                                         handler=lambda _: (0, {'result': {'list': [{
+                                             'accountType': 'SPOT',
+                                             'coin': [{
+                                                 'coin': self.token_from,
+                                                 'walletBalance': str(self.balance)
+                                             }]
+                                         }]}}))
+
+    async def bybit_symbols(self,
+                            request: web.Request) -> web.Response:
+        return await self.bybit_response(request=request,
+                                         handler=lambda _: (0, {'result': {'list': self.make_symbols(
+                                             make_entry=lambda base, quote: {
+                                                 'name': f'{base}{quote}',
+                                                 'alias': f'{base}{quote}',
+                                                 'baseCoin': base,
+                                                 'quoteCoin': quote,
+                                                 'basePrecision': self.base_increment,
+                                                 'quotePrecision': self.price_increment,
+                                                 'minTradeQty': self.base_increment,
+                                                 'maxTradeQty': '10000000000',
+                                                 'minPricePrecision': self.price_increment,
+                                                 'showStatus': '1'
+                                             })}}),
+                                         signed=False)
+
+    async def bybit_instruments_info(self,
+                                     request: web.Request) -> web.Response:
+        def handler(_) -> tuple[int, dict]:
+            if request.query.get('symbol', '').upper() != f'{self.token_from}{self.token_to}':
+                return 0, {'result': {'category': 'spot', 'list': []}}
+
+            return 0, {'result': {'category': 'spot', 'list': [{
+                'symbol': f'{self.token_from}{self.token_to}',
+                'baseCoin': self.token_from,
+                'quoteCoin': self.token_to,
+                'status': 'Trading',
+                'lotSizeFilter': {
+                    'basePrecision': self.base_increment,
+                    'minOrderQty': self.base_increment,
+                    'maxOrderQty': '10000000000'
+                },
+                'priceFilter': {
+                    'tickSize': self.price_increment
+                }
+            }]}}
+
+        return await self.bybit_response(request=request,
+                                         handler=handler,
+                                         signed=False)
+
+    def bybit_place_order(self,
+                          order: dict) -> tuple[str | None, int, str]:
+        order_id, status = self.fill_order(client_id=order['orderLinkId'],
+                                           quantity=float(order['qty']),
+                                           price=float(order['price']))
+
+        if order_id:
+            self.orders_accepted += 1
+            return order_id, 0, 'OK'
+
+        self.orders_rejected += 1
+
+        if status == 'duplicate':
+            return None, 170141, 'Duplicate clientOrderId'
+
+        if status == 'not_trading':
+            return None, 170130, 'Symbol not trading yet'
+
+        return None, 170131, 'Insufficient balance.'
+
+    async def bybit_order(self,
+                          request: web.Request) -> web.Response:
+        self.count_order_request()
+
+        def handler(order: dict) -> tuple[int, dict]:
+            order_id, code, message = self.bybit_place_order(order=order)
+
+            if order_id:
+                return 0, {'result': {'orderId': order_id, 'orderLinkId': order['orderLinkId']}}
+
+            return code, {'retMsg': message, 'result': {}}
+
+        return await self.bybit_response(request=request,
+                                         handler=handler)
+
+    async def bybit_batch_order(self,
+                                request: web.Request) -> web.Response:
+        self.count_order_request()
+
+        def handler(batch: dict) -> tuple[int, dict]:
+            results: list[dict] = []
+            codes: list[dict] = []
+
+            for order in batch['request']:
+                order_id, code, message = self.bybit_place_order(order=order)
+                results.append({
+                    'category': 'spot',
+                    'symbol': order['symbol'],
+                    'orderId': order_id or '',
+                    'orderLinkId': order['orderLinkId']
+                })
+                codes.append({'code': code, 'msg': message})
+
+            return 0, {'result': {'list': results}, 'retExtInfo': {'list': codes}}
+
+        return await self.bybit_response(request=request,
+                                         handler=handler)
+
+    def make_bybit_order(self,
+                         order: dict) -> dict:
+        if order['active']:
+            order_status: str = 'PartiallyFilled' if order['filled'] else 'New'
+
+        elif order['cancelled']:
+            order_status: str = 'PartiallyFilledCanceled' if order['filled'] else 'Cancelled'
+
+        else:
+            order_status: str = 'Filled'
+
+        return {
+            'orderId': order['order_id'],
+            'symbol': f'{self.token_from}{self.token_to}',
+            'side': 'Sell',
+            'price': str(order['price']),
+            'qty': str(order['quantity']),
+            'cumExecQty': str(order['filled']),
+            'leavesQty': str(order['quantity'] - order['filled'] if order['active'] else 0),
+            'orderStatus': order_status
+        }
+
+    async def bybit_order_realtime(self,
+                                   request: web.Request) -> web.Response:
+        if 'orderId' in request.query:
+            orders: list[dict] = [order for order in [self.orders.get(request.query['orderId'])]
+                                  if order and order['active']]
+
+        else:
+            orders: list[dict] = [order for order in self.orders.values()
+                                  if order['active']][:int(request.query.get('limit', 20))]
+
+        return await self.bybit_response(request=request,
+                                         handler=lambda _: (0, {'result': {
+                                             'category': 'spot',
+                                             'list': [self.make_bybit_order(order=order) for order in orders]
+                                         }}))
+
+    async def bybit_order_history(self,
+                                  request: web.Request) -> web.Response:
+        order: dict | None = self.orders.get(request.query.get('orderId', ''))
+
+        return await self.bybit_response(request=request,
+                                         handler=lambda _: (0, {'result': {
+                                             'category': 'spot',
+                                             'list': [self.make_bybit_order(order=order)]
+                                             if order and not order['active'] else []
+                                         }}))
+
+    async def bybit_cancel_order(self,
+                                 request: web.Request) -> web.Response:
+        self.count_order_request()
+
+        def handler(order: dict) -> tuple[int, dict]:
+            if not self.cancel_order(order_id=order.get('orderId', '')):
+                return 170213, {'retMsg': 'Order does not exist.', 'result': {}}
+
+            return 0, {'result': {'orderId': order['orderId'], 'orderLinkId': ''}}
+
+        return await self.bybit_response(request=request,
+                                         handler=handler)
+
+    async def bybit_tickers(self,
+                            request: web.Request) -> web.Response:
+        return await self.bybit_response(request=request,
+                                         handler=lambda _: (0, {'result': {'category': 'spot', 'list': [{
+                                             'symbol': f'{self.token_from}{self.token_to}',
+                                             'bid1Price': str(self.best_bid) if self.best_bid else ''
+                                         }]}}),
+                                         signed=False)
+
+    async def bybit_websocket(self,
+                              request: web.Request) -> web.WebSocketResponse:
+        websocket: web.WebSocketResponse = web.WebSocketResponse()
+        await websocket.prepare(request)
+        authorized: bool = False
+
+        async for message in websocket:
+            message_json: dict = loads(message.data)
+
+            if message_json.get('op') == 'ping':
+                await websocket.send_json({'op': 'pong',
+                                           'success': True})
+
+            elif message_json.get('op') == 'auth':
+                api_key, expires, signature = message_json['args']
+                authorized: bool = not self.verify_signatures or (
+                    api_key == self.api_key and signature == hmac.new(self.api_secret.encode('utf-8'),
+                                                                      f'GET/realtime{expires}'.encode('utf-8'),
+                                                                      hashlib.sha256).hexdigest())
+                await websocket.send_json({'op': 'auth',
+                                           'success': authorized,
+                                           'ret_msg': '' if authorized else 'Params Error'})
+
+            elif message_json.get('op') == 'subscribe':
+                if authorized:
+                    self.bybit_sockets.add(websocket)
+
+                await websocket.send_json({'op': 'subscribe',
+                                           'success': authorized,
+                                           'ret_msg': '' if authorized else 'Request not authorized'})
+
+        self.bybit_sockets.discard(websocket)
+
+        return websocket
+
+    async def publish_bybit_listing(self,
+                                    websocket: web.WebSocketResponse,
+                                    topic: str) -> None:
+        if not topic.startswith('orderbook.'):
+            return
+
+        await websocket.send_json({'topic': topic,
+                                   'type': 'snapshot',
+                                   'ts': self.server_time_ms(),
+                                   'data': {'s': f'{self.token_from}{self.token_to}', 'b': [], 'a': [], 'u': 1}})
+        await self.wait_listing()
+        await websocket.send_json({'topic': topic,
+                                   'type': 'snapshot',
+                                   'ts': self.server_time_ms(),
+                                   'data': {'s': f'{self.token_from}{self.token_to}',
+                                            'b': [[str(self.best_bid), '0']] if self.best_bid else [],
+                                            'a': [[self.price_increment, '1']],
+                                            'u': 2}})
+
+    async def bybit_public_websocket(self,
+                                     request: web.Request) -> web.WebSocketResponse:
+        websocket: web.WebSocketResponse = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.stream_sockets.add(websocket)
+        listing_tasks: list[asyncio.Task] = []
+
+        async for message in websocket:
+            message_json: dict = loads(message.data)
+
+            if message_json.get('op') == 'ping':
+                await websocket.send_json({'op': 'pong',
+                                           'success': True})
+
+            elif message_json.get('op') == 'subscribe':
+                await websocket.send_json({'op': 'subscribe',
+                                           'success': True,
+                                           'ret_msg': ''})
+                listing_tasks.extend(asyncio.create_task(self.publish_bybit_listing(websocket=websocket,
+                                                                                    topic=topic))
+                                     for topic in message_json['args'])
+
+        for listing_task in listing_tasks:
+            listing_task.cancel()
+
+        self.stream_sockets.discard(websocket)
+
+        return websocket
+
+    def bybit_trade_operation(self,
+                              operation: str,
+                              args: list[dict]) -> tuple[int, str, dict, dict]:
+        if operation == 'order.create':
+            order_id, code, message = self.bybit_place_order(order=args[0])
+
+            return code, message, {'orderId': order_id, 'orderLinkId': args[0]['orderLinkId']} if order_id else {}, {}
+
+        if operation == 'order.create-batch':
+            results: list[dict] = []
+            codes: list[dict] = []
+
+            for order in args[0]['request']:
+                order_id, code, message = self.bybit_place_order(order=order)
+                results.append({
+                    'category': 'spot',
+                    'symbol': order['symbol'],
+                    'orderId': order_id or '',
+                    'orderLinkId': order['orderLinkId']
+                })
+                codes.append({'code': code, 'msg': message})
+
+            return 0, 'OK', {'list': results}, {'list': codes}
+
+        if operation == 'order.cancel':
+            if not self.cancel_order(order_id=args[0].get('orderId', '')):
+                return 170213, 'Order does not exist.', {}, {}
+
+            return 0, 'OK', {'orderId': args[0]['orderId'], 'orderLinkId': ''}, {}
+
+        return 10001, f'Unsupported Operation: {operation}', {}, {}
+
+    async def respond_bybit_trade(self,
+                                  websocket: web.WebSocketResponse,
+                                  message_json: dict) -> None:
+        self.count_order_request()
+        await self.simulate_latency()
+        header: dict = {'Timenow': str(self.server_time_ms())}
+        allowed: bool = True
+
+        if self.rate_limit:
+            allowed, remaining, reset_ms = self.take_rate_limit(path=f'/v5/{message_json["op"].replace(".", "/")}')
+            header.update({
+                'X-Bapi-Limit': str(self.rate_limit),
+                'X-Bapi-Limit-Status': str(remaining),
+                'X-Bapi-Limit-Reset-Timestamp': str(reset_ms)
+            })
+
+        if not allowed:
+            code, message, data, ext_info = 10006, 'Too many visits!', {}, {}
+
+        elif random.random() < self.error_rate:
+            code, message, data, ext_info = 10016, 'Internal server error', {}, {}
+
+        else:
+            code, message, data, ext_info = self.handle_order_request(self.bybit_trade_operation,
+                                                                      message_json['op'],
+                                                                      message_json['args'])
+
+        await websocket.send_json({'reqId': message_json['reqId'],
+                                   'retCode': code,
+                                   'retMsg': message,
+                                   'op': message_json['op'],
+                                   'data': data,
+                                   'retExtInfo': ext_info,
+                                   'header': header,
+                                   'connId': id(websocket)})
+
+    async def bybit_trade_websocket(self,
+                                    request: web.Request) -> web.WebSocketResponse:
+        websocket: web.WebSocketResponse = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.stream_sockets.add(websocket)
+        authorized: bool = False
+        order_tasks: set[asyncio.Task] = set()
+
+        async for message in websocket:
+            message_json: dict = loads(message.data)
+
+            if message_json.get('op') == 'ping':
+                await websocket.send_json({'op': 'pong',
+                                           'retCode': 0})
+
+            elif message_json.get('op') == 'auth':
+                api_key, expires, signature = message_json['args']
+                authorized: bool = not self.verify_signatures or (
+                    api_key == self.api_key and signature == hmac.new(self.api_secret.encode('utf-8'),
+                                                                      f'GET/realtime{expires}'.encode('utf-8'),
+                                                                      hashlib.sha256).hexdigest())
+                await websocket.send_json({'op': 'auth',
+                                           'retCode': 0 if authorized else 10004,
+                                           'retMsg': 'OK' if authorized else 'Params Error',
+                                           'connId': id(websocket)})
+
+            elif not authorized:
+                await websocket.send_json({'reqId': message_json.get('reqId'),
+                                           'retCode': 10004,
+                                           'retMsg': 'Request not authorized',
+                                           'op': message_json.get('op'),
+                                           'data': {},
+                                           'retExtInfo': {},
+                                           'header': {}})
+
+            else:
+                order_task: asyncio.Task = asyncio.create_task(self.respond_bybit_trade(websocket=websocket,
+                                                                                        message_json=message_json))
+                order_tasks.add(order_task)
+                order_task.add_done_callback(order_tasks.discard)
+
+        for order_task in list(order_tasks):
+            order_task.cancel()
+
+        self.stream_sockets.discard(websocket)
+
+        return websocket
@@ -0,0 +1,128 @@
+import base64
+import hashlib
+import hmac
+from json import dumps
+from time import time
+from timeit import timeit
+from uuid import uuid4
+
+from core.bybit_auto_sell import ByBitAutoSell
+from core.kucoin_auto_sell import KuCoinAutoSell
+
+ITERATIONS: int = 20000
+
+
+def legacy_kucoin_request(api_key: str,
+                          api_secret: str,
+                          api_pass_phrase: str) -> tuple[dict, str]:
+    request_data: dict = {
+        'side': 'sell',
+        'symbol': 'TOKEN-USDT',
+        'type': 'limit',
+        'size': f'{123.456:.9f}',
+        'clientOid': str(uuid4()),
+        'price': str(1.5)
+    }
+    current_timestamp: int = int(time() * 1000)
+    str_to_sign: str = str(current_timestamp) + 'POST' + '/api/v1/orders' + dumps(request_data)
+
+    signature: bytes = base64.b64encode(
+        hmac.new(api_secret.encode('utf-8'), str_to_sign.encode('utf-8'), hashlib.sha256).digest())
+    passphrase: bytes = base64.b64encode(
+        hmac.new(api_secret.encode('utf-8'), api_pass_phrase.encode('utf-8'), hashlib.sha256).digest())
+
+    headers: dict = {
+        "KC-API-SIGN": signature.decode(),
+        "KC-API-TIMESTAMP": str(current_timestamp),
+        "KC-API-KEY": api_key,
+        "KC-API-PASSPHRASE": passphrase.decode(),
+        "KC-API-KEY-VERSION": "2",
+        "Content-Type": "application/json"
+    }
+
+    return headers, dumps(request_data)
+
+
+def legacy_bybit_request(api_key: str,
+                         api_secret: str) -> tuple[dict, str]:
+    request_data: dict = {
+        'category': 'spot',
+        'symbol': 'TOKENUSDT',
+        'side': 'Sell',
+        'orderType': 'Limit',
+        'qty': str(123.456),
+        'price': str(1.5)
+    }
+    current_timestamp: int = int(time() * 10 ** 3)
+    str_to_sign: str = str(current_timestamp) + str(api_key) + '5000' + dumps(request_data)
+
+    signature: str = hmac.new(bytes(api_secret, "utf-8"), str_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    headers: dict = {
+        "X-BAPI-API-KEY": api_key,
+        "X-BAPI-TIMESTAMP": str(current_timestamp),
+        "X-BAPI-SIGN": signature,
+        "X-BAPI-SIGN-TYPE": "2",
+        "X-BAPI-RECV-WINDOW": str(5000),
+        "Content-Type": "application/json"
+    }
+
+    return headers, dumps(request_data)
+
+
+def report(name: str,
+           legacy_seconds: float,
+           prepared_seconds: float) -> None:
+    legacy_us: float = legacy_seconds / ITERATIONS * 10 ** 6
+    prepared_us: float = prepared_seconds / ITERATIONS * 10 ** 6
+
+    print(f'{name:<8} before: {legacy_us:7.2f} us/request | after: {prepared_us:7.2f} us/request '
+          f'| x{legacy_us / prepared_us:.1f}')
+
+
+if __name__ == '__main__':
+    kucoin_auto_sell: KuCoinAutoSell = KuCoinAutoSell(api_key='key',
+                                                      api_secret='secret',
+                                                      api_pass_phrase='pass_phrase',
+                                                      token_from='token',
+                                                      token_to='usdt',
+                                                      start_sale_time=0,
+                                                      sale_price=1.5,
+                                                      threads=1,
+                                                      requests_count=1,
+                                                      endpoint_url='',
+                                                      proxy_str=None)
+    kucoin_prepared_request = kucoin_auto_sell.prepare_sell_requests(token_from_balance=123.456,
+                                                                     base_increment=0.001,
+                                                                     price_increment=0.1)[0]
+
+    report(name='KuCoin',
+           legacy_seconds=timeit(lambda: legacy_kucoin_request(api_key='key',
+                                                               api_secret='secret',
+                                                               api_pass_phrase='pass_phrase'),
+                                 number=ITERATIONS),
+           prepared_seconds=timeit(lambda: kucoin_auto_sell.sign_prepared_request(
+               prepared_request=kucoin_prepared_request),
+                                   number=ITERATIONS))
+
+    bybit_auto_sell: ByBitAutoSell = ByBitAutoSell(api_key='key',
+                                                   api_secret='secret',
+                                                   token_from='token',
+                                                   token_to='usdt',
+                                                   start_sale_time=0,
+                                                   sale_price=1.5,
+                                                   threads=1,
+                                                   requests_count=1,
+                                                   endpoint_url='',
+                                                   proxy_str=None)
+    bybit_prepared_request = bybit_auto_sell.prepare_sell_requests(token_from_balance=123.456,
+                                                                   base_increment=0.001,
+                                                                   price_increment=0.1)[0]
+
+    report(name='ByBit',
+           legacy_seconds=timeit(lambda: legacy_bybit_request(api_key='key',
+                                                              api_secret='secret'),
+                                 number=ITERATIONS),
+           prepared_seconds=timeit(lambda: bybit_auto_sell.sign_prepared_request(
+               prepared_request=bybit_prepared_request),
+                                   number=ITERATIONS))
@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+from sys import stderr
+from time import perf_counter, process_time
+
+from benchmarks.mock_exchange import MockExchange
+from core.kucoin_auto_sell import KuCoinAutoSell
+from utils import decode_json
+from utils import EgressPool
+from utils import logger
+from utils import PreparedRequest
+from utils import TRANSPORTS
+from utils.latency_recorder_file import percentile
+
+
+async def send_orders(egress_pool: EgressPool,
+                      auto_sell: KuCoinAutoSell,
+                      prepared_request: PreparedRequest,
+                      requests_count: int,
+                      latencies_ms: list[float]) -> int:
+    errors: int = 0
+
+    for _ in range(requests_count):
+        request_start: float = perf_counter()
+        response = await egress_pool.request(method='POST',
+                                             url=f'{auto_sell.endpoint_url}{prepared_request.request_url}',
+                                             headers=auto_sell.sign_prepared_request(prepared_request=prepared_request),
+                                             data=prepared_request.body)
+        response_json: dict = decode_json(await response.read())
+        latencies_ms.append((perf_counter() - request_start) * 1000)
+
+        if response_json.get('code') != '200000':
+            errors += 1
+
+    return errors
+
+
+async def run_transport(transport: str,
+                        concurrency: int,
+                        requests_count: int,
+                        endpoint_url: str) -> dict:
+    auto_sell: KuCoinAutoSell = KuCoinAutoSell(api_key='key',
+                                               api_secret='secret',
+                                               api_pass_phrase='pass_phrase',
+                                               token_from='token',
+                                               token_to='usdt',
+                                               start_sale_time=0,
+                                               sale_price=1.5,
+                                               threads=concurrency,
+                                               requests_count=1,
+                                               endpoint_url=endpoint_url,
+                                               proxy_str=None)
+    prepared_request: PreparedRequest = auto_sell.prepare_rehearsal_request(
+        prepared_request=auto_sell.prepare_sell_requests(token_from_balance=123.456,
+                                                         base_increment=0.001,
+                                                         price_increment=0.1)[0])
+    latencies_ms: list[float] = []
+
+    async with EgressPool(proxies=[None],
+                          connections_count=concurrency,
+                          transport=transport) as egress_pool:
+        await egress_pool.warm(urls=[f'{endpoint_url}{auto_sell.SERVER_TIME_PATH}'])
+        cpu_start: float = process_time()
+        wall_start: float = perf_counter()
+        errors: list[int] = await asyncio.gather(*[
+            send_orders(egress_pool=egress_pool,
+                        auto_sell=auto_sell,
+                        prepared_request=prepared_request,
+                        requests_count=requests_count // concurrency,
+                        latencies_ms=latencies_ms)
+            for _ in range(concurrency)
+        ])
+        wall_seconds: float = perf_counter() - wall_start
+        cpu_seconds: float = process_time() - cpu_start
+        connections_created: int = egress_pool.egresses[0].connection_stats.created
+
+    return {
+        'transport': transport,
+        'concurrency': concurrency,
+        'requests': len(latencies_ms),
+        'errors': sum(errors),
+        'wall_us': wall_seconds / len(latencies_ms) * 10 ** 6,
+        'cpu_us': cpu_seconds / len(latencies_ms) * 10 ** 6,
+        'p50_ms': percentile(latencies_ms, 50),
+        'p99_ms': percentile(latencies_ms, 99),
+        'connections': connections_created
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    mock_exchange: MockExchange = MockExchange(listing_time=0,
+                                               latency_mean_ms=0,
+                                               latency_jitter_ms=0)
+    endpoint_url: str = await mock_exchange.start()
+    results: list[dict] = []
+
+    try:
+        for concurrency in arguments.concurrency:
+            for transport in arguments.transports:
+                results.append(await run_transport(transport=transport,
+                                                   concurrency=concurrency,
+                                                   requests_count=arguments.requests,
+                                                   endpoint_url=endpoint_url))
+
+    finally:
+        await mock_exchange.stop()
+
+    print(f'{"transport":<9} {"conc":>4} {"requests":>8} {"errors":>6} {"wall us/req":>11} {"cpu us/req":>10} '
+          f'{"p50 ms":>7} {"p99 ms":>7} {"conns":>5}')
+
+    for result in results:
+        print(f'{result["transport"]:<9} {result["concurrency"]:>4} {result["requests"]:>8} {result["errors"]:>6} '
+              f'{result["wall_us"]:>11.1f} {result["cpu_us"]:>10.1f} '
+              f'{result["p50_ms"]:>7.2f} {result["p99_ms"]:>7.2f} {result["connections"]:>5}')
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Compares per-request overhead of the HTTP transports against a local zero-latency mock exchange. '
+                    'CPU time includes the in-process mock server, which is the same for every transport')
+    parser.add_argument('--transports', nargs='+', default=list(TRANSPORTS), choices=list(TRANSPORTS))
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 10])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--verbose', action='store_true')
+    parsed_arguments: argparse.Namespace = parser.parse_args()
+
+    if not parsed_arguments.verbose:
+        logger.remove()
+        logger.add(stderr, level='CRITICAL')
+
+    asyncio.run(main(arguments=parsed_arguments))
@@ -1,2 +0,0 @@
-from core.kucoin_auto_sell import kucoin_auto_sell
-from core.bybit_auto_sell import bybit_auto_sell
\ No newline at end of file
@@ -0,0 +1,271 @@
+import asyncio
+import os
+from contextlib import AsyncExitStack
+
+from core.bybit_auto_sell import ByBitAutoSell
+from core.kucoin_auto_sell import KuCoinAutoSell
+from utils import EgressPool
+from utils import ExchangeContext
+from utils import LatencyRecorder
+from utils import logger
+from utils import parse_timestamp
+from utils import RepricePolicy
+from utils import RetryPolicy
+from utils import run_event_loop
+
+DEFAULT_ENDPOINT_URLS: dict[str, str] = {
+    'kucoin': 'https://api.kucoin.com',
+    'bybit': 'https://api.bybit.com'
+}
+
+
+class JobRunner:
+    def __init__(self,
+                 jobs: list[dict],
+                 threads: int,
+                 requests_count: int,
+                 proxy_str: str | None,
+                 time_sync_samples: int = 10,
+                 keep_alive_interval: float = 15,
+                 retry_policy: RetryPolicy | None = None,
+                 batch_orders_count: int = 0,
+                 price_ladder_step: float = 0,
+                 latency_report_path: str | None = None,
+                 proxies: list[str] | None = None,
+                 symbols_cache_dir: str | None = None,
+                 symbols_cache_ttl: float = 3600,
+                 hedge_count: int = 1,
+                 order_rate_limit: int = 0,
+                 order_rate_limit_window: float = 1,
+                 endpoint_urls: dict[str, list[str]] | None = None,
+                 endpoint_spread_count: int = 1,
+                 reprice_policy: RepricePolicy | None = None,
+                 listing_stream: bool = False,
+                 listing_stream_window: float = 0.2,
+                 order_websocket: bool = False,
+                 rehearse: bool = False,
+                 http_transport: str = 'aiohttp',
+                 http_timeout: float = 10):
+        self.threads: int = threads
+        self.requests_count: int = requests_count
+        self.proxy_str: str | None = proxy_str
+        self.time_sync_samples: int = time_sync_samples
+        self.keep_alive_interval: float = keep_alive_interval
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.batch_orders_count: int = batch_orders_count
+        self.price_ladder_step: float = price_ladder_step
+        self.latency_report_path: str | None = latency_report_path
+        self.proxies: list[str] | None = proxies
+        self.symbols_cache_dir: str | None = symbols_cache_dir
+        self.symbols_cache_ttl: float = symbols_cache_ttl
+        self.hedge_count: int = hedge_count
+        self.order_rate_limit: int = order_rate_limit
+        self.order_rate_limit_window: float = order_rate_limit_window
+        self.endpoint_urls: dict[str, list[str]] = endpoint_urls or {}
+        self.endpoint_spread_count: int = endpoint_spread_count
+        self.reprice_policy: RepricePolicy = reprice_policy or RepricePolicy()
+        self.listing_stream: bool = listing_stream
+        self.listing_stream_window: float = listing_stream_window
+        self.order_websocket: bool = order_websocket
+        self.rehearse: bool = rehearse
+        self.http_transport: str = http_transport
+        self.http_timeout: float = http_timeout
+        self.jobs: list[tuple[str, KuCoinAutoSell | ByBitAutoSell]] = []
+
+        for job_index, current_job in enumerate(jobs, start=1):
+            job_name: str = current_job.get('name') or f'{job_index}. {current_job.get("exchange")} ' \
+                                                       f'{current_job.get("token_from", "").upper()}/' \
+                                                       f'{current_job.get("token_to", "").upper()}'
+
+            try:
+                self.jobs.append((job_name, self.make_auto_sell(job_index=job_index,
+                                                                current_job=current_job)))
+
+            except (KeyError, ValueError) as error:
+                logger.error(f'Invalid Job {job_name}: {error}')
+
+    def make_latency_report_path(self,
+                                 job_index: int) -> str | None:
+        if not self.latency_report_path:
+            return None
+
+        path_root, path_extension = os.path.splitext(self.latency_report_path)
+
+        return f'{path_root}_{job_index}{path_extension}'
+
+    def make_auto_sell(self,
+                       job_index: int,
+                       current_job: dict) -> KuCoinAutoSell | ByBitAutoSell:
+        exchange: str = current_job['exchange'].lower()
+
+        if exchange not in DEFAULT_ENDPOINT_URLS:
+            raise ValueError(f'Unknown Exchange: {exchange}')
+
+        auto_sell_kwargs: dict = {
+            'api_key': current_job['api_key'],
+            'api_secret': current_job['api_secret'],
+            'token_from': current_job['token_from'].lower(),
+            'token_to': current_job['token_to'].lower(),
+            'start_sale_time': None if self.rehearse else parse_timestamp(value=current_job['start_sale_time']),
+            'sale_price': float(current_job['sale_price']),
+            'threads': int(current_job.get('threads', self.threads)),
+            'requests_count': int(current_job.get('requests_count', self.requests_count)),
+            'endpoint_url': current_job.get('endpoint_url') or DEFAULT_ENDPOINT_URLS[exchange],
+            'proxy_str': current_job.get('proxy', self.proxy_str) or None,
+            'time_sync_samples': self.time_sync_samples,
+            'keep_alive_interval': self.keep_alive_interval,
+            'retry_policy': self.retry_policy,
+            'batch_orders_count': int(current_job.get('batch_orders_count', self.batch_orders_count)),
+            'price_ladder_step': float(current_job.get('price_ladder_step', self.price_ladder_step)),
+            'latency_report_path': self.make_latency_report_path(job_index=job_index),
+            'proxies': current_job.get('proxies', self.proxies) or None,
+            'symbols_cache_dir': self.symbols_cache_dir,
+            'symbols_cache_ttl': self.symbols_cache_ttl,
+            'hedge_count': int(current_job.get('hedge_count', self.hedge_count)),
+            'order_rate_limit': int(current_job.get('order_rate_limit', self.order_rate_limit)),
+            'order_rate_limit_window': float(current_job.get('order_rate_limit_window', self.order_rate_limit_window)),
+            'endpoint_urls': current_job.get('endpoint_urls') or (None if current_job.get('endpoint_url')
+                                                                  else self.endpoint_urls.get(exchange)),
+            'endpoint_spread_count': int(current_job.get('endpoint_spread_count', self.endpoint_spread_count)),
+            'reprice_policy': self.reprice_policy,
+            'listing_stream': bool(current_job.get('listing_stream', self.listing_stream)),
+            'listing_stream_window': self.listing_stream_window,
+            'rehearse': self.rehearse,
+            'http_transport': self.http_transport,
+            'http_timeout': self.http_timeout
+        }
+
+        if exchange == 'kucoin':
+            return KuCoinAutoSell(api_pass_phrase=current_job['api_pass_phrase'],
+                                  **auto_sell_kwargs)
+
+        return ByBitAutoSell(order_websocket=bool(current_job.get('order_websocket', self.order_websocket)),
+                             **auto_sell_kwargs)
+
+    @staticmethod
+    def get_context_key(auto_sell: KuCoinAutoSell | ByBitAutoSell) -> tuple:
+        return type(auto_sell).__name__, tuple(auto_sell.endpoint_urls), tuple(auto_sell.proxies)
+
+    @staticmethod
+    def job_summary(job_name: str,
+                    auto_sell: KuCoinAutoSell | ByBitAutoSell,
+                    result: BaseException | None) -> str:
+        if isinstance(result, BaseException):
+            return f'{job_name}: Failed - {result}'
+
+        if not auto_sell.burst_tracker:
+            return f'{job_name}: Not Started'
+
+        latency_recorder: LatencyRecorder = auto_sell.latency_recorder
+        job_summary: str = f'{job_name}: {auto_sell.burst_tracker.summary()}'
+
+        if latency_recorder.first_accepted_wall is not None:
+            first_accepted_ms: float = latency_recorder.first_accepted_wall * 1000 + latency_recorder.clock_offset_ms \
+                - auto_sell.start_sale_time * 1000
+            job_summary += f', First Accepted: {first_accepted_ms:.1f} ms'
+
+        if auto_sell.fill_monitor:
+            job_summary += f', {auto_sell.fill_monitor.summary()}'
+
+        return job_summary
+
+    @staticmethod
+    async def run_job(job_name: str,
+                      auto_sell: KuCoinAutoSell | ByBitAutoSell,
+                      exchange_context: ExchangeContext) -> None:
+        with logger.contextualize(job=job_name):
+            await auto_sell.main_work(exchange_context=exchange_context)
+
+    async def main_work(self) -> None:
+        if not self.jobs:
+            logger.error('No Valid Jobs Found')
+            return
+
+        async with AsyncExitStack() as exit_stack:
+            exchange_contexts: dict[tuple, ExchangeContext] = {}
+
+            for _, auto_sell in self.jobs:
+                context_key: tuple = self.get_context_key(auto_sell=auto_sell)
+
+                if context_key in exchange_contexts:
+                    continue
+
+                egress_pool: EgressPool = await exit_stack.enter_async_context(EgressPool(
+                    proxies=auto_sell.proxies,
+                    connections_count=sum(current_auto_sell.threads for _, current_auto_sell in self.jobs
+                                          if self.get_context_key(auto_sell=current_auto_sell) == context_key),
+                    latency_recorder=auto_sell.latency_recorder,
+                    transport=self.http_transport,
+                    request_timeout=self.http_timeout))
+                exchange_contexts[context_key] = ExchangeContext(egress_pool=egress_pool)
+
+            logger.info(f'Jobs: {len(self.jobs)}, Shared Exchange Contexts: {len(exchange_contexts)}')
+
+            results: list = await asyncio.gather(*[
+                self.run_job(job_name=job_name,
+                             auto_sell=auto_sell,
+                             exchange_context=exchange_contexts[self.get_context_key(auto_sell=auto_sell)])
+                for job_name, auto_sell in self.jobs
+            ], return_exceptions=True)
+
+            for exchange_context in exchange_contexts.values():
+                await exchange_context.close()
+
+        logger.info('Jobs Report:\n' + '\n'.join(self.job_summary(job_name=job_name,
+                                                                  auto_sell=auto_sell,
+                                                                  result=result)
+                                                 for (job_name, auto_sell), result in zip(self.jobs, results)))
+
+
+def job_runner(jobs: list[dict],
+               threads: int,
+               requests_count: int,
+               proxy_str: str | None,
+               time_sync_samples: int = 10,
+               keep_alive_interval: float = 15,
+               retry_policy: RetryPolicy | None = None,
+               batch_orders_count: int = 0,
+               price_ladder_step: float = 0,
+               latency_report_path: str | None = None,
+               proxies: list[str] | None = None,
+               symbols_cache_dir: str | None = None,
+               symbols_cache_ttl: float = 3600,
+               hedge_count: int = 1,
+               order_rate_limit: int = 0,
+               order_rate_limit_window: float = 1,
+               endpoint_urls: dict[str, list[str]] | None = None,
+               endpoint_spread_count: int = 1,
+               reprice_policy: RepricePolicy | None = None,
+               listing_stream: bool = False,
+               listing_stream_window: float = 0.2,
+               order_websocket: bool = False,
+               rehearse: bool = False,
+               http_transport: str = 'aiohttp',
+               http_timeout: float = 10,
+               use_uvloop: bool = False) -> None:
+    run_event_loop(main_coroutine=JobRunner(jobs=jobs,
+                                            threads=threads,
+                                            requests_count=requests_count,
+                                            proxy_str=proxy_str,
+                                            time_sync_samples=time_sync_samples,
+                                            keep_alive_interval=keep_alive_interval,
+                                            retry_policy=retry_policy,
+                                            batch_orders_count=batch_orders_count,
+                                            price_ladder_step=price_ladder_step,
+                                            latency_report_path=latency_report_path,
+                                            proxies=proxies,
+                                            symbols_cache_dir=symbols_cache_dir,
+                                            symbols_cache_ttl=symbols_cache_ttl,
+                                            hedge_count=hedge_count,
+                                            order_rate_limit=order_rate_limit,
+                                            order_rate_limit_window=order_rate_limit_window,
+                                            endpoint_urls=endpoint_urls,
+                                            endpoint_spread_count=endpoint_spread_count,
+                                            reprice_policy=reprice_policy,
+                                            listing_stream=listing_stream,
+                                            listing_stream_window=listing_stream_window,
+                                            order_websocket=order_websocket,
+                                            rehearse=rehearse,
+                                            http_transport=http_transport,
+                                            http_timeout=http_timeout).main_work(),
+                   use_uvloop=use_uvloop)
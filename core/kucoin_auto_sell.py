@@ -3,47 +3,146 @@ import base64
 import hashlib
 import hmac
 import math
-from json import dumps, loads
-from time import time
+import os
+from decimal import Decimal
+from functools import partial
+from json import dumps
+from time import monotonic, time
 from uuid import uuid4
 
 import aiohttp
-from aiohttp_proxy import ProxyConnector
 
-from exceptions import InvalidRequestIp
-from utils import bypass_kucoin_errors
+from core.shard_runner import ShardRunner
+from exceptions import DuplicateOrder, ExchangeError, InsufficientBalance, InvalidCredentials, InvalidSymbol
+from utils import BurstTracker
+from utils import build_order_ladder
+from utils import LatencyRecorder
+from utils import bypass_kucoin_errors, classify_kucoin_order_error
+from utils import Classification, RATE_LIMITED, RETRYABLE, TERMINAL
+from utils import ClockOffset, measure_clock_offset, rehearsal_start_time, sleep_until
+from utils import convert_json, decode_json, encode_json
+from utils import Egress, EgressPool
+from utils import EndpointPool
+from utils import flush_repeated_messages
+from utils import ExchangeContext
+from utils import FillMonitor, OrderState, RepricePolicy
+from utils import KucoinBalance, KucoinServerTime, KucoinSymbol
 from utils import logger
+from utils import OrderAck
+from utils import PreparedRequest
+from utils import RateLimiter
+from utils import receive_stream, wait_for_listing
+from utils import retry_unlisted_symbol, RetryPolicy
+from utils import run_event_loop
+from utils import send_hedged
+from utils import ShardSignal
+from utils import SymbolCache, SymbolInfo
 
 
 class KuCoinAutoSell:
+    SERVER_TIME_PATH: str = '/api/v1/timestamp'
+    ORDER_UPDATES_TOPIC: str = '/spotMarket/tradeOrders'
+    REHEARSAL_ORDER_PATH: str = '/api/v1/orders/test'
+    SYMBOLS_CACHE_NAME: str = 'kucoin.json'
+    ENDPOINT_PROBE_SAMPLES: int = 3
+    LISTING_RETRY_SECONDS: float = 5
+    BATCH_ORDERS_LIMIT: int = 5
+    ACTIVE_ORDERS_PAGE_SIZE: int = 500
+
     def __init__(self,
                  api_key: str,
                  api_secret: str,
                  api_pass_phrase: str,
                  token_from: str,
                  token_to: str,
-                 start_sale_time: int,
+                 start_sale_time: int | None,
                  sale_price: float,
                  threads: int,
                  requests_count: int,
                  endpoint_url: str,
-                 proxy_str: str | None):
+                 proxy_str: str | None,
+                 time_sync_samples: int = 10,
+                 keep_alive_interval: float = 15,
+                 retry_policy: RetryPolicy | None = None,
+                 batch_orders_count: int = 0,
+                 price_ladder_step: float = 0,
+                 latency_report_path: str | None = None,
+                 proxies: list[str] | None = None,
+                 symbols_cache_dir: str | None = None,
+                 symbols_cache_ttl: float = 3600,
+                 hedge_count: int = 1,
+                 order_rate_limit: int = 0,
+                 order_rate_limit_window: float = 1,
+                 endpoint_urls: list[str] | None = None,
+                 endpoint_spread_count: int = 1,
+                 reprice_policy: RepricePolicy | None = None,
+                 listing_stream: bool = False,
+                 listing_stream_window: float = 0.2,
+                 rehearse: bool = False,
+                 http_transport: str = 'aiohttp',
+                 http_timeout: float = 10,
+                 shard_index: int = 0,
+                 shards_count: int = 1):
         self.api_key: str = api_key
         self.api_secret: str = api_secret
         self.api_pass_phrase: str = api_pass_phrase
         self.token_from: str = token_from
         self.token_to: str = token_to
-        self.start_sale_time: int = start_sale_time
+        self.start_sale_time: int | None = start_sale_time
         self.sale_price: float = sale_price
         self.threads: int = threads
         self.requests_count: int = requests_count
         self.endpoint_url: str = endpoint_url
         self.proxy_str: str | None = proxy_str
+        self.proxies: list[str | None] = proxies or [proxy_str]
+        self.time_sync_samples: int = time_sync_samples
+        self.keep_alive_interval: float = keep_alive_interval
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.batch_orders_count: int = batch_orders_count
+        self.price_ladder_step: float = price_ladder_step
+        self.latency_report_path: str | None = latency_report_path
+        self.symbols_cache_dir: str | None = symbols_cache_dir
+        self.symbols_cache_ttl: float = symbols_cache_ttl
+        self.hedge_count: int = hedge_count
+        self.order_rate_limit: int = order_rate_limit
+        self.order_rate_limit_window: float = order_rate_limit_window
+        self.endpoint_urls: list[str] = endpoint_urls or [endpoint_url]
+        self.endpoint_spread_count: int = endpoint_spread_count
+        self.reprice_policy: RepricePolicy = reprice_policy or RepricePolicy()
+        self.listing_stream: bool = listing_stream
+        self.listing_stream_window: float = listing_stream_window
+        self.rehearse: bool = rehearse
+        self.http_transport: str = http_transport
+        self.http_timeout: float = http_timeout
+        self.shard_index: int = shard_index
+        self.shards_count: int = shards_count
+        self.latency_recorder: LatencyRecorder = LatencyRecorder()
+        self.rate_limiter: RateLimiter = RateLimiter()
+        self.burst_tracker: BurstTracker | None = None
+        self.fill_monitor: FillMonitor | None = None
+        self.endpoint_pool: EndpointPool | None = None
+
+        self.hmac_base = hmac.new(self.api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        self.static_headers: dict = {
+            "KC-API-KEY": self.api_key,
+            "KC-API-PASSPHRASE": self.sign(payload=self.api_pass_phrase.encode('utf-8')),
+            "KC-API-KEY-VERSION": "2",
+            "Content-Type": "application/json"
+        }
 
-    async def make_auth(self,
-                        request_url: str,
-                        request_type: str,
-                        request_data: dict | None = None) -> dict:
+    def sign(self,
+             payload: bytes,
+             prefix: bytes = b'') -> str:
+        current_hmac = self.hmac_base.copy()
+        current_hmac.update(prefix)
+        current_hmac.update(payload)
+
+        return base64.b64encode(current_hmac.digest()).decode()
+
+    def make_auth(self,
+                  request_url: str,
+                  request_type: str,
+                  request_data: dict | None = None) -> dict:
         request_type: str = request_type.upper()
         current_timestamp: int = int(time() * 1000)
         str_to_sign: str = str(current_timestamp) + request_type + request_url
@@ -51,153 +150,875 @@ class KuCoinAutoSell:
         if request_data:
             str_to_sign += dumps(request_data)
 
-        signature: bytes = base64.b64encode(
-            hmac.new(self.api_secret.encode('utf-8'), str_to_sign.encode('utf-8'), hashlib.sha256).digest())
-        passphrase: bytes = base64.b64encode(
-            hmac.new(self.api_secret.encode('utf-8'), self.api_pass_phrase.encode('utf-8'), hashlib.sha256).digest())
-
         headers: dict = {
-            "KC-API-SIGN": signature.decode(),
-            "KC-API-TIMESTAMP": str(current_timestamp),
-            "KC-API-KEY": self.api_key,
-            "KC-API-PASSPHRASE": passphrase.decode(),
-            "KC-API-KEY-VERSION": "2",
-            "Content-Type": "application/json"
+            **self.static_headers,
+            "KC-API-SIGN": self.sign(payload=str_to_sign.encode('utf-8')),
+            "KC-API-TIMESTAMP": str(current_timestamp)
         }
 
         return headers
 
-    async def bypass_invalid_request_ip(self,
-                                        target_function,
-                                        session: aiohttp.client.ClientSession,
-                                        request_url: str,
-                                        request_type: str,
-                                        request_data: dict | None = None) -> dict:
-        try:
-            current_headers: dict = await self.make_auth(request_url=request_url,
-                                                         request_type=request_type,
-                                                         request_data=request_data)
-            session.headers.update(current_headers)
+    def prepare_sell_requests(self,
+                              token_from_balance: float,
+                              base_increment: float,
+                              price_increment: float) -> list[PreparedRequest]:
+        if self.batch_orders_count > 1:
+            return self.prepare_batch_sell_requests(token_from_balance=token_from_balance,
+                                                    base_increment=base_increment,
+                                                    price_increment=price_increment)
+
+        prepared_requests: list[PreparedRequest] = []
+
+        for _ in range(self.requests_count):
+            client_oid: str = str(uuid4())
+            body: bytes = encode_json({
+                'side': 'sell',
+                'symbol': f'{self.token_from.upper()}-{self.token_to.upper()}',
+                'type': 'limit',
+                'size': f'{token_from_balance:.9f}',
+                'clientOid': client_oid,
+                'price': str(self.sale_price)
+            })
+
+            prepared_requests.append(PreparedRequest(request_url='/api/v1/orders',
+                                                     body=body,
+                                                     headers=self.static_headers,
+                                                     sign_payload=b'POST/api/v1/orders' + body,
+                                                     order_quantities={client_oid: token_from_balance}))
+
+        return prepared_requests
+
+    def prepare_batch_sell_requests(self,
+                                    token_from_balance: float,
+                                    base_increment: float,
+                                    price_increment: float) -> list[PreparedRequest]:
+        order_ladder: list[tuple[str, str]] = build_order_ladder(total_quantity=token_from_balance,
+                                                                 orders_count=self.batch_orders_count,
+                                                                 sale_price=self.sale_price,
+                                                                 price_step=self.price_ladder_step,
+                                                                 base_increment=base_increment,
+                                                                 price_increment=price_increment)
+        ladder_chunks: list[list[tuple[str, str]]] = [
+            order_ladder[chunk_start:chunk_start + self.BATCH_ORDERS_LIMIT]
+            for chunk_start in range(0, len(order_ladder), self.BATCH_ORDERS_LIMIT)
+        ]
+        ladder_chunks: list[list[tuple[str, str]]] = ladder_chunks[self.shard_index::self.shards_count] \
+            or [ladder_chunks[self.shard_index % len(ladder_chunks)]]
+        prepared_requests: list[PreparedRequest] = []
+
+        for request_index in range(max(self.requests_count, len(ladder_chunks))):
+            order_list: list[dict] = [
+                {
+                    'clientOid': str(uuid4()),
+                    'side': 'sell',
+                    'type': 'limit',
+                    'price': order_price,
+                    'size': order_size
+                }
+                for order_size, order_price in ladder_chunks[request_index % len(ladder_chunks)]
+            ]
+            body: bytes = encode_json({
+                'symbol': f'{self.token_from.upper()}-{self.token_to.upper()}',
+                'orderList': order_list
+            })
+
+            prepared_requests.append(PreparedRequest(request_url='/api/v1/orders/multi',
+                                                     body=body,
+                                                     headers=self.static_headers,
+                                                     sign_payload=b'POST/api/v1/orders/multi' + body,
+                                                     order_quantities={
+                                                         current_order['clientOid']: float(current_order['size'])
+                                                         for current_order in order_list
+                                                     }))
+
+        return prepared_requests
 
-            response_text: str = await bypass_kucoin_errors(current_function=target_function,
-                                                            url=f'{self.endpoint_url}{request_url}',
-                                                            json=request_data)
+    def prepare_rehearsal_request(self,
+                                  prepared_request: PreparedRequest) -> PreparedRequest:
+        order_json: dict = decode_json(prepared_request.body)
 
-            return loads(response_text)
+        if 'orderList' in order_json:
+            order_json: dict = {'symbol': order_json['symbol'],
+                                **order_json['orderList'][0]}
 
-        except InvalidRequestIp:
-            return await self.bypass_invalid_request_ip(session=session,
-                                                        target_function=target_function,
-                                                        request_url=request_url,
-                                                        request_type=request_type,
-                                                        request_data=request_data)
+        body: bytes = encode_json(order_json)
+
+        return PreparedRequest(request_url=self.REHEARSAL_ORDER_PATH,
+                               body=body,
+                               headers=prepared_request.headers,
+                               sign_payload=f'POST{self.REHEARSAL_ORDER_PATH}'.encode('utf-8') + body,
+                               order_quantities={order_json['clientOid']: float(order_json['size'])})
+
+    @staticmethod
+    def parse_order_results(response_json: dict,
+                            prepared_request: PreparedRequest) -> list[OrderAck]:
+        if 'orderId' in response_json['data']:
+            return [OrderAck(client_id=next(iter(prepared_request.order_quantities)),
+                             order_id=response_json['data']['orderId'])]
+
+        order_acks: list[OrderAck] = []
+
+        for current_order in response_json['data']['data']:
+            if current_order['status'] == 'success':
+                order_acks.append(OrderAck(client_id=current_order['clientOid'],
+                                           order_id=current_order['id']))
+
+            elif 'duplicate' in str(current_order['failMsg']).lower():
+                order_acks.append(OrderAck(client_id=current_order['clientOid']))
+
+            else:
+                order_acks.append(OrderAck(client_id=current_order['clientOid'],
+                                           error=str(current_order['failMsg'])))
+
+        return order_acks
+
+    def classify_order_ack(self,
+                           order_ack: OrderAck) -> Classification:
+        return retry_unlisted_symbol(classification=classify_kucoin_order_error(message=order_ack.error),
+                                     listing_deadline=self.listing_deadline)
+
+    def has_order_id(self,
+                     response_json: dict | None,
+                     prepared_request: PreparedRequest) -> bool:
+        return response_json is not None and any(
+            order_ack.order_id for order_ack in self.parse_order_results(response_json=response_json,
+                                                                         prepared_request=prepared_request))
+
+    def prepare_retry_request(self,
+                              prepared_request: PreparedRequest,
+                              client_ids: list[str]) -> PreparedRequest:
+        order_json: dict = decode_json(prepared_request.body)
+        order_list: list[dict] = [current_order for current_order in order_json['orderList']
+                                  if current_order['clientOid'] in client_ids]
+        body: bytes = encode_json({
+            'symbol': order_json['symbol'],
+            'orderList': order_list
+        })
+
+        return PreparedRequest(request_url=prepared_request.request_url,
+                               body=body,
+                               headers=prepared_request.headers,
+                               sign_payload=f'POST{prepared_request.request_url}'.encode('utf-8') + body,
+                               order_quantities={client_id: prepared_request.order_quantities[client_id]
+                                                 for client_id in client_ids})
+
+    def sign_prepared_request(self,
+                              prepared_request: PreparedRequest) -> dict:
+        current_timestamp: str = str(int(time() * 1000))
+
+        return {
+            **prepared_request.headers,
+            "KC-API-SIGN": self.sign(payload=prepared_request.sign_payload,
+                                     prefix=current_timestamp.encode('utf-8')),
+            "KC-API-TIMESTAMP": current_timestamp
+        }
+
+    async def send_signed_request(self,
+                                  egress_pool: EgressPool,
+                                  request_url: str,
+                                  request_type: str,
+                                  request_data: dict | None = None) -> dict:
+        return await bypass_kucoin_errors(
+            current_function=lambda **kwargs: egress_pool.request(
+                method=request_type,
+                rate_limiter=self.rate_limiter,
+                headers=self.make_auth(request_url=request_url,
+                                       request_type=request_type,
+                                       request_data=request_data),
+                **kwargs),
+            retry_policy=self.retry_policy,
+            request_kind=request_url,
+            latency_recorder=self.latency_recorder,
+            url=f'{self.endpoint_url}{request_url}',
+            json=request_data)
+
+    @property
+    def listing_deadline(self) -> float:
+        return self.start_sale_time + self.LISTING_RETRY_SECONDS
 
     async def get_target_coin_balance(self,
-                                      session: aiohttp.client.ClientSession) -> float | None:
-        account_balances: dict = await self.bypass_invalid_request_ip(target_function=session.get,
-                                                                      session=session,
-                                                                      request_url='/api/v1/accounts',
-                                                                      request_type='GET')
+                                      egress_pool: EgressPool) -> float | None:
+        account_balances: dict = await self.send_signed_request(egress_pool=egress_pool,
+                                                                request_url='/api/v1/accounts',
+                                                                request_type='GET')
 
-        for current_balance in account_balances['data']:
-            if current_balance['currency'].lower() == self.token_from and current_balance['type'] == 'trade':
-                return float(current_balance['balance'])
+        for current_balance in convert_json(obj=account_balances.get('data'),
+                                            target_type=list[KucoinBalance]):
+            if current_balance.currency.lower() == self.token_from and current_balance.type == 'trade':
+                return current_balance.balance
 
         return None
 
     @staticmethod
     async def worker(semaphore, current_task) -> None:
-        async with semaphore:
-            await current_task
+        try:
+            async with semaphore:
+                await current_task
+
+        except asyncio.CancelledError:
+            current_task.close()
+            raise
 
     async def run_tasks(self,
-                        session: aiohttp.client.ClientSession,
-                        token_from_balance: float) -> None:
+                        exchange_context: ExchangeContext,
+                        token_from_balance: float,
+                        base_increment: float,
+                        price_increment: float,
+                        shard_signal: ShardSignal | None = None) -> None:
+        egress_pool: EgressPool = exchange_context.egress_pool
         semaphore = asyncio.Semaphore(value=self.threads)
+        burst_tracker: BurstTracker = BurstTracker(target_quantity=token_from_balance,
+                                                   shard_signal=shard_signal)
+        self.burst_tracker: BurstTracker = burst_tracker
+        prepared_requests: list[PreparedRequest] = self.prepare_sell_requests(token_from_balance=token_from_balance,
+                                                                              base_increment=base_increment,
+                                                                              price_increment=price_increment)
+
+        if self.rehearse:
+            prepared_requests: list[PreparedRequest] = [
+                self.prepare_rehearsal_request(prepared_request=current_prepared_request)
+                for current_prepared_request in prepared_requests
+            ]
 
         tasks = [
             self.worker(semaphore=semaphore,
                         current_task=self.send_sell_request(
-                            session=session,
-                            token_from_balance=token_from_balance))
-            for _ in range(self.requests_count)
+                            egress_pool=egress_pool,
+                            prepared_request=current_prepared_request,
+                            burst_tracker=burst_tracker))
+            for current_prepared_request in prepared_requests
         ]
 
-        await self.wait_start_sale_time(session=session)
+        ready_summary: str = (f'{self.token_from.upper()}/{self.token_to.upper()}, '
+                              f'{token_from_balance} @ {self.sale_price}, '
+                              f'Requests: {len(prepared_requests)}, '
+                              f'Threads: {self.threads}'
+                              f'{", Rehearsal" if self.rehearse else ""}')
+        await self.wait_start_sale_time(exchange_context=exchange_context,
+                                        ready_summary=ready_summary)
 
-        await asyncio.gather(*tasks)
+        if self.order_rate_limit and prepared_requests:
+            self.rate_limiter.seed(endpoint=prepared_requests[0].request_url,
+                                   limit=self.order_rate_limit,
+                                   window_seconds=self.order_rate_limit_window)
 
-    async def send_sell_request(self,
-                                session: aiohttp.client.ClientSession,
-                                token_from_balance: float) -> None:
-        response_text: dict = await self.bypass_invalid_request_ip(session=session,
-                                                                   target_function=session.post,
-                                                                   request_url='/api/v1/orders',
-                                                                   request_type='POST',
-                                                                   request_data={
-                                                                       'side': 'sell',
-                                                                       'symbol': f'{self.token_from.upper()}-{self.token_to.upper()}',
-                                                                       'type': 'limit',
-                                                                       'size': f'{token_from_balance:.9f}',
-                                                                       'clientOid': str(uuid4()),
-                                                                       'price': str(self.sale_price)
-                                                                   })
-
-        logger.success(f'Order Id: {response_text["data"]["orderId"]}')
+        egress_pool.reset_connection_stats()
+        await burst_tracker.run(coroutines=tasks)
 
-    async def wait_start_sale_time(self,
-                                   session: aiohttp.client.ClientSession) -> None:
+        flush_repeated_messages()
+        logger.info(burst_tracker.summary())
+        logger.info(f'Latency Report:\n{self.latency_recorder.summary(start_sale_time=self.start_sale_time)}')
+
+        if self.rehearse:
+            rehearsal_summary: str = self.latency_recorder.rehearsal_summary(start_sale_time=self.start_sale_time,
+                                                                              threads=self.threads)
+            logger.info(f'Rehearsal Report:\n{rehearsal_summary}')
+
+        if self.latency_report_path:
+            self.latency_recorder.write_records(file_path=self.latency_report_path)
+
+        logger.info(f'Egress Report:\n{egress_pool.summary()}')
+
+        if len(self.endpoint_pool.endpoints) > 1:
+            logger.info(f'Endpoints:\n{self.endpoint_pool.summary()}')
+
+        logger.info(f'Rate Limits:\n{self.rate_limiter.summary() or "no rate limit headers received"}')
+
+    async def send_order_copy(self,
+                              egress_pool: EgressPool,
+                              egress: Egress | None,
+                              prepared_request: PreparedRequest,
+                              burst_tracker: BurstTracker,
+                              request_kind: str) -> dict | None:
+        try:
+            return await bypass_kucoin_errors(
+                current_function=lambda **kwargs: self.endpoint_pool.request(
+                    current_function=lambda **request_kwargs: egress_pool.request(
+                        method='POST',
+                        egress=egress,
+                        rate_limiter=self.rate_limiter,
+                        on_send=burst_tracker.record_sent,
+                        headers=self.sign_prepared_request(prepared_request=prepared_request),
+                        **request_kwargs),
+                    path=prepared_request.request_url,
+                    **kwargs),
+                retry_policy=self.retry_policy,
+                listing_deadline=self.listing_deadline,
+                request_kind=request_kind,
+                latency_recorder=self.latency_recorder,
+                data=prepared_request.body)
+
+        except DuplicateOrder:
+            return None
+
+    async def send_sell_request(self,
+                                egress_pool: EgressPool,
+                                prepared_request: PreparedRequest,
+                                burst_tracker: BurstTracker) -> None:
+        started: float = monotonic()
+        attempt: int = 0
+        accepted_count: int = 0
 
         while True:
-            response_text: dict = await bypass_kucoin_errors(current_function=session.get,
-                                                             url=f'{self.endpoint_url}/api/v1/timestamp')
-            if int(str(loads(response_text)['data'])[:10]) >= self.start_sale_time:
+            attempt += 1
+            egresses: list[Egress | None] = egress_pool.choose_many(count=self.hedge_count) if self.hedge_count > 1 \
+                else [None]
+
+            try:
+                hedge_index, response_json = await send_hedged(
+                    coroutines=[
+                        self.send_order_copy(egress_pool=egress_pool,
+                                             egress=egress,
+                                             prepared_request=prepared_request,
+                                             burst_tracker=burst_tracker,
+                                             request_kind='order' if copy_index == 0 else 'order_hedge')
+                        for copy_index, egress in enumerate(egresses)
+                    ],
+                    is_preferred=None if self.rehearse
+                    else lambda copy_response_json: self.has_order_id(response_json=copy_response_json,
+                                                                      prepared_request=prepared_request))
+
+            except InvalidCredentials as error:
+                logger.error(f'Order Rejected, Stopping Burst: {error}')
+                burst_tracker.record_rejected()
+                burst_tracker.stop()
                 return
 
-            logger.info(str(self.start_sale_time - int(str(loads(response_text)['data'])[:10])) + ' sec.')
+            except InsufficientBalance as error:
+                logger.error(f'Order Rejected: {error}')
+                burst_tracker.record_rejected()
+
+                if burst_tracker.is_committed:
+                    burst_tracker.stop()
 
-    async def get_token_base_increment(self,
-                                       session: aiohttp.client.ClientSession) -> float | None:
-        response_text: dict = await self.bypass_invalid_request_ip(target_function=session.get,
-                                                                   request_url='/api/v2/symbols',
-                                                                   session=session,
-                                                                   request_type='GET')
+                return
 
-        for current_token in response_text['data']:
-            if current_token['baseCurrency'].upper() == self.token_from.upper() \
-                    and current_token['quoteCurrency'].upper() == self.token_to.upper():
-                return float(current_token['baseIncrement'])
+            except ExchangeError as error:
+                logger.error(f'Order Rejected: {error}')
+                burst_tracker.record_rejected()
+                return
 
-        return None
+            if self.hedge_count > 1:
+                self.latency_recorder.record_hedge_win(hedge_index=hedge_index)
+
+            if self.rehearse:
+                self.latency_recorder.mark_accepted()
+                burst_tracker.record_accepted(order_id=None,
+                                              quantity=0)
+                return
+
+            if response_json is None:
+                order_acks: list[OrderAck] = [OrderAck(client_id=client_id)
+                                              for client_id in prepared_request.order_quantities]
+
+            else:
+                order_acks: list[OrderAck] = self.parse_order_results(response_json=response_json,
+                                                                      prepared_request=prepared_request)
+
+            retry_client_ids: list[str] = []
+            retry_error_kind: str = RETRYABLE
+
+            for order_ack in order_acks:
+                if order_ack.accepted:
+                    continue
+
+                classification: Classification = self.classify_order_ack(order_ack=order_ack)
+
+                if classification.error_kind == TERMINAL:
+                    logger.error(f'Order Rejected: {order_ack.client_id}: {order_ack.error}')
+
+                    if classification.exception_type is InvalidCredentials \
+                            or classification.exception_type is InsufficientBalance and burst_tracker.is_committed:
+                        burst_tracker.stop()
+
+                    continue
+
+                logger.error(f'Order Failed, Retrying: {order_ack.client_id}: {order_ack.error}')
+                retry_client_ids.append(order_ack.client_id)
+
+                if classification.error_kind == RATE_LIMITED:
+                    retry_error_kind: str = RATE_LIMITED
+
+            for order_ack in order_acks:
+                if not order_ack.accepted:
+                    continue
+
+                self.latency_recorder.mark_accepted()
+                accepted_count += 1
+
+                if order_ack.order_id:
+                    logger.success(f'Order Id: {order_ack.order_id}')
+
+                else:
+                    logger.success(f'Order Already Placed: {order_ack.client_id}')
+
+                burst_tracker.record_accepted(order_id=order_ack.order_id,
+                                              quantity=prepared_request.order_quantities[order_ack.client_id])
+
+            if not retry_client_ids:
+                break
+
+            delay: float = self.retry_policy.get_delay(attempt=attempt,
+                                                       error_kind=retry_error_kind)
+
+            if self.retry_policy.is_exhausted(attempt=attempt,
+                                              elapsed_seconds=monotonic() - started + delay):
+                logger.error(f'Order Retries Exhausted: {", ".join(retry_client_ids)}')
+                break
+
+            await asyncio.sleep(delay)
+            prepared_request: PreparedRequest = self.prepare_retry_request(prepared_request=prepared_request,
+                                                                           client_ids=retry_client_ids)
+
+        if not accepted_count:
+            burst_tracker.record_rejected()
+
+    @staticmethod
+    def parse_order_state(order_json: dict) -> OrderState:
+        return OrderState(order_id=order_json['id'],
+                          price=float(order_json['price']),
+                          quantity=float(order_json['size']),
+                          filled_quantity=float(order_json['dealSize']),
+                          active=bool(order_json['isActive']))
+
+    @staticmethod
+    def parse_order_update(update_json: dict) -> OrderState:
+        return OrderState(order_id=update_json['orderId'],
+                          price=float(update_json['price']),
+                          quantity=float(update_json['size']),
+                          filled_quantity=float(update_json['filledSize']),
+                          active=update_json['status'] != 'done')
 
-    async def main_work(self) -> None:
-        if self.proxy_str:
-            connector = ProxyConnector.from_url(self.proxy_str)
+    async def fetch_order_states(self,
+                                 egress_pool: EgressPool,
+                                 order_ids: list[str]) -> list[OrderState]:
+        if not order_ids:
+            return []
+
+        active_orders_json: dict = await self.send_signed_request(
+            egress_pool=egress_pool,
+            request_url=f'/api/v1/orders?status=active&symbol={self.token_from.upper()}-{self.token_to.upper()}'
+                        f'&pageSize={self.ACTIVE_ORDERS_PAGE_SIZE}',
+            request_type='GET')
+        order_states: dict[str, OrderState] = {
+            order_json['id']: self.parse_order_state(order_json=order_json)
+            for order_json in active_orders_json['data']['items']
+        }
+        responses_json: list[dict] = await asyncio.gather(*[
+            self.send_signed_request(egress_pool=egress_pool,
+                                     request_url=f'/api/v1/orders/{order_id}',
+                                     request_type='GET')
+            for order_id in order_ids if order_id not in order_states
+        ])
+
+        for response_json in responses_json:
+            order_state: OrderState = self.parse_order_state(order_json=response_json['data'])
+            order_states[order_state.order_id] = order_state
+
+        return [order_states[order_id] for order_id in order_ids]
+
+    async def get_stream_url(self,
+                             egress_pool: EgressPool,
+                             bullet_url: str) -> tuple[str, float]:
+        response_json: dict = await self.send_signed_request(egress_pool=egress_pool,
+                                                             request_url=bullet_url,
+                                                             request_type='POST')
+        instance_server: dict = response_json['data']['instanceServers'][0]
+
+        return f'{instance_server["endpoint"]}?token={response_json["data"]["token"]}&connectId={uuid4()}', \
+            instance_server['pingInterval'] / 1000
+
+    @staticmethod
+    async def subscribe_stream(websocket: aiohttp.ClientWebSocketResponse,
+                               topic: str,
+                               private_channel: bool) -> None:
+        await websocket.send_str(dumps({
+            'id': str(uuid4()),
+            'type': 'subscribe',
+            'topic': topic,
+            'privateChannel': private_channel,
+            'response': True
+        }))
+
+    async def watch_order_updates(self,
+                                  egress_pool: EgressPool,
+                                  on_update) -> None:
+        stream_url, ping_interval = await self.get_stream_url(egress_pool=egress_pool,
+                                                              bullet_url='/api/v1/bullet-private')
+
+        async with egress_pool.best().session.ws_connect(stream_url) as websocket:
+            await self.subscribe_stream(websocket=websocket,
+                                        topic=self.ORDER_UPDATES_TOPIC,
+                                        private_channel=True)
+
+            async for message_data in receive_stream(websocket=websocket,
+                                                     ping_interval=ping_interval,
+                                                     ping_message={'id': str(uuid4()), 'type': 'ping'}):
+                message_json: dict = decode_json(message_data)
+
+                if message_json.get('type') == 'error':
+                    raise ExchangeError(code=message_json.get('code'),
+                                        message=str(message_json.get('data')))
+
+                if message_json.get('topic') == self.ORDER_UPDATES_TOPIC \
+                        and message_json.get('subject') == 'orderChange':
+                    on_update(order_state=self.parse_order_update(update_json=message_json['data']))
+
+    async def watch_listing(self,
+                            egress_pool: EgressPool,
+                            not_before_ms: float) -> str:
+        symbol: str = f'{self.token_from.upper()}-{self.token_to.upper()}'
+        listing_topics: tuple[str, ...] = (f'/market/match:{symbol}', f'/market/ticker:{symbol}')
+        stream_url, ping_interval = await self.get_stream_url(egress_pool=egress_pool,
+                                                              bullet_url='/api/v1/bullet-public')
+
+        async with egress_pool.best().session.ws_connect(stream_url) as websocket:
+            for topic in listing_topics:
+                await self.subscribe_stream(websocket=websocket,
+                                            topic=topic,
+                                            private_channel=False)
+
+            logger.info(f'Listing Stream Subscribed: {", ".join(listing_topics)}')
+
+            async for message_data in receive_stream(websocket=websocket,
+                                                     ping_interval=ping_interval,
+                                                     ping_message={'id': str(uuid4()), 'type': 'ping'}):
+                message_json: dict = decode_json(message_data)
+
+                if message_json.get('type') == 'error':
+                    raise ExchangeError(code=message_json.get('code'),
+                                        message=str(message_json.get('data')))
+
+                if message_json.get('type') == 'message' and message_json.get('topic') in listing_topics \
+                        and time() * 1000 >= not_before_ms:
+                    return f'{message_json["topic"]} {message_json.get("subject")}'
+
+        raise ConnectionError('Listing Stream Closed')
+
+    async def fetch_best_bid(self,
+                             egress_pool: EgressPool) -> float | None:
+        response_json: dict = await self.send_signed_request(
+            egress_pool=egress_pool,
+            request_url=f'/api/v1/market/orderbook/level1?symbol={self.token_from.upper()}-{self.token_to.upper()}',
+            request_type='GET')
+
+        if not response_json.get('data') or not response_json['data'].get('bestBid'):
+            return None
+
+        return float(response_json['data']['bestBid'])
+
+    async def cancel_order(self,
+                           egress_pool: EgressPool,
+                           order_id: str) -> None:
+        await self.send_signed_request(egress_pool=egress_pool,
+                                       request_url=f'/api/v1/orders/{order_id}',
+                                       request_type='DELETE')
+
+    async def place_order(self,
+                          egress_pool: EgressPool,
+                          quantity: str,
+                          price: str) -> str:
+        response_json: dict = await self.send_signed_request(egress_pool=egress_pool,
+                                                             request_url='/api/v1/orders',
+                                                             request_type='POST',
+                                                             request_data={
+                                                                 'clientOid': str(uuid4()),
+                                                                 'side': 'sell',
+                                                                 'symbol': f'{self.token_from.upper()}-'
+                                                                           f'{self.token_to.upper()}',
+                                                                 'type': 'limit',
+                                                                 'size': quantity,
+                                                                 'price': price
+                                                             })
+
+        return response_json['data']['orderId']
+
+    async def monitor_fills(self,
+                            exchange_context: ExchangeContext,
+                            symbol_info: SymbolInfo) -> None:
+        if not self.reprice_policy.enabled or not self.burst_tracker or not self.burst_tracker.accepted_order_ids:
+            return
+
+        egress_pool: EgressPool = exchange_context.egress_pool
+        self.fill_monitor: FillMonitor = FillMonitor(reprice_policy=self.reprice_policy,
+                                                     symbol_info=symbol_info)
+
+        try:
+            await self.fill_monitor.run(
+                order_ids=self.burst_tracker.accepted_order_ids,
+                fetch_orders=lambda order_ids: self.fetch_order_states(egress_pool=egress_pool,
+                                                                       order_ids=order_ids),
+                watch_orders=lambda on_update: self.watch_order_updates(egress_pool=egress_pool,
+                                                                        on_update=on_update),
+                fetch_best_bid=lambda: self.fetch_best_bid(egress_pool=egress_pool),
+                cancel_order=lambda order_id: self.cancel_order(egress_pool=egress_pool,
+                                                                order_id=order_id),
+                place_order=lambda quantity, price: self.place_order(egress_pool=egress_pool,
+                                                                     quantity=quantity,
+                                                                     price=price))
+
+        except ExchangeError as error:
+            logger.error(f'Error When Monitoring Fills: {error}')
+
+    @staticmethod
+    def parse_server_time(response_json: dict) -> float:
+        return float(convert_json(obj=response_json,
+                                  target_type=KucoinServerTime).data)
+
+    async def select_endpoint(self,
+                              exchange_context: ExchangeContext) -> EndpointPool:
+        self.endpoint_pool: EndpointPool = await exchange_context.get_shared(
+            key='endpoint_pool',
+            factory=lambda: self.probe_endpoints(egress_pool=exchange_context.egress_pool))
+        self.endpoint_url: str = self.endpoint_pool.best().url
+
+        return self.endpoint_pool
+
+    async def probe_endpoints(self,
+                              egress_pool: EgressPool) -> EndpointPool:
+        endpoint_pool: EndpointPool = EndpointPool(endpoint_urls=self.endpoint_urls,
+                                                   spread_count=self.endpoint_spread_count)
+        await endpoint_pool.probe(measure_endpoint=lambda endpoint_url: measure_clock_offset(
+            current_function=lambda **kwargs: egress_pool.best().transport.request(method='GET',
+                                                                                   **kwargs),
+            url=f'{endpoint_url}{self.SERVER_TIME_PATH}',
+            parse_server_time=self.parse_server_time,
+            samples_count=self.ENDPOINT_PROBE_SAMPLES))
+
+        return endpoint_pool
+
+    async def get_clock_offset(self,
+                               exchange_context: ExchangeContext) -> ClockOffset:
+        clock_offset: ClockOffset | None = await exchange_context.get_shared(
+            key='clock_offset',
+            factory=lambda: measure_clock_offset(
+                current_function=lambda **kwargs: exchange_context.egress_pool.request(
+                    method='GET',
+                    egress=exchange_context.egress_pool.best(),
+                    rate_limiter=self.rate_limiter,
+                    **kwargs),
+                url=f'{self.endpoint_url}{self.SERVER_TIME_PATH}',
+                parse_server_time=self.parse_server_time,
+                samples_count=self.time_sync_samples,
+                latency_recorder=self.latency_recorder))
+
+        if not clock_offset:
+            logger.error('Error When Syncing Server Time, Using Local Clock')
+            clock_offset: ClockOffset = ClockOffset(offset_ms=0,
+                                                    latency_ms=0,
+                                                    jitter_ms=0,
+                                                    samples_count=0)
+
+        return clock_offset
+
+    async def wait_start_sale_time(self,
+                                   exchange_context: ExchangeContext,
+                                   ready_summary: str) -> None:
+        clock_offset: ClockOffset = await self.get_clock_offset(exchange_context=exchange_context)
+
+        if self.start_sale_time is None:
+            self.start_sale_time: int = rehearsal_start_time()
+
+        launch_time_ms: float = clock_offset.launch_time_ms(start_sale_time=self.start_sale_time)
+        self.latency_recorder.clock_offset_ms = clock_offset.offset_ms
+        self.rate_limiter.clock_offset_ms = clock_offset.offset_ms
+
+        logger.info(f'Clock Offset: {clock_offset.offset_ms:.1f} ms, '
+                    f'Latency: {clock_offset.latency_ms:.1f} ms, '
+                    f'Jitter: {clock_offset.jitter_ms:.1f} ms, '
+                    f'Samples: {clock_offset.samples_count}')
+        logger.info(f'Rate Limits:\n{self.rate_limiter.summary() or "no rate limit headers received"}')
+        logger.success(f'Ready: {ready_summary}, Launch In {max(launch_time_ms / 1000 - time(), 0):.3f} sec.')
+
+        keep_alive_task: asyncio.Task = asyncio.create_task(
+            exchange_context.egress_pool.keep_alive(urls=[f'{endpoint.url}{self.SERVER_TIME_PATH}'
+                                                          for endpoint in self.endpoint_pool.spread_endpoints],
+                                                    interval=self.keep_alive_interval,
+                                                    launch_time_ms=launch_time_ms))
+
+        if self.listing_stream and not self.rehearse:
+            listing_event: str | None = await wait_for_listing(
+                watch_listing=lambda not_before_ms: self.watch_listing(egress_pool=exchange_context.egress_pool,
+                                                                       not_before_ms=not_before_ms),
+                launch_time_ms=launch_time_ms,
+                window_seconds=self.listing_stream_window)
+
+            if listing_event:
+                logger.success(f'Listing Detected: {listing_event}, '
+                               f'{time() * 1000 + clock_offset.offset_ms - self.start_sale_time * 1000:+.1f} ms '
+                               f'From Start Sale Time')
 
         else:
-            connector = None
+            await sleep_until(target_time_ms=launch_time_ms)
+
+        keep_alive_task.cancel()
+
+    @staticmethod
+    def parse_symbol_info(symbol: KucoinSymbol) -> SymbolInfo:
+        return SymbolInfo(base=symbol.base_currency,
+                          quote=symbol.quote_currency,
+                          base_increment=symbol.base_increment,
+                          price_increment=symbol.price_increment,
+                          min_size=symbol.base_min_size,
+                          max_size=symbol.base_max_size)
+
+    @staticmethod
+    def parse_symbols(response_json: dict) -> list[SymbolInfo]:
+        return [KuCoinAutoSell.parse_symbol_info(symbol=current_symbol)
+                for current_symbol in convert_json(obj=response_json.get('data'),
+                                                   target_type=list[KucoinSymbol])]
+
+    async def fetch_symbols(self,
+                            egress_pool: EgressPool) -> list[SymbolInfo]:
+        response_json: dict = await self.send_signed_request(egress_pool=egress_pool,
+                                                             request_url='/api/v2/symbols',
+                                                             request_type='GET')
+
+        return self.parse_symbols(response_json=response_json)
+
+    async def fetch_symbol_info(self,
+                                egress_pool: EgressPool) -> SymbolInfo | None:
+        try:
+            response_json: dict = await self.send_signed_request(
+                egress_pool=egress_pool,
+                request_url=f'/api/v2/symbols/{self.token_from.upper()}-{self.token_to.upper()}',
+                request_type='GET')
+
+        except InvalidSymbol:
+            return None
+
+        if not response_json.get('data'):
+            return None
+
+        return self.parse_symbol_info(symbol=convert_json(obj=response_json['data'],
+                                                          target_type=KucoinSymbol))
+
+    async def get_symbol_info(self,
+                              exchange_context: ExchangeContext) -> SymbolInfo | None:
+        symbol_cache: SymbolCache = await exchange_context.get_shared(
+            key='symbol_cache',
+            factory=lambda: asyncio.to_thread(SymbolCache,
+                                              file_path=os.path.join(self.symbols_cache_dir, self.SYMBOLS_CACHE_NAME)
+                                              if self.symbols_cache_dir else None,
+                                              ttl_seconds=self.symbols_cache_ttl))
+
+        if not symbol_cache.is_fresh:
+            exchange_context.start_shared(
+                key='symbol_cache_refresh',
+                factory=lambda: symbol_cache.refresh(
+                    fetch_symbols=lambda: self.fetch_symbols(egress_pool=exchange_context.egress_pool)))
+
+        symbol_info: SymbolInfo | None = symbol_cache.get(base=self.token_from,
+                                                          quote=self.token_to)
+
+        if symbol_info:
+            return symbol_info
+
+        symbol_info: SymbolInfo | None = await self.fetch_symbol_info(egress_pool=exchange_context.egress_pool)
 
-        async with aiohttp.ClientSession(connector=connector) as session:
-            token_from_balance: float | None = await self.get_target_coin_balance(session=session)
+        if symbol_info:
+            symbol_cache.add(symbol_info=symbol_info)
 
-            if not token_from_balance:
+        return symbol_info
+
+    async def prepare_sale(self,
+                           exchange_context: ExchangeContext) -> tuple[float, SymbolInfo] | None:
+        egress_pool: EgressPool = exchange_context.egress_pool
+
+        try:
+            await self.select_endpoint(exchange_context=exchange_context)
+            token_from_balance: float | None = await self.get_target_coin_balance(egress_pool=egress_pool)
+
+            if not token_from_balance and not self.rehearse:
                 logger.error(f'Zero Token Balance: {self.token_from.upper()}')
-                return
+                return None
+
+            symbol_info: SymbolInfo | None = await self.get_symbol_info(exchange_context=exchange_context)
+
+        except ExchangeError as error:
+            logger.error(f'Error When Preparing Sale: {error}')
+            return None
+
+        if not symbol_info:
+            logger.error(f'Error When Getting Base Precision: {self.token_from.upper()}, Using 0.1')
+            symbol_info: SymbolInfo = SymbolInfo(base=self.token_from,
+                                                 quote=self.token_to,
+                                                 base_increment=0.1,
+                                                 price_increment=float(Decimal(1).scaleb(
+                                                     Decimal(str(self.sale_price)).as_tuple().exponent)),
+                                                 min_size=0,
+                                                 max_size=math.inf)
+
+        if not token_from_balance:
+            logger.warning(f'Zero Token Balance: {self.token_from.upper()}, Rehearsing With Minimum Order Size')
+            token_from_balance: float = max(symbol_info.min_size, symbol_info.base_increment)
+
+        token_base_precision: float = symbol_info.base_increment
+
+        token_from_balance: float = math.floor(
+            token_from_balance * 10 ** len(str(token_base_precision).split('.')[1])) / 10 ** len(
+            str(token_base_precision).split('.')[1])
 
-            token_base_precision: float = await self.get_token_base_increment(session=session)
+        logger.info(f'{self.token_from.upper()} - {token_from_balance}')
 
-            if not token_base_precision:
-                logger.error(f'Error When Getting Base Precision: {self.token_from.upper()}, Using 0.1')
-                token_base_precision: float = 0.1
+        if token_from_balance < symbol_info.min_size:
+            logger.error(f'Balance Below Minimum Order Size: {token_from_balance} < {symbol_info.min_size}')
 
-            token_from_balance: float = math.floor(
-                token_from_balance * 10 ** len(str(token_base_precision).split('.')[1])) / 10 ** len(
-                str(token_base_precision).split('.')[1])
+        return token_from_balance, symbol_info
 
-            logger.info(f'{self.token_from.upper()} - {token_from_balance}')
+    async def start_sale(self,
+                         exchange_context: ExchangeContext,
+                         token_from_balance: float,
+                         symbol_info: SymbolInfo,
+                         shard_signal: ShardSignal | None = None) -> None:
+        egress_pool: EgressPool = exchange_context.egress_pool
+        endpoint_pool: EndpointPool = await self.select_endpoint(exchange_context=exchange_context)
 
-            await self.run_tasks(session=session,
-                                 token_from_balance=token_from_balance)
+        warm_connections_count: int = await exchange_context.get_shared(
+            key='warm_connections',
+            factory=lambda: egress_pool.warm(urls=[f'{endpoint.url}{self.SERVER_TIME_PATH}'
+                                                   for endpoint in endpoint_pool.spread_endpoints]))
+        logger.info(f'Warm Connections: {warm_connections_count}/'
+                    f'{egress_pool.connections_count * len(egress_pool.egresses) * len(endpoint_pool.spread_endpoints)}')
+
+        await self.run_tasks(exchange_context=exchange_context,
+                             token_from_balance=token_from_balance,
+                             base_increment=symbol_info.base_increment,
+                             price_increment=symbol_info.price_increment,
+                             shard_signal=shard_signal)
+        await self.monitor_fills(exchange_context=exchange_context,
+                                 symbol_info=symbol_info)
+
+    async def run_sale(self,
+                       exchange_context: ExchangeContext) -> None:
+        sale_params: tuple[float, SymbolInfo] | None = await self.prepare_sale(exchange_context=exchange_context)
+
+        if not sale_params:
+            return
+
+        token_from_balance, symbol_info = sale_params
+        await self.start_sale(exchange_context=exchange_context,
+                              token_from_balance=token_from_balance,
+                              symbol_info=symbol_info)
+
+    async def main_work(self,
+                        exchange_context: ExchangeContext | None = None) -> None:
+        if exchange_context:
+            await self.run_sale(exchange_context=exchange_context)
+            return
+
+        async with EgressPool(proxies=self.proxies,
+                              connections_count=self.threads,
+                              latency_recorder=self.latency_recorder,
+                              transport=self.http_transport,
+                              request_timeout=self.http_timeout) as egress_pool:
+            exchange_context: ExchangeContext = ExchangeContext(egress_pool=egress_pool)
+
+            try:
+                await self.run_sale(exchange_context=exchange_context)
+
+            finally:
+                await exchange_context.close()
 
 
 def kucoin_auto_sell(api_key: str,
@@ -210,15 +1031,68 @@ def kucoin_auto_sell(api_key: str,
                      threads: int,
                      requests_count: int,
                      endpoint_url: str,
-                     proxy_str: str | None) -> None:
-    asyncio.run(KuCoinAutoSell(api_key=api_key,
-                               api_secret=api_secret,
-                               api_pass_phrase=api_pass_phrase,
-                               token_from=token_from,
-                               token_to=token_to,
-                               start_sale_time=start_sale_time,
-                               sale_price=sale_price,
-                               threads=threads,
-                               requests_count=requests_count,
-                               endpoint_url=endpoint_url,
-                               proxy_str=proxy_str).main_work())
+                     proxy_str: str | None,
+                     time_sync_samples: int = 10,
+                     keep_alive_interval: float = 15,
+                     retry_policy: RetryPolicy | None = None,
+                     batch_orders_count: int = 0,
+                     price_ladder_step: float = 0,
+                     latency_report_path: str | None = None,
+                     proxies: list[str] | None = None,
+                     symbols_cache_dir: str | None = None,
+                     symbols_cache_ttl: float = 3600,
+                     hedge_count: int = 1,
+                     order_rate_limit: int = 0,
+                     order_rate_limit_window: float = 1,
+                     endpoint_urls: list[str] | None = None,
+                     endpoint_spread_count: int = 1,
+                     reprice_policy: RepricePolicy | None = None,
+                     listing_stream: bool = False,
+                     listing_stream_window: float = 0.2,
+                     rehearse: bool = False,
+                     http_transport: str = 'aiohttp',
+                     http_timeout: float = 10,
+                     use_uvloop: bool = False,
+                     worker_processes: int = 1) -> None:
+    auto_sell_factory: partial = partial(KuCoinAutoSell,
+                                         api_key=api_key,
+                                         api_secret=api_secret,
+                                         api_pass_phrase=api_pass_phrase,
+                                         token_from=token_from,
+                                         token_to=token_to,
+                                         start_sale_time=None if rehearse else start_sale_time,
+                                         sale_price=sale_price,
+                                         threads=threads,
+                                         requests_count=requests_count,
+                                         endpoint_url=endpoint_url,
+                                         proxy_str=proxy_str,
+                                         time_sync_samples=time_sync_samples,
+                                         keep_alive_interval=keep_alive_interval,
+                                         retry_policy=retry_policy,
+                                         batch_orders_count=batch_orders_count,
+                                         price_ladder_step=price_ladder_step,
+                                         latency_report_path=latency_report_path,
+                                         proxies=proxies,
+                                         symbols_cache_dir=symbols_cache_dir,
+                                         symbols_cache_ttl=symbols_cache_ttl,
+                                         hedge_count=hedge_count,
+                                         order_rate_limit=order_rate_limit,
+                                         order_rate_limit_window=order_rate_limit_window,
+                                         endpoint_urls=endpoint_urls,
+                                         endpoint_spread_count=endpoint_spread_count,
+                                         reprice_policy=reprice_policy,
+                                         listing_stream=listing_stream,
+                                         listing_stream_window=listing_stream_window,
+                                         rehearse=rehearse,
+                                         http_transport=http_transport,
+                                         http_timeout=http_timeout)
+
+    if worker_processes > 1:
+        run_event_loop(main_coroutine=ShardRunner(auto_sell_factory=auto_sell_factory,
+                                                  worker_processes=worker_processes,
+                                                  use_uvloop=use_uvloop).main_work(),
+                       use_uvloop=use_uvloop)
+        return
+
+    run_event_loop(main_coroutine=auto_sell_factory().main_work(),
+                   use_uvloop=use_uvloop)
@@ -0,0 +1,214 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from time import time
+
+from utils import BurstTracker
+from utils import ClockOffset
+from utils import configure_logger
+from utils import EgressPool
+from utils import EndpointPool
+from utils import ExchangeContext
+from utils import LatencyRecorder
+from utils import logger
+from utils import logger_settings
+from utils import rehearsal_start_time
+from utils import run_event_loop
+from utils import ShardSignal
+from utils import SymbolInfo
+
+WORKER_SHARD_SIGNAL: ShardSignal | None = None
+
+
+def init_worker(shard_signal: ShardSignal,
+                worker_logger_settings: dict) -> None:
+    global WORKER_SHARD_SIGNAL
+    WORKER_SHARD_SIGNAL = shard_signal
+
+    configure_logger(**worker_logger_settings)
+
+
+def split_evenly(total: int,
+                 parts_count: int,
+                 part_index: int) -> int:
+    return total // parts_count + (part_index < total % parts_count)
+
+
+async def run_shard(auto_sell,
+                    token_from_balance: float,
+                    symbol_info: SymbolInfo,
+                    clock_offset: ClockOffset,
+                    endpoint_pool: EndpointPool) -> None:
+    async with EgressPool(proxies=auto_sell.proxies,
+                          connections_count=auto_sell.threads,
+                          latency_recorder=auto_sell.latency_recorder,
+                          transport=auto_sell.http_transport,
+                          request_timeout=auto_sell.http_timeout) as egress_pool:
+        exchange_context: ExchangeContext = ExchangeContext(egress_pool=egress_pool)
+        exchange_context.set_shared(key='clock_offset',
+                                    value=clock_offset)
+        exchange_context.set_shared(key='endpoint_pool',
+                                    value=endpoint_pool)
+
+        try:
+            await auto_sell.start_sale(exchange_context=exchange_context,
+                                       token_from_balance=token_from_balance,
+                                       symbol_info=symbol_info,
+                                       shard_signal=WORKER_SHARD_SIGNAL)
+
+        finally:
+            await exchange_context.close()
+
+
+def run_shard_process(auto_sell_factory: partial,
+                      shard_index: int,
+                      shards_count: int,
+                      threads: int,
+                      requests_count: int,
+                      order_rate_limit: int,
+                      token_from_balance: float,
+                      symbol_info: SymbolInfo,
+                      clock_offset: ClockOffset,
+                      endpoint_pool: EndpointPool,
+                      start_sale_time: int,
+                      use_uvloop: bool) -> tuple[dict | None, LatencyRecorder]:
+    auto_sell = auto_sell_factory(start_sale_time=start_sale_time,
+                                  threads=threads,
+                                  requests_count=requests_count,
+                                  order_rate_limit=order_rate_limit,
+                                  latency_report_path=None,
+                                  shard_index=shard_index,
+                                  shards_count=shards_count)
+
+    with logger.contextualize(shard=shard_index):
+        logger.info(f'Shard #{shard_index}: PID {os.getpid()}, Threads: {threads}, Requests: {requests_count}')
+        run_event_loop(main_coroutine=run_shard(auto_sell=auto_sell,
+                                                token_from_balance=token_from_balance,
+                                                symbol_info=symbol_info,
+                                                clock_offset=clock_offset,
+                                                endpoint_pool=endpoint_pool),
+                       use_uvloop=use_uvloop)
+
+    logger.complete()
+
+    return auto_sell.burst_tracker.to_dict() if auto_sell.burst_tracker else None, auto_sell.latency_recorder
+
+
+class ShardRunner:
+    def __init__(self,
+                 auto_sell_factory: partial,
+                 worker_processes: int,
+                 use_uvloop: bool = False):
+        self.auto_sell_factory: partial = auto_sell_factory
+        self.auto_sell = auto_sell_factory()
+        self.worker_processes: int = max(min(worker_processes, self.auto_sell.requests_count), 1)
+        self.use_uvloop: bool = use_uvloop
+
+    async def prepare_sale(self) -> tuple[float, SymbolInfo, ClockOffset, EndpointPool] | None:
+        async with EgressPool(proxies=self.auto_sell.proxies,
+                              connections_count=1,
+                              latency_recorder=self.auto_sell.latency_recorder,
+                              transport=self.auto_sell.http_transport,
+                              request_timeout=self.auto_sell.http_timeout) as egress_pool:
+            exchange_context: ExchangeContext = ExchangeContext(egress_pool=egress_pool)
+
+            try:
+                sale_params: tuple[float, SymbolInfo] | None = await self.auto_sell.prepare_sale(
+                    exchange_context=exchange_context)
+
+                if not sale_params:
+                    return None
+
+                clock_offset: ClockOffset = await self.auto_sell.get_clock_offset(exchange_context=exchange_context)
+
+            finally:
+                await exchange_context.close()
+
+        return *sale_params, clock_offset, self.auto_sell.endpoint_pool
+
+    async def main_work(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        mp_context = multiprocessing.get_context('spawn')
+        shard_signal: ShardSignal = ShardSignal(mp_context=mp_context)
+
+        with ProcessPoolExecutor(max_workers=self.worker_processes,
+                                 mp_context=mp_context,
+                                 initializer=init_worker,
+                                 initargs=(shard_signal, dict(logger_settings))) as executor:
+            worker_start_futures: list[asyncio.Future] = [loop.run_in_executor(executor, os.getpid)
+                                                          for _ in range(self.worker_processes)]
+            sale_params: tuple[float, SymbolInfo, ClockOffset, EndpointPool] | None = await self.prepare_sale()
+            await asyncio.gather(*worker_start_futures)
+
+            if not sale_params:
+                return
+
+            token_from_balance, symbol_info, clock_offset, endpoint_pool = sale_params
+
+            if self.auto_sell.start_sale_time is None:
+                self.auto_sell.start_sale_time: int = rehearsal_start_time()
+
+            launch_in_seconds: float = clock_offset.launch_time_ms(start_sale_time=self.auto_sell.start_sale_time) \
+                / 1000 - time()
+            logger.info(f'Worker Processes: {self.worker_processes}, '
+                        f'Launch In {max(launch_in_seconds, 0):.3f} sec.')
+
+            results: list = await asyncio.gather(*[
+                loop.run_in_executor(executor, partial(
+                    run_shard_process,
+                    auto_sell_factory=self.auto_sell_factory,
+                    shard_index=shard_index,
+                    shards_count=self.worker_processes,
+                    threads=max(split_evenly(total=self.auto_sell.threads,
+                                             parts_count=self.worker_processes,
+                                             part_index=shard_index), 1),
+                    requests_count=split_evenly(total=self.auto_sell.requests_count,
+                                                parts_count=self.worker_processes,
+                                                part_index=shard_index),
+                    order_rate_limit=max(split_evenly(total=self.auto_sell.order_rate_limit,
+                                                      parts_count=self.worker_processes,
+                                                      part_index=shard_index), 1)
+                    if self.auto_sell.order_rate_limit else 0,
+                    token_from_balance=token_from_balance,
+                    symbol_info=symbol_info,
+                    clock_offset=clock_offset,
+                    endpoint_pool=endpoint_pool,
+                    start_sale_time=self.auto_sell.start_sale_time,
+                    use_uvloop=self.use_uvloop))
+                for shard_index in range(self.worker_processes)
+            ], return_exceptions=True)
+
+        burst_tracker: BurstTracker = BurstTracker(target_quantity=token_from_balance)
+        latency_recorder: LatencyRecorder = self.auto_sell.latency_recorder
+        shard_summaries: list[str] = []
+
+        for shard_index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                shard_summaries.append(f'Shard #{shard_index}: Failed - {result}')
+                continue
+
+            burst_dict, shard_latency_recorder = result
+            latency_recorder.merge(latency_recorder=shard_latency_recorder)
+
+            if not burst_dict:
+                shard_summaries.append(f'Shard #{shard_index}: Not Started')
+                continue
+
+            burst_tracker.merge(burst_dict=burst_dict)
+            shard_summaries.append(f'Shard #{shard_index}: Requests Sent: {burst_dict["sent"]}, '
+                                   f'Accepted: {burst_dict["accepted"]}, '
+                                   f'Committed: {burst_dict["committed_quantity"]}')
+
+        logger.info('Shards Report:\n' + '\n'.join(shard_summaries))
+        logger.info(burst_tracker.summary())
+        logger.info(f'Latency Report:\n{latency_recorder.summary(start_sale_time=self.auto_sell.start_sale_time)}')
+
+        if self.auto_sell.rehearse:
+            rehearsal_summary: str = latency_recorder.rehearsal_summary(start_sale_time=self.auto_sell.start_sale_time,
+                                                                         threads=self.auto_sell.threads)
+            logger.info(f'Rehearsal Report:\n{rehearsal_summary}')
+
+        if self.auto_sell.latency_report_path:
+            latency_recorder.write_records(file_path=self.auto_sell.latency_report_path)
@@ -1,2 +1,42 @@
-class InvalidRequestIp(BaseException):
-    pass
\ No newline at end of file
+class ExchangeError(Exception):
+    def __init__(self,
+                 code: str | int | None,
+                 message: str):
+        super().__init__(f'{code}: {message}')
+        self.code: str | int | None = code
+        self.message: str = message
+
+
+class InsufficientBalance(ExchangeError):
+    pass
+
+
+class InvalidSymbol(ExchangeError):
+    pass
+
+
+class InvalidCredentials(ExchangeError):
+    pass
+
+
+class DuplicateOrder(ExchangeError):
+    pass
+
+
+class OrderNotActive(ExchangeError):
+    pass
+
+
+class RetryBudgetExhausted(ExchangeError):
+    pass
+
+
+class InvalidResponse(ExchangeError):
+    pass
+
+
+class InvalidSettings(Exception):
+    def __init__(self,
+                 errors: list[str]):
+        super().__init__('\n'.join(errors))
+        self.errors: list[str] = errors
\ No newline at end of file
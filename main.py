@@ -1,36 +1,172 @@
-from json import load
+import argparse
+import os
+from sys import stdin
 
-from core import kucoin_auto_sell, bybit_auto_sell
+from exceptions import InvalidSettings
+from utils import configure_logger
+from utils import ENV_PREFIX, load_settings, validate_exchange_settings
+from utils import RepricePolicy
+from utils import RetryPolicy
 from utils import logger
 
+CEX_TYPES: dict[str, str] = {
+    '1': 'kucoin',
+    '2': 'bybit'
+}
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=f'Each option can also be set with the {ENV_PREFIX}<OPTION> environment variable, '
+                    f'any settings.json key - with {ENV_PREFIX}<KEY>')
+    parser.add_argument('--settings', default=os.environ.get(f'{ENV_PREFIX}SETTINGS', 'settings.json'))
+    parser.add_argument('--exchange', choices=list(CEX_TYPES.values()), default=os.environ.get(f'{ENV_PREFIX}EXCHANGE'))
+    parser.add_argument('--token-from', default=os.environ.get(f'{ENV_PREFIX}TOKEN_FROM'))
+    parser.add_argument('--token-to', default=os.environ.get(f'{ENV_PREFIX}TOKEN_TO'))
+    parser.add_argument('--sale-price', help='overrides sale_price')
+    parser.add_argument('--start-sale-time', help='overrides start_sale_time')
+    parser.add_argument('--rehearse', action='store_true', help='run the launch without placing orders')
+    parser.add_argument('--check', action='store_true', help='validate settings and exit')
+
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
     print('Donate (any evm) - 0xDEADf12DE9A24b47Da0a43E1bA70B8972F5296F2\n')
 
-    with open('settings.json', 'r', encoding='utf-8-sig') as file:
-        settings_json: dict = load(file)
+    arguments: argparse.Namespace = parse_arguments()
+
+    try:
+        settings: dict = load_settings(file_path=arguments.settings,
+                                       overrides={'sale_price': arguments.sale_price,
+                                                  'start_sale_time': arguments.start_sale_time},
+                                       exchange=arguments.exchange)
+
+    except InvalidSettings as error:
+        logger.error(f'Invalid Settings In {arguments.settings}:\n' + '\n'.join(error.errors))
+        raise SystemExit(2)
+
+    configure_logger(enqueue=settings['log_enqueue'],
+                     repeat_window=settings['log_repeat_window'],
+                     structured_log_path=settings['structured_log_path'])
+
+    API_KEY: str = settings['api_key']
+    API_SECRET: str = settings['api_secret']
+    API_PASS_PHRASE: str = settings['api_pass_phrase']
+    START_SALE_TIME: int = settings['start_sale_time']
+    SALE_PRICE: float = settings['sale_price']
+    THREADS: int = settings['threads']
+    REQUESTS_COUNT: int = settings['requests_count']
+    ENDPOINT_URL: str = settings['endpoint_url']
+    PROXY_STR: str | None = settings['proxy']
+    ENDPOINT_URLS: dict[str, list[str]] = settings['endpoint_urls']
+    ENDPOINT_SPREAD_COUNT: int = settings['endpoint_spread_count']
+    PROXIES: list[str] | None = settings['proxies'] or None
+    TIME_SYNC_SAMPLES: int = settings['time_sync_samples']
+    KEEP_ALIVE_INTERVAL: float = settings['keep_alive_interval']
+    RETRY_POLICY: RetryPolicy = RetryPolicy(max_attempts=settings['retry_max_attempts'],
+                                            max_seconds=settings['retry_max_seconds'],
+                                            backoff_base=settings['retry_backoff_base'],
+                                            backoff_max=settings['retry_backoff_max'],
+                                            rate_limit_backoff=settings['retry_rate_limit_backoff'],
+                                            jitter=settings['retry_jitter'])
+    REPRICE_POLICY: RepricePolicy = RepricePolicy(monitor_seconds=settings['fill_monitor_seconds'],
+                                                  schedule=settings['reprice_schedule'],
+                                                  interval=settings['reprice_interval'],
+                                                  price_step=settings['reprice_step'],
+                                                  min_price=settings['reprice_min_price'],
+                                                  poll_interval=settings['order_poll_interval'],
+                                                  use_websocket=settings['order_updates_websocket'])
+    LISTING_STREAM: bool = settings['listing_stream']
+    LISTING_STREAM_WINDOW: float = settings['listing_stream_window']
+    ORDER_WEBSOCKET: bool = settings['order_websocket']
+    HTTP_TRANSPORT: str = settings['http_transport']
+    HTTP_TIMEOUT: float = settings['http_timeout']
+    REHEARSE: bool = arguments.rehearse
+    BATCH_ORDERS_COUNT: int = settings['batch_orders_count']
+    PRICE_LADDER_STEP: float = settings['price_ladder_step']
+    LATENCY_REPORT_PATH: str | None = settings['latency_report_path']
+    SYMBOLS_CACHE_DIR: str | None = settings['symbols_cache_dir']
+    SYMBOLS_CACHE_TTL: float = settings['symbols_cache_ttl']
+    HEDGE_COUNT: int = settings['hedge_count']
+    ORDER_RATE_LIMIT: int = settings['order_rate_limit']
+    ORDER_RATE_LIMIT_WINDOW: float = settings['order_rate_limit_window']
+    USE_UVLOOP: bool = settings['use_uvloop']
+    WORKER_PROCESSES: int = settings['worker_processes']
+    JOBS: list[dict] = settings['jobs']
+
+    exchange: str | None = arguments.exchange
+    token_from: str | None = arguments.token_from
+    token_to: str | None = arguments.token_to
+    interactive: bool = not JOBS and not (exchange and token_from and token_to)
 
-    API_KEY: str = settings_json['api_key']
-    API_SECRET: str = settings_json['api_secret']
-    API_PASS_PHRASE: str = settings_json['api_pass_phrase']
-    START_SALE_TIME: int = int(str(settings_json['start_sale_time'])[:10])
-    SALE_PRICE: float = float(settings_json['sale_price'])
-    THREADS: int = int(settings_json['threads'])
-    REQUESTS_COUNT: int = int(settings_json['requests_count'])
-    ENDPOINT_URL: str = settings_json['endpoint_url']
-    PROXY_STR: str | None = settings_json['proxy']
+    if interactive and not arguments.check:
+        if not stdin.isatty():
+            logger.error('--exchange, --token-from and --token-to Are Required When Not Running In A Terminal')
+            raise SystemExit(2)
 
-    if not PROXY_STR:
-        PROXY_STR: None = None
+        exchange: str | None = exchange or CEX_TYPES.get(input('1. KuCoin\n'
+                                                               '2. ByBit\n'
+                                                               'Enter Your CEX Type: ').strip())
 
-    cex_type: int = int(input('1. KuCoin\n'
-                              '2. ByBit\n'
-                              'Enter Your CEX Type: '))
+        token_from: str = token_from or input('Enter Token From Name: ')
+        token_to: str = token_to or input('Enter Token To Name: ')
+        print('')
 
-    token_from: str = input('Enter Token From Name: ').lower()
-    token_to: str = input('Enter Token To Name: ').lower()
-    print('')
+    try:
+        if exchange or not (JOBS or arguments.check):
+            validate_exchange_settings(settings=settings,
+                                       exchange=exchange)
+
+    except InvalidSettings as error:
+        logger.error('\n'.join(error.errors))
+        raise SystemExit(2)
+
+    if arguments.check:
+        logger.success(f'Settings OK: {arguments.settings}, '
+                       + (f'{len(JOBS)} Jobs' if JOBS else f'{exchange or "exchange not set"}, '
+                                                           f'Start Sale Time: {START_SALE_TIME}'))
+        raise SystemExit(0)
+
+    token_from: str | None = token_from and token_from.lower()
+    token_to: str | None = token_to and token_to.lower()
+
+    if REHEARSE:
+        logger.warning('Rehearsal Mode: Orders Will Not Be Placed, Launch In A Few Seconds')
+
+    if JOBS:
+        from core.job_runner import job_runner
+
+        job_runner(jobs=JOBS,
+                   threads=THREADS,
+                   requests_count=REQUESTS_COUNT,
+                   proxy_str=PROXY_STR,
+                   time_sync_samples=TIME_SYNC_SAMPLES,
+                   keep_alive_interval=KEEP_ALIVE_INTERVAL,
+                   retry_policy=RETRY_POLICY,
+                   batch_orders_count=BATCH_ORDERS_COUNT,
+                   price_ladder_step=PRICE_LADDER_STEP,
+                   latency_report_path=LATENCY_REPORT_PATH,
+                   proxies=PROXIES,
+                   symbols_cache_dir=SYMBOLS_CACHE_DIR,
+                   symbols_cache_ttl=SYMBOLS_CACHE_TTL,
+                   hedge_count=HEDGE_COUNT,
+                   order_rate_limit=ORDER_RATE_LIMIT,
+                   order_rate_limit_window=ORDER_RATE_LIMIT_WINDOW,
+                   endpoint_urls=ENDPOINT_URLS,
+                   endpoint_spread_count=ENDPOINT_SPREAD_COUNT,
+                   reprice_policy=REPRICE_POLICY,
+                   listing_stream=LISTING_STREAM,
+                   listing_stream_window=LISTING_STREAM_WINDOW,
+                   order_websocket=ORDER_WEBSOCKET,
+                   rehearse=REHEARSE,
+                   http_transport=HTTP_TRANSPORT,
+                   http_timeout=HTTP_TIMEOUT,
+                   use_uvloop=USE_UVLOOP)
+
+    elif exchange == 'kucoin':
+        from core.kucoin_auto_sell import kucoin_auto_sell
 
-    if cex_type == 1:
         kucoin_auto_sell(api_key=API_KEY,
                          api_secret=API_SECRET,
                          api_pass_phrase=API_PASS_PHRASE,
@@ -41,9 +177,33 @@ if __name__ == '__main__':
                          threads=THREADS,
                          requests_count=REQUESTS_COUNT,
                          endpoint_url=ENDPOINT_URL,
-                         proxy_str=PROXY_STR)
+                         proxy_str=PROXY_STR,
+                         time_sync_samples=TIME_SYNC_SAMPLES,
+                         keep_alive_interval=KEEP_ALIVE_INTERVAL,
+                         retry_policy=RETRY_POLICY,
+                         batch_orders_count=BATCH_ORDERS_COUNT,
+                         price_ladder_step=PRICE_LADDER_STEP,
+                         latency_report_path=LATENCY_REPORT_PATH,
+                         proxies=PROXIES,
+                         symbols_cache_dir=SYMBOLS_CACHE_DIR,
+                         symbols_cache_ttl=SYMBOLS_CACHE_TTL,
+                         hedge_count=HEDGE_COUNT,
+                         order_rate_limit=ORDER_RATE_LIMIT,
+                         order_rate_limit_window=ORDER_RATE_LIMIT_WINDOW,
+                         endpoint_urls=ENDPOINT_URLS.get('kucoin'),
+                         endpoint_spread_count=ENDPOINT_SPREAD_COUNT,
+                         reprice_policy=REPRICE_POLICY,
+                         listing_stream=LISTING_STREAM,
+                         listing_stream_window=LISTING_STREAM_WINDOW,
+                         rehearse=REHEARSE,
+                         http_transport=HTTP_TRANSPORT,
+                         http_timeout=HTTP_TIMEOUT,
+                         use_uvloop=USE_UVLOOP,
+                         worker_processes=WORKER_PROCESSES)
+
+    else:
+        from core.bybit_auto_sell import bybit_auto_sell
 
-    elif cex_type == 2:
         bybit_auto_sell(api_key=API_KEY,
                         api_secret=API_SECRET,
                         token_from=token_from,
@@ -53,7 +213,33 @@ if __name__ == '__main__':
                         threads=THREADS,
                         requests_count=REQUESTS_COUNT,
                         endpoint_url=ENDPOINT_URL,
-                        proxy_str=PROXY_STR)
+                        proxy_str=PROXY_STR,
+                        time_sync_samples=TIME_SYNC_SAMPLES,
+                        keep_alive_interval=KEEP_ALIVE_INTERVAL,
+                        retry_policy=RETRY_POLICY,
+                        batch_orders_count=BATCH_ORDERS_COUNT,
+                        price_ladder_step=PRICE_LADDER_STEP,
+                        latency_report_path=LATENCY_REPORT_PATH,
+                        proxies=PROXIES,
+                        symbols_cache_dir=SYMBOLS_CACHE_DIR,
+                        symbols_cache_ttl=SYMBOLS_CACHE_TTL,
+                        hedge_count=HEDGE_COUNT,
+                        order_rate_limit=ORDER_RATE_LIMIT,
+                        order_rate_limit_window=ORDER_RATE_LIMIT_WINDOW,
+                        endpoint_urls=ENDPOINT_URLS.get('bybit'),
+                        endpoint_spread_count=ENDPOINT_SPREAD_COUNT,
+                        reprice_policy=REPRICE_POLICY,
+                        listing_stream=LISTING_STREAM,
+                        listing_stream_window=LISTING_STREAM_WINDOW,
+                        order_websocket=ORDER_WEBSOCKET,
+                        rehearse=REHEARSE,
+                        http_transport=HTTP_TRANSPORT,
+                        http_timeout=HTTP_TIMEOUT,
+                        use_uvloop=USE_UVLOOP,
+                        worker_processes=WORKER_PROCESSES)
 
     logger.success(f'The Work Was Successfully Completed')
-    input('\nPress Enter To Exit..')
+    logger.complete()
+
+    if interactive:
+        input('\nPress Enter To Exit..')
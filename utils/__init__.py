@@ -1,3 +1,27 @@
-from utils.logger_file import logger
-from utils.bypass_bybit_errors_file import bypass_bybit_errors
-from utils.bypass_kucoin_errors_file import bypass_kucoin_errors
\ No newline at end of file
+from utils.logger_file import configure_logger, flush_repeated_messages, logger, logger_settings
+from utils.json_codec_file import JSON_BACKEND, JsonStruct, convert_json, decode_json, encode_json
+from utils.retry_engine_file import Classification, RetryPolicy, RATE_LIMITED, RETRYABLE, TERMINAL
+from utils.retry_engine_file import retry_unlisted_symbol
+from utils.bypass_bybit_errors_file import bypass_bybit_errors, classify_bybit_order_error
+from utils.bypass_kucoin_errors_file import bypass_kucoin_errors, classify_kucoin_order_error
+from utils.burst_tracker_file import BurstTracker
+from utils.connection_pool_file import ConnectionStats, create_session, keep_connections_alive, warm_connections
+from utils.rate_limiter_file import RateLimiter, TokenBucket
+from utils.egress_pool_file import Egress, EgressPool
+from utils.endpoint_pool_file import Endpoint, EndpointPool
+from utils.event_loop_file import run_event_loop
+from utils.exchange_context_file import ExchangeContext
+from utils.fill_monitor_file import FillMonitor, OrderState, RepricePolicy
+from utils.hedged_request_file import send_hedged
+from utils.latency_recorder_file import LatencyRecorder, RequestRecord
+from utils.order_ack_file import OrderAck
+from utils.order_ladder_file import build_order_ladder
+from utils.prepared_request_file import PreparedRequest
+from utils.response_types_file import BybitBalance, BybitServerTime, BybitSymbol, KucoinBalance, KucoinServerTime, KucoinSymbol
+from utils.settings_schema_file import ENV_PREFIX, load_settings, parse_timestamp, validate_exchange_settings
+from utils.shard_signal_file import ShardSignal
+from utils.stream_file import receive_stream, wait_for_listing
+from utils.symbol_cache_file import SymbolCache, SymbolInfo
+from utils.time_sync_file import ClockOffset, measure_clock_offset, rehearsal_start_time, sleep_until
+from utils.trade_socket_file import SocketResponse, TradeSocket
+from utils.transport_file import TRANSPORTS, AiohttpTransport, StreamResponse, StreamTransport
\ No newline at end of file
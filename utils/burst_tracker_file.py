@@ -0,0 +1,111 @@
+import asyncio
+
+from utils import logger
+from utils.shard_signal_file import ShardSignal
+
+COMMITTED_TOLERANCE: float = 1e-9
+
+
+class BurstTracker:
+    def __init__(self,
+                 target_quantity: float,
+                 shard_signal: ShardSignal | None = None):
+        self.target_quantity: float = target_quantity
+        self.shard_signal: ShardSignal | None = shard_signal
+        self.committed_quantity: float = 0
+        self.total_committed_quantity: float = 0
+        self.accepted_order_ids: list[str] = []
+        self.sent: int = 0
+        self.accepted: int = 0
+        self.rejected: int = 0
+        self.cancelled: int = 0
+        self.stopped: bool = False
+        self.tasks: list[asyncio.Task] = []
+
+    @property
+    def is_committed(self) -> bool:
+        return self.total_committed_quantity >= self.target_quantity * (1 - COMMITTED_TOLERANCE)
+
+    def record_sent(self) -> None:
+        self.sent += 1
+
+    def record_accepted(self,
+                        order_id: str | None,
+                        quantity: float) -> None:
+        self.accepted += 1
+        self.committed_quantity += quantity
+        self.total_committed_quantity: float = self.shard_signal.add_committed(quantity=quantity) if self.shard_signal \
+            else self.committed_quantity
+
+        if order_id:
+            self.accepted_order_ids.append(order_id)
+
+        if self.is_committed:
+            self.stop()
+
+    def record_rejected(self) -> None:
+        self.rejected += 1
+
+    def stop(self) -> None:
+        if self.stopped:
+            return
+
+        self.stopped: bool = True
+
+        if self.shard_signal:
+            self.shard_signal.stop()
+
+        current_task: asyncio.Task | None = asyncio.current_task()
+
+        for task in self.tasks:
+            if task is not current_task and not task.done():
+                task.cancel()
+
+    async def run(self,
+                  coroutines: list) -> None:
+        self.tasks: list[asyncio.Task] = [asyncio.create_task(current_coroutine) for current_coroutine in coroutines]
+        shard_signal_task: asyncio.Task | None = asyncio.create_task(self.watch_shard_signal()) if self.shard_signal \
+            else None
+
+        results: list = await asyncio.gather(*self.tasks, return_exceptions=True)
+
+        if shard_signal_task:
+            shard_signal_task.cancel()
+
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                self.cancelled += 1
+
+            elif isinstance(result, BaseException):
+                logger.error(f'Unexpected Error: {result}')
+
+    async def watch_shard_signal(self) -> None:
+        await self.shard_signal.wait()
+        self.stop()
+
+    def to_dict(self) -> dict:
+        return {
+            'committed_quantity': self.committed_quantity,
+            'accepted_order_ids': self.accepted_order_ids,
+            'sent': self.sent,
+            'accepted': self.accepted,
+            'rejected': self.rejected,
+            'cancelled': self.cancelled
+        }
+
+    def merge(self,
+              burst_dict: dict) -> None:
+        self.committed_quantity += burst_dict['committed_quantity']
+        self.total_committed_quantity: float = self.committed_quantity
+        self.accepted_order_ids.extend(burst_dict['accepted_order_ids'])
+        self.sent += burst_dict['sent']
+        self.accepted += burst_dict['accepted']
+        self.rejected += burst_dict['rejected']
+        self.cancelled += burst_dict['cancelled']
+
+    def summary(self) -> str:
+        return (f'Requests Sent: {self.sent}, '
+                f'Accepted: {self.accepted}, '
+                f'Rejected: {self.rejected}, '
+                f'Cancelled: {self.cancelled}, '
+                f'Committed: {self.committed_quantity}/{self.target_quantity}')
@@ -1,29 +1,79 @@
-from json import loads
+from exceptions import DuplicateOrder, InsufficientBalance, InvalidCredentials, InvalidSymbol, OrderNotActive
+from utils.retry_engine_file import Classification, RetryPolicy, retry_unlisted_symbol, send_with_retry
+from utils.retry_engine_file import RATE_LIMITED, RETRYABLE, SUCCESS, TERMINAL
 
-from utils import logger
+BYBIT_TERMINAL_ERRORS: dict[int, type] = {
+    10003: InvalidCredentials,
+    10004: InvalidCredentials,
+    10005: InvalidCredentials,
+    10007: InvalidCredentials,
+    33004: InvalidCredentials,
+    110001: OrderNotActive,
+    110007: InsufficientBalance,
+    170131: InsufficientBalance,
+    170121: InvalidSymbol,
+    170141: DuplicateOrder,
+    170213: OrderNotActive
+}
+BYBIT_RATE_LIMIT_CODES: set[int] = {10006, 10018}
+BYBIT_REHEARSAL_CODES: set[int] = {110001, 170213}
 
 
-async def bypass_bybit_errors(current_function,
-                              **kwargs) -> any:
-    response = None
+def classify_bybit_response(status: int,
+                            response_json: dict) -> Classification:
+    code: int | None = response_json.get('retCode')
+    message: str = str(response_json.get('retMsg', ''))
+
+    if code == 0:
+        return Classification(error_kind=SUCCESS,
+                              code=code)
+
+    if code in BYBIT_TERMINAL_ERRORS:
+        return Classification(error_kind=TERMINAL,
+                              code=code,
+                              message=message,
+                              exception_type=BYBIT_TERMINAL_ERRORS[code])
+
+    if status == 429 or code in BYBIT_RATE_LIMIT_CODES:
+        return Classification(error_kind=RATE_LIMITED,
+                              code=code,
+                              message=message)
 
-    try:
-        response = await current_function(**kwargs)
+    return Classification(error_kind=RETRYABLE,
+                          code=code,
+                          message=message)
 
-        if loads(await response.text())['retMsg'] != 'OK':
-            logger.error(f'Wrong Response: {await response.text()}')
 
-            return await bypass_bybit_errors(current_function=current_function,
-                                             **kwargs)
+def classify_bybit_order_error(code: int,
+                               message: str) -> Classification:
+    return classify_bybit_response(status=200,
+                                   response_json={
+                                       'retCode': code,
+                                       'retMsg': message
+                                   })
 
-        return await response.text()
 
-    except Exception as error:
-        if response:
-            logger.error(f'Unexpected Error: {error}, response text: {await response.text()}')
+def classify_bybit_rehearsal_response(status: int,
+                                      response_json: dict) -> Classification:
+    if response_json.get('retCode') in BYBIT_REHEARSAL_CODES:
+        return Classification(error_kind=SUCCESS,
+                              code=response_json['retCode'])
 
-        else:
-            logger.error(f'Unexpected Error: {error}')
+    return classify_bybit_response(status=status,
+                                   response_json=response_json)
+
+
+async def bypass_bybit_errors(current_function,
+                              retry_policy: RetryPolicy,
+                              rehearse: bool = False,
+                              listing_deadline: float = 0,
+                              **kwargs) -> dict:
+    classify_response = classify_bybit_rehearsal_response if rehearse else classify_bybit_response
 
-        return await bypass_bybit_errors(current_function=current_function,
-                                         **kwargs)
+    return await send_with_retry(current_function=current_function,
+                                 classify_response=lambda status, response_json: retry_unlisted_symbol(
+                                     classification=classify_response(status=status,
+                                                                      response_json=response_json),
+                                     listing_deadline=listing_deadline),
+                                 retry_policy=retry_policy,
+                                 **kwargs)
\ No newline at end of file
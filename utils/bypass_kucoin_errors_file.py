@@ -1,33 +1,81 @@
-from json import loads
+from exceptions import DuplicateOrder, InsufficientBalance, InvalidCredentials, InvalidSymbol, OrderNotActive
+from utils.retry_engine_file import Classification, RetryPolicy, retry_unlisted_symbol, send_with_retry
+from utils.retry_engine_file import RATE_LIMITED, RETRYABLE, SUCCESS, TERMINAL
 
-from exceptions import InvalidRequestIp
-from utils import logger
+KUCOIN_TERMINAL_ERRORS: dict[str, type] = {
+    '200004': InsufficientBalance,
+    '400003': InvalidCredentials,
+    '400004': InvalidCredentials,
+    '400005': InvalidCredentials,
+    '400007': InvalidCredentials,
+    '411100': InvalidCredentials,
+    '900001': InvalidSymbol
+}
+KUCOIN_RATE_LIMIT_CODES: set[str] = {'429000'}
+KUCOIN_DUPLICATE_ORDER_MARKER: str = 'duplicate'
+KUCOIN_ORDER_NOT_ACTIVE_MARKERS: tuple[str, ...] = ('order_not_exist', 'order not exist')
+KUCOIN_INSUFFICIENT_BALANCE_MARKER: str = 'insufficient'
 
 
-async def bypass_kucoin_errors(current_function,
-                               **kwargs) -> any:
-    response = None
+def classify_kucoin_response(status: int,
+                             response_json: dict) -> Classification:
+    code: str = str(response_json.get('code'))
+    message: str = str(response_json.get('msg', ''))
+
+    if code == '200000':
+        return Classification(error_kind=SUCCESS,
+                              code=code)
+
+    if code == '400100' and KUCOIN_DUPLICATE_ORDER_MARKER in message.lower():
+        return Classification(error_kind=TERMINAL,
+                              code=code,
+                              message=message,
+                              exception_type=DuplicateOrder)
 
-    try:
-        response = await current_function(**kwargs)
+    if code == '400100' and any(marker in message.lower() for marker in KUCOIN_ORDER_NOT_ACTIVE_MARKERS):
+        return Classification(error_kind=TERMINAL,
+                              code=code,
+                              message=message,
+                              exception_type=OrderNotActive)
 
-        if loads(await response.text())['code'] != '200000':
-            logger.error(f'Wrong Response: {await response.text()}')
+    if code in KUCOIN_TERMINAL_ERRORS:
+        return Classification(error_kind=TERMINAL,
+                              code=code,
+                              message=message,
+                              exception_type=KUCOIN_TERMINAL_ERRORS[code])
 
-            if loads(await response.text())['msg'] == 'Invalid request ip':
-                raise InvalidRequestIp('')
+    if status == 429 or code in KUCOIN_RATE_LIMIT_CODES:
+        return Classification(error_kind=RATE_LIMITED,
+                              code=code,
+                              message=message)
 
-            return await bypass_kucoin_errors(current_function=current_function,
-                                              **kwargs)
+    return Classification(error_kind=RETRYABLE,
+                          code=code,
+                          message=message)
 
-        return await response.text()
 
-    except Exception as error:
-        if response:
-            logger.error(f'Unexpected Error: {error}, response text: {await response.text()}')
+def classify_kucoin_order_error(message: str) -> Classification:
+    if KUCOIN_INSUFFICIENT_BALANCE_MARKER in message.lower():
+        return Classification(error_kind=TERMINAL,
+                              code='200004',
+                              message=message,
+                              exception_type=InsufficientBalance)
 
-        else:
-            logger.error(f'Unexpected Error: {error}')
+    return classify_kucoin_response(status=200,
+                                    response_json={
+                                        'code': '400100',
+                                        'msg': message
+                                    })
 
-        return await bypass_kucoin_errors(current_function=current_function,
-                                          **kwargs)
+
+async def bypass_kucoin_errors(current_function,
+                               retry_policy: RetryPolicy,
+                               listing_deadline: float = 0,
+                               **kwargs) -> dict:
+    return await send_with_retry(current_function=current_function,
+                                 classify_response=lambda status, response_json: retry_unlisted_symbol(
+                                     classification=classify_kucoin_response(status=status,
+                                                                             response_json=response_json),
+                                     listing_deadline=listing_deadline),
+                                 retry_policy=retry_policy,
+                                 **kwargs)
\ No newline at end of file
@@ -0,0 +1,100 @@
+import asyncio
+from time import time
+
+import aiohttp
+from aiohttp_proxy import ProxyConnector
+
+from utils import logger
+from utils.latency_recorder_file import LatencyRecorder
+
+KEEPALIVE_TIMEOUT_SECONDS: float = 120
+KEEP_ALIVE_GUARD_SECONDS: float = 1
+REQUEST_TIMEOUT_SECONDS: float = 10
+
+
+class ConnectionStats:
+    def __init__(self):
+        self.created: int = 0
+        self.reused: int = 0
+
+    def reset(self) -> None:
+        self.created: int = 0
+        self.reused: int = 0
+
+    def make_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self.on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self.on_connection_reuseconn)
+
+        return trace_config
+
+    async def on_connection_create_end(self, session, trace_config_ctx, params) -> None:
+        self.created += 1
+
+    async def on_connection_reuseconn(self, session, trace_config_ctx, params) -> None:
+        self.reused += 1
+
+
+def create_session(proxy_str: str | None,
+                   connections_count: int,
+                   connection_stats: ConnectionStats,
+                   latency_recorder: LatencyRecorder | None = None,
+                   request_timeout: float = REQUEST_TIMEOUT_SECONDS) -> aiohttp.ClientSession:
+    connector_kwargs: dict = {
+        'limit': connections_count,
+        'keepalive_timeout': KEEPALIVE_TIMEOUT_SECONDS,
+        'ttl_dns_cache': None
+    }
+
+    if proxy_str:
+        connector = ProxyConnector.from_url(proxy_str, **connector_kwargs)
+
+    else:
+        connector = aiohttp.TCPConnector(**connector_kwargs)
+
+    trace_configs: list[aiohttp.TraceConfig] = [connection_stats.make_trace_config()]
+
+    if latency_recorder:
+        trace_configs.append(latency_recorder.make_trace_config())
+
+    return aiohttp.ClientSession(connector=connector,
+                                 trace_configs=trace_configs,
+                                 timeout=aiohttp.ClientTimeout(total=request_timeout))
+
+
+async def ping_connection(current_function,
+                          url: str) -> bool:
+    try:
+        response = await current_function(method='GET',
+                                          url=url)
+        await response.read()
+
+        return True
+
+    except Exception as error:
+        logger.error(f'Unexpected Error When Warming Connection: {error}')
+        return False
+
+
+async def warm_connections(current_function,
+                           url: str,
+                           connections_count: int) -> int:
+    results: list[bool] = await asyncio.gather(*[
+        ping_connection(current_function=current_function,
+                        url=url)
+        for _ in range(connections_count)
+    ])
+
+    return sum(results)
+
+
+async def keep_connections_alive(current_function,
+                                 url: str,
+                                 connections_count: int,
+                                 interval: float,
+                                 launch_time_ms: float) -> None:
+    while time() + interval < launch_time_ms / 1000 - KEEP_ALIVE_GUARD_SECONDS:
+        await asyncio.sleep(interval)
+        await warm_connections(current_function=current_function,
+                               url=url,
+                               connections_count=connections_count)
@@ -0,0 +1,217 @@
+import asyncio
+import random
+from time import perf_counter
+
+import aiohttp
+from yarl import URL
+
+from utils import logger
+from utils.connection_pool_file import ConnectionStats, create_session, keep_connections_alive, ping_connection
+from utils.connection_pool_file import REQUEST_TIMEOUT_SECONDS, warm_connections
+from utils.latency_recorder_file import LatencyRecorder
+from utils.rate_limiter_file import RateLimiter
+from utils.transport_file import AIOHTTP_TRANSPORT, AiohttpTransport, create_transport, StreamResponse
+from utils.transport_file import StreamTransport
+
+DEFAULT_LATENCY_MS: float = 100
+LATENCY_SMOOTHING: float = 0.3
+ERROR_RATE_PENALTY: float = 4
+FAILURE_STATUSES: set[int] = {403, 407, 429}
+
+
+class Egress:
+    def __init__(self,
+                 proxy_str: str | None,
+                 session: aiohttp.ClientSession,
+                 transport: AiohttpTransport | StreamTransport,
+                 connection_stats: ConnectionStats):
+        self.proxy_str: str | None = proxy_str
+        self.name: str = f'{URL(proxy_str).host}:{URL(proxy_str).port}' if proxy_str else 'direct'
+        self.session: aiohttp.ClientSession = session
+        self.transport: AiohttpTransport | StreamTransport = transport
+        self.connection_stats: ConnectionStats = connection_stats
+        self.latency_ms: float | None = None
+        self.requests: int = 0
+        self.errors: int = 0
+        self.consecutive_errors: int = 0
+        self.disabled: bool = False
+
+    @property
+    def score(self) -> float:
+        error_rate: float = self.errors / self.requests if self.requests else 0
+
+        return (self.latency_ms or DEFAULT_LATENCY_MS) * (1 + ERROR_RATE_PENALTY * error_rate)
+
+    def report(self,
+               latency_ms: float,
+               success: bool) -> None:
+        self.requests += 1
+
+        if success:
+            self.consecutive_errors: int = 0
+            self.latency_ms: float = latency_ms if self.latency_ms is None \
+                else self.latency_ms + LATENCY_SMOOTHING * (latency_ms - self.latency_ms)
+
+        else:
+            self.errors += 1
+            self.consecutive_errors += 1
+
+
+class EgressPool:
+    def __init__(self,
+                 proxies: list[str | None],
+                 connections_count: int,
+                 latency_recorder: LatencyRecorder | None = None,
+                 max_consecutive_errors: int = 3,
+                 transport: str = AIOHTTP_TRANSPORT,
+                 request_timeout: float = REQUEST_TIMEOUT_SECONDS):
+        self.connections_count: int = connections_count
+        self.max_consecutive_errors: int = max_consecutive_errors
+        self.transport: str = transport
+        self.egresses: list[Egress] = []
+
+        for proxy_str in dict.fromkeys(proxy_str if proxy_str and proxy_str != 'direct' else None
+                                       for proxy_str in proxies or [None]):
+            connection_stats: ConnectionStats = ConnectionStats()
+            session: aiohttp.ClientSession = create_session(proxy_str=proxy_str,
+                                                            connections_count=connections_count,
+                                                            connection_stats=connection_stats,
+                                                            latency_recorder=latency_recorder,
+                                                            request_timeout=request_timeout)
+            self.egresses.append(Egress(proxy_str=proxy_str,
+                                        session=session,
+                                        transport=create_transport(transport=transport,
+                                                                   proxy_str=proxy_str,
+                                                                   session=session,
+                                                                   connections_count=connections_count,
+                                                                   connection_stats=connection_stats,
+                                                                   request_timeout=request_timeout),
+                                        connection_stats=connection_stats))
+
+    async def __aenter__(self) -> 'EgressPool':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await asyncio.gather(*[egress.transport.close() for egress in self.egresses],
+                             *[egress.session.close() for egress in self.egresses])
+
+    @property
+    def active_egresses(self) -> list[Egress]:
+        return [egress for egress in self.egresses if not egress.disabled] or self.egresses
+
+    def best(self) -> Egress:
+        return min(self.active_egresses, key=lambda egress: egress.score)
+
+    def choose(self) -> Egress:
+        active_egresses: list[Egress] = self.active_egresses
+
+        return random.choices(active_egresses, weights=[1 / egress.score for egress in active_egresses])[0]
+
+    def choose_many(self,
+                    count: int) -> list[Egress]:
+        active_egresses: list[Egress] = sorted(self.active_egresses, key=lambda egress: egress.score)
+
+        return [active_egresses[egress_index % len(active_egresses)] for egress_index in range(count)]
+
+    async def request(self,
+                      method: str,
+                      egress: Egress | None = None,
+                      rate_limiter: RateLimiter | None = None,
+                      on_send=None,
+                      **kwargs) -> aiohttp.ClientResponse | StreamResponse:
+        egress: Egress = egress or self.choose()
+        endpoint: str = URL(kwargs['url']).path
+
+        if rate_limiter:
+            await rate_limiter.acquire(endpoint=endpoint)
+
+        if on_send:
+            on_send()
+
+        request_start: float = perf_counter()
+
+        try:
+            response: aiohttp.ClientResponse | StreamResponse = await egress.transport.request(method=method,
+                                                                                               **kwargs)
+
+        except asyncio.CancelledError:
+            if rate_limiter:
+                rate_limiter.release(endpoint=endpoint)
+
+            raise
+
+        except Exception:
+            if rate_limiter:
+                rate_limiter.release(endpoint=endpoint)
+
+            self.report(egress=egress,
+                        latency_ms=(perf_counter() - request_start) * 1000,
+                        success=False)
+            raise
+
+        if rate_limiter:
+            rate_limiter.release(endpoint=endpoint,
+                                 headers=response.headers)
+
+        self.report(egress=egress,
+                    latency_ms=(perf_counter() - request_start) * 1000,
+                    success=response.status < 500 and response.status not in FAILURE_STATUSES)
+
+        return response
+
+    def report(self,
+               egress: Egress,
+               latency_ms: float,
+               success: bool) -> None:
+        egress.report(latency_ms=latency_ms,
+                      success=success)
+
+        if not egress.disabled and egress.consecutive_errors >= self.max_consecutive_errors \
+                and len(self.active_egresses) > 1:
+            egress.disabled = True
+            logger.warning(f'Egress Disabled After {egress.consecutive_errors} Errors: {egress.name}')
+
+    async def warm(self,
+                   urls: list[str]) -> int:
+        warm_connections_counts: list[int] = await asyncio.gather(*[
+            warm_connections(current_function=egress.transport.request,
+                             url=url,
+                             connections_count=self.connections_count)
+            for egress in self.egresses
+            for url in urls
+        ])
+
+        for egress in self.egresses:
+            ping_start: float = perf_counter()
+            ping_success: bool = await ping_connection(current_function=egress.transport.request,
+                                                       url=urls[0])
+            egress.report(latency_ms=(perf_counter() - ping_start) * 1000,
+                          success=ping_success)
+            logger.info(f'Egress {egress.name}: {egress.latency_ms or 0:.1f} ms')
+
+        return sum(warm_connections_counts)
+
+    async def keep_alive(self,
+                         urls: list[str],
+                         interval: float,
+                         launch_time_ms: float) -> None:
+        await asyncio.gather(*[
+            keep_connections_alive(current_function=egress.transport.request,
+                                   url=url,
+                                   connections_count=self.connections_count,
+                                   interval=interval,
+                                   launch_time_ms=launch_time_ms)
+            for egress in self.egresses
+            for url in urls
+        ])
+
+    def reset_connection_stats(self) -> None:
+        for egress in self.egresses:
+            egress.connection_stats.reset()
+
+    def summary(self) -> str:
+        return '\n'.join(f'{egress.name}: {egress.requests} requests, {egress.errors} errors, '
+                         f'{egress.latency_ms or 0:.1f} ms, '
+                         f'{egress.connection_stats.reused} reused / {egress.connection_stats.created} new connections'
+                         f'{", disabled" if egress.disabled else ""}'
+                         for egress in self.egresses)
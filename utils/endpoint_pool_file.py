@@ -0,0 +1,147 @@
+import asyncio
+from statistics import median
+from time import perf_counter
+
+import aiohttp
+
+from utils import logger
+from utils.egress_pool_file import DEFAULT_LATENCY_MS, ERROR_RATE_PENALTY, FAILURE_STATUSES, LATENCY_SMOOTHING
+from utils.time_sync_file import ClockOffset
+from utils.transport_file import StreamResponse
+
+CLOCK_TOLERANCE_MS: float = 50
+
+
+class Endpoint:
+    def __init__(self,
+                 url: str):
+        self.url: str = url
+        self.latency_ms: float | None = None
+        self.offset_ms: float | None = None
+        self.requests: int = 0
+        self.errors: int = 0
+        self.consecutive_errors: int = 0
+        self.disabled: bool = False
+
+    @property
+    def score(self) -> float:
+        error_rate: float = self.errors / self.requests if self.requests else 0
+
+        return (self.latency_ms or DEFAULT_LATENCY_MS) * (1 + ERROR_RATE_PENALTY * error_rate)
+
+    def report(self,
+               latency_ms: float,
+               success: bool) -> None:
+        self.requests += 1
+
+        if success:
+            self.consecutive_errors: int = 0
+            self.latency_ms: float = latency_ms if self.latency_ms is None \
+                else self.latency_ms + LATENCY_SMOOTHING * (latency_ms - self.latency_ms)
+
+        else:
+            self.errors += 1
+            self.consecutive_errors += 1
+
+
+class EndpointPool:
+    def __init__(self,
+                 endpoint_urls: list[str],
+                 spread_count: int = 1,
+                 max_consecutive_errors: int = 3):
+        self.endpoints: list[Endpoint] = [Endpoint(url=endpoint_url.rstrip('/'))
+                                          for endpoint_url in dict.fromkeys(endpoint_urls)]
+        self.spread_count: int = max(spread_count, 1)
+        self.max_consecutive_errors: int = max_consecutive_errors
+        self.choices: int = 0
+
+    @property
+    def active_endpoints(self) -> list[Endpoint]:
+        return [endpoint for endpoint in self.endpoints if not endpoint.disabled] or self.endpoints
+
+    @property
+    def spread_endpoints(self) -> list[Endpoint]:
+        return sorted(self.active_endpoints, key=lambda endpoint: endpoint.score)[:self.spread_count]
+
+    def best(self) -> Endpoint:
+        return min(self.active_endpoints, key=lambda endpoint: endpoint.score)
+
+    def choose(self) -> Endpoint:
+        spread_endpoints: list[Endpoint] = self.spread_endpoints
+        self.choices += 1
+
+        return spread_endpoints[self.choices % len(spread_endpoints)]
+
+    async def probe(self,
+                    measure_endpoint) -> None:
+        if len(self.endpoints) < 2:
+            return
+
+        for endpoint in self.endpoints:
+            clock_offset: ClockOffset | None = await measure_endpoint(endpoint_url=endpoint.url)
+
+            if not clock_offset:
+                endpoint.disabled = True
+                logger.warning(f'Endpoint Unreachable: {endpoint.url}')
+                continue
+
+            endpoint.latency_ms = clock_offset.latency_ms * 2
+            endpoint.offset_ms = clock_offset.offset_ms
+
+        measured_endpoints: list[Endpoint] = [endpoint for endpoint in self.endpoints if endpoint.offset_ms is not None]
+
+        if measured_endpoints:
+            median_offset_ms: float = median(endpoint.offset_ms for endpoint in measured_endpoints)
+
+            for endpoint in measured_endpoints:
+                if abs(endpoint.offset_ms - median_offset_ms) > max(CLOCK_TOLERANCE_MS, endpoint.latency_ms):
+                    endpoint.disabled = True
+                    logger.warning(f'Endpoint Clock Inconsistent: {endpoint.url}, '
+                                   f'{endpoint.offset_ms - median_offset_ms:+.1f} ms From Median')
+
+        logger.info(f'Endpoints:\n{self.summary()}')
+
+    async def request(self,
+                      current_function,
+                      path: str,
+                      **kwargs) -> aiohttp.ClientResponse | StreamResponse:
+        endpoint: Endpoint = self.choose()
+        request_start: float = perf_counter()
+
+        try:
+            response: aiohttp.ClientResponse | StreamResponse = await current_function(url=f'{endpoint.url}{path}',
+                                                                                       **kwargs)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception:
+            self.report(endpoint=endpoint,
+                        latency_ms=(perf_counter() - request_start) * 1000,
+                        success=False)
+            raise
+
+        self.report(endpoint=endpoint,
+                    latency_ms=(perf_counter() - request_start) * 1000,
+                    success=response.status < 500 and response.status not in FAILURE_STATUSES)
+
+        return response
+
+    def report(self,
+               endpoint: Endpoint,
+               latency_ms: float,
+               success: bool) -> None:
+        endpoint.report(latency_ms=latency_ms,
+                        success=success)
+
+        if not endpoint.disabled and endpoint.consecutive_errors >= self.max_consecutive_errors \
+                and len(self.active_endpoints) > 1:
+            endpoint.disabled = True
+            logger.warning(f'Endpoint Disabled After {endpoint.consecutive_errors} Errors: {endpoint.url}')
+
+    def summary(self) -> str:
+        return '\n'.join(f'{endpoint.url}: {endpoint.requests} requests, {endpoint.errors} errors, '
+                         f'{endpoint.latency_ms or 0:.1f} ms'
+                         f'{f", offset {endpoint.offset_ms:.1f} ms" if endpoint.offset_ms is not None else ""}'
+                         f'{", disabled" if endpoint.disabled else ""}'
+                         for endpoint in self.endpoints)
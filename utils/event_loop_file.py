@@ -0,0 +1,17 @@
+import asyncio
+
+from utils import logger
+
+
+def run_event_loop(main_coroutine,
+                   use_uvloop: bool = False):
+    if use_uvloop:
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        except ImportError:
+            logger.warning('uvloop Is Not Installed, Using Default Event Loop')
+
+    return asyncio.run(main_coroutine)
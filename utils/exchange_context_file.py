@@ -0,0 +1,37 @@
+import asyncio
+
+from utils.egress_pool_file import EgressPool
+
+
+class ExchangeContext:
+    def __init__(self,
+                 egress_pool: EgressPool):
+        self.egress_pool: EgressPool = egress_pool
+        self.shared_tasks: dict[str, asyncio.Future] = {}
+
+    def start_shared(self,
+                     key: str,
+                     factory) -> asyncio.Future:
+        if key not in self.shared_tasks:
+            self.shared_tasks[key] = asyncio.ensure_future(factory())
+
+        return self.shared_tasks[key]
+
+    def set_shared(self,
+                   key: str,
+                   value) -> None:
+        shared_future: asyncio.Future = asyncio.get_running_loop().create_future()
+        shared_future.set_result(value)
+        self.shared_tasks[key] = shared_future
+
+    async def get_shared(self,
+                         key: str,
+                         factory):
+        return await asyncio.shield(self.start_shared(key=key,
+                                                      factory=factory))
+
+    async def close(self) -> None:
+        for shared_task in self.shared_tasks.values():
+            shared_task.cancel()
+
+        await asyncio.gather(*self.shared_tasks.values(), return_exceptions=True)
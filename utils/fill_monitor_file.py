@@ -0,0 +1,268 @@
+import asyncio
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from time import monotonic
+
+from exceptions import ExchangeError
+from utils import logger
+from utils.order_ladder_file import format_decimal
+from utils.symbol_cache_file import SymbolInfo
+
+TIME_SCHEDULE: str = 'time'
+BEST_BID_SCHEDULE: str = 'best_bid'
+
+
+class RepricePolicy:
+    def __init__(self,
+                 monitor_seconds: float = 0,
+                 schedule: str = TIME_SCHEDULE,
+                 interval: float = 5,
+                 price_step: float = 0.01,
+                 min_price: float = 0,
+                 poll_interval: float = 1,
+                 use_websocket: bool = True):
+        self.monitor_seconds: float = monitor_seconds
+        self.schedule: str = schedule
+        self.interval: float = interval
+        self.price_step: float = price_step
+        self.min_price: float = min_price
+        self.poll_interval: float = poll_interval
+        self.use_websocket: bool = use_websocket
+
+    @property
+    def enabled(self) -> bool:
+        return self.monitor_seconds > 0
+
+    def next_price(self,
+                   current_price: float,
+                   best_bid: float | None,
+                   price_increment: float) -> Decimal | None:
+        if self.schedule == BEST_BID_SCHEDULE:
+            if not best_bid:
+                return None
+
+            target_price: Decimal = Decimal(str(best_bid))
+
+        elif self.schedule == TIME_SCHEDULE and self.price_step > 0:
+            target_price: Decimal = Decimal(str(current_price)) * (1 - Decimal(str(self.price_step)))
+
+        else:
+            return None
+
+        price_tick: Decimal = Decimal(str(price_increment))
+        target_price: Decimal = max(target_price.quantize(price_tick, rounding=ROUND_DOWN),
+                                    Decimal(str(self.min_price)).quantize(price_tick, rounding=ROUND_UP),
+                                    price_tick)
+
+        return target_price if target_price < Decimal(str(current_price)) else None
+
+
+class OrderState:
+    def __init__(self,
+                 order_id: str,
+                 price: float,
+                 quantity: float,
+                 filled_quantity: float,
+                 active: bool):
+        self.order_id: str = order_id
+        self.price: float = price
+        self.quantity: float = quantity
+        self.filled_quantity: float = filled_quantity
+        self.active: bool = active
+
+    @property
+    def remaining_quantity(self) -> float:
+        return max(self.quantity - self.filled_quantity, 0)
+
+
+class FillMonitor:
+    def __init__(self,
+                 reprice_policy: RepricePolicy,
+                 symbol_info: SymbolInfo):
+        self.reprice_policy: RepricePolicy = reprice_policy
+        self.symbol_info: SymbolInfo = symbol_info
+        self.orders: dict[str, OrderState] = {}
+        self.untracked_updates: dict[str, OrderState] = {}
+        self.target_quantity: float = 0
+        self.replaced: int = 0
+        self.done_event: asyncio.Event = asyncio.Event()
+
+    @property
+    def active_orders(self) -> list[OrderState]:
+        return [order_state for order_state in self.orders.values() if order_state.active]
+
+    @property
+    def filled_quantity(self) -> float:
+        return sum(order_state.filled_quantity for order_state in self.orders.values())
+
+    @property
+    def remaining_quantity(self) -> float:
+        return max(self.target_quantity - self.filled_quantity, 0)
+
+    @property
+    def is_done(self) -> bool:
+        return not self.active_orders
+
+    def track(self,
+              order_state: OrderState) -> None:
+        self.orders[order_state.order_id] = self.untracked_updates.pop(order_state.order_id, order_state)
+
+        if self.is_done:
+            self.done_event.set()
+
+        else:
+            self.done_event.clear()
+
+    def update(self,
+               order_state: OrderState) -> None:
+        if order_state.order_id not in self.orders:
+            self.untracked_updates[order_state.order_id] = order_state
+            return
+
+        self.orders[order_state.order_id] = order_state
+
+        if self.is_done:
+            self.done_event.set()
+
+    def update_many(self,
+                    order_states: list[OrderState]) -> None:
+        for order_state in order_states:
+            self.update(order_state=order_state)
+
+    async def run(self,
+                  order_ids: list[str],
+                  fetch_orders,
+                  watch_orders,
+                  fetch_best_bid,
+                  cancel_order,
+                  place_order) -> None:
+        for order_state in await fetch_orders(order_ids=list(dict.fromkeys(order_ids))):
+            self.track(order_state=order_state)
+            self.target_quantity += order_state.quantity
+
+        if self.is_done:
+            logger.info(self.summary())
+            return
+
+        logger.info(f'Monitoring Fills For {self.reprice_policy.monitor_seconds} sec.: {self.summary()}')
+        watch_task: asyncio.Task = asyncio.create_task(self.watch(fetch_orders=fetch_orders,
+                                                                  watch_orders=watch_orders))
+        deadline: float = monotonic() + self.reprice_policy.monitor_seconds
+
+        try:
+            while not self.is_done:
+                remaining_seconds: float = deadline - monotonic()
+
+                if remaining_seconds <= 0:
+                    break
+
+                try:
+                    await asyncio.wait_for(self.done_event.wait(),
+                                           timeout=min(self.reprice_policy.interval, remaining_seconds))
+
+                except asyncio.TimeoutError:
+                    pass
+
+                if self.is_done or monotonic() >= deadline:
+                    break
+
+                await self.reprice(fetch_orders=fetch_orders,
+                                   fetch_best_bid=fetch_best_bid,
+                                   cancel_order=cancel_order,
+                                   place_order=place_order)
+
+        finally:
+            watch_task.cancel()
+
+        logger.info(self.summary())
+
+    async def watch(self,
+                    fetch_orders,
+                    watch_orders) -> None:
+        if self.reprice_policy.use_websocket:
+            try:
+                await watch_orders(on_update=self.update)
+                logger.warning('Order Updates WebSocket Closed, Falling Back To Polling')
+
+            except Exception as error:
+                logger.warning(f'Order Updates WebSocket Unavailable, Falling Back To Polling: {error}')
+
+        while True:
+            await asyncio.sleep(self.reprice_policy.poll_interval)
+
+            try:
+                self.update_many(order_states=await fetch_orders(
+                    order_ids=[order_state.order_id for order_state in self.active_orders]))
+
+            except Exception as error:
+                logger.warning(f'Error When Polling Orders: {error}')
+
+    async def reprice(self,
+                      fetch_orders,
+                      fetch_best_bid,
+                      cancel_order,
+                      place_order) -> None:
+        best_bid: float | None = None
+
+        if self.reprice_policy.schedule == BEST_BID_SCHEDULE:
+            try:
+                best_bid: float | None = await fetch_best_bid()
+
+            except Exception as error:
+                logger.warning(f'Error When Getting Best Bid: {error}')
+                return
+
+        for order_state in self.active_orders:
+            new_price: Decimal | None = self.reprice_policy.next_price(
+                current_price=order_state.price,
+                best_bid=best_bid,
+                price_increment=self.symbol_info.price_increment)
+
+            if new_price is None:
+                continue
+
+            try:
+                await cancel_order(order_id=order_state.order_id)
+
+            except ExchangeError as error:
+                logger.warning(f'Error When Cancelling Order {order_state.order_id}: {error}')
+
+            try:
+                self.update_many(order_states=await fetch_orders(order_ids=[order_state.order_id]))
+
+            except Exception as error:
+                logger.warning(f'Error When Getting Cancelled Order {order_state.order_id}: {error}')
+                continue
+
+            cancelled_state: OrderState = self.orders[order_state.order_id]
+
+            if cancelled_state.active:
+                continue
+
+            quantity: Decimal = Decimal(str(cancelled_state.remaining_quantity)).quantize(
+                Decimal(str(self.symbol_info.base_increment)), rounding=ROUND_DOWN)
+
+            if quantity <= 0 or quantity < Decimal(str(self.symbol_info.min_size)):
+                continue
+
+            try:
+                new_order_id: str = await place_order(quantity=format_decimal(quantity),
+                                                      price=format_decimal(new_price))
+
+            except ExchangeError as error:
+                logger.error(f'Error When Replacing Order {order_state.order_id}: {error}')
+                continue
+
+            self.track(order_state=OrderState(order_id=new_order_id,
+                                              price=float(new_price),
+                                              quantity=float(quantity),
+                                              filled_quantity=0,
+                                              active=True))
+            self.replaced += 1
+            logger.info(f'Order Repriced: {order_state.order_id} -> {new_order_id}, '
+                        f'{format_decimal(quantity)} @ {format_decimal(new_price)}')
+
+    def summary(self) -> str:
+        return (f'Filled: {self.filled_quantity}/{self.target_quantity}, '
+                f'Remaining: {self.remaining_quantity}, '
+                f'Active Orders: {len(self.active_orders)}, '
+                f'Replaced: {self.replaced}')
@@ -0,0 +1,41 @@
+import asyncio
+
+
+async def send_hedged(coroutines: list,
+                      is_preferred=None) -> tuple[int, object]:
+    tasks: list[asyncio.Task] = [asyncio.create_task(current_coroutine) for current_coroutine in coroutines]
+
+    for task in tasks:
+        task.add_done_callback(lambda done_task: done_task.cancelled() or done_task.exception())
+
+    pending_tasks: set[asyncio.Task] = set(tasks)
+    first_error: BaseException | None = None
+    fallback: tuple[int, object] | None = None
+
+    try:
+        while pending_tasks:
+            done_tasks, pending_tasks = await asyncio.wait(pending_tasks,
+                                                           return_when=asyncio.FIRST_COMPLETED)
+
+            for task_index, task in enumerate(tasks):
+                if task not in done_tasks or task.cancelled():
+                    continue
+
+                if task.exception() is not None:
+                    first_error: BaseException = first_error or task.exception()
+
+                elif is_preferred is None or is_preferred(task.result()):
+                    return task_index, task.result()
+
+                elif fallback is None:
+                    fallback: tuple[int, object] = task_index, task.result()
+
+        if fallback:
+            return fallback
+
+        raise first_error
+
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,99 @@
+import json
+from dataclasses import dataclass, fields
+from functools import cache
+from types import NoneType, UnionType
+from typing import get_args, get_origin
+
+from exceptions import InvalidResponse
+
+try:
+    import msgspec
+
+    JSON_BACKEND: str = 'msgspec'
+    msgspec_decoder = msgspec.json.Decoder()
+    msgspec_encoder = msgspec.json.Encoder()
+
+    def decode_json(body: bytes | str):
+        return msgspec_decoder.decode(body)
+
+    def encode_json(obj) -> bytes:
+        return msgspec_encoder.encode(obj)
+
+except ImportError:
+    try:
+        import orjson
+
+        JSON_BACKEND: str = 'orjson'
+
+        def decode_json(body: bytes | str):
+            return orjson.loads(body)
+
+        def encode_json(obj) -> bytes:
+            return orjson.dumps(obj)
+
+    except ImportError:
+        JSON_BACKEND: str = 'json'
+
+        def decode_json(body: bytes | str):
+            return json.loads(body)
+
+        def encode_json(obj) -> bytes:
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+try:
+    import msgspec
+
+    class JsonStruct(msgspec.Struct, rename='camel'):
+        pass
+
+    def convert_json(obj, target_type):
+        try:
+            return msgspec.convert(obj, type=target_type, strict=False)
+
+        except msgspec.ValidationError as error:
+            raise InvalidResponse(code=None,
+                                  message=f'Unexpected Response Schema: {error}')
+
+except ImportError:
+    class JsonStruct:
+        def __init_subclass__(cls,
+                              **kwargs):
+            super().__init_subclass__(**kwargs)
+            dataclass(cls)
+
+    @cache
+    def get_converter(target_type):
+        if isinstance(target_type, UnionType):
+            value_converter = get_converter(target_type=next(union_type for union_type in get_args(target_type)
+                                                             if union_type is not NoneType))
+
+            return lambda obj: None if obj is None else value_converter(obj)
+
+        if get_origin(target_type) is list:
+            item_converter = get_converter(target_type=get_args(target_type)[0])
+
+            return lambda obj: [item_converter(current_obj) for current_obj in obj]
+
+        if isinstance(target_type, type) and issubclass(target_type, JsonStruct):
+            struct_fields: list[tuple[str, str, object]] = [
+                (struct_field.name,
+                 ''.join(part.capitalize() if part_index else part
+                         for part_index, part in enumerate(struct_field.name.split('_'))),
+                 get_converter(target_type=struct_field.type))
+                for struct_field in fields(target_type)
+            ]
+
+            return lambda obj: target_type(**{field_name: field_converter(obj[json_name])
+                                              for field_name, json_name, field_converter in struct_fields
+                                              if json_name in obj})
+
+        return target_type
+
+    def convert_json(obj, target_type):
+        try:
+            return get_converter(target_type=target_type)(obj)
+
+        except (KeyError, TypeError, ValueError) as error:
+            raise InvalidResponse(code=None,
+                                  message=f'Unexpected Response Schema: {type(error).__name__} {error}')
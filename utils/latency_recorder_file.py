@@ -0,0 +1,203 @@
+import csv
+import math
+from json import dumps
+from time import perf_counter, time
+
+import aiohttp
+
+STAGES: tuple[str, ...] = ('scheduled', 'signed', 'connection_acquired', 'request_sent', 'first_byte', 'body_parsed')
+HISTOGRAM_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def percentile(values: list[float],
+               percent: float) -> float:
+    sorted_values: list[float] = sorted(values)
+
+    return sorted_values[max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)]
+
+
+class RequestRecord:
+    def __init__(self,
+                 request_kind: str,
+                 attempt: int):
+        self.request_kind: str = request_kind
+        self.attempt: int = attempt
+        self.scheduled_wall: float = time()
+        self.stages: dict[str, float] = {'scheduled': perf_counter()}
+        self.code: str | int | None = None
+        self.error_kind: str | None = None
+
+    def mark(self,
+             stage: str) -> None:
+        self.stages.setdefault(stage, perf_counter())
+
+    def elapsed_ms(self,
+                   stage: str,
+                   from_stage: str = 'scheduled') -> float | None:
+        if stage not in self.stages or from_stage not in self.stages:
+            return None
+
+        return (self.stages[stage] - self.stages[from_stage]) * 1000
+
+    def to_dict(self) -> dict:
+        return {
+            'request_kind': self.request_kind,
+            'attempt': self.attempt,
+            'scheduled_wall': self.scheduled_wall,
+            **{f'{stage}_ms': self.elapsed_ms(stage=stage) for stage in STAGES},
+            'code': self.code,
+            'error_kind': self.error_kind
+        }
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.records: list[RequestRecord] = []
+        self.first_accepted_wall: float | None = None
+        self.clock_offset_ms: float = 0
+        self.hedge_wins: dict[int, int] = {}
+
+    def create_record(self,
+                      request_kind: str,
+                      attempt: int) -> RequestRecord:
+        record: RequestRecord = RequestRecord(request_kind=request_kind,
+                                              attempt=attempt)
+        self.records.append(record)
+
+        return record
+
+    def mark_accepted(self) -> None:
+        if self.first_accepted_wall is None:
+            self.first_accepted_wall: float = time()
+
+    def record_hedge_win(self,
+                         hedge_index: int) -> None:
+        self.hedge_wins[hedge_index] = self.hedge_wins.get(hedge_index, 0) + 1
+
+    def merge(self,
+              latency_recorder: 'LatencyRecorder') -> None:
+        self.records.extend(latency_recorder.records)
+        self.clock_offset_ms: float = latency_recorder.clock_offset_ms
+
+        if latency_recorder.first_accepted_wall is not None:
+            self.first_accepted_wall: float = min(self.first_accepted_wall or math.inf,
+                                                  latency_recorder.first_accepted_wall)
+
+        for hedge_index, wins_count in latency_recorder.hedge_wins.items():
+            self.hedge_wins[hedge_index] = self.hedge_wins.get(hedge_index, 0) + wins_count
+
+    def make_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self.make_stage_callback(stage='signed'))
+        trace_config.on_connection_create_end.append(self.make_stage_callback(stage='connection_acquired'))
+        trace_config.on_connection_reuseconn.append(self.make_stage_callback(stage='connection_acquired'))
+        trace_config.on_request_headers_sent.append(self.make_stage_callback(stage='request_sent'))
+        trace_config.on_request_end.append(self.make_stage_callback(stage='first_byte'))
+
+        return trace_config
+
+    @staticmethod
+    def make_stage_callback(stage: str):
+        async def stage_callback(session, trace_config_ctx, params) -> None:
+            if isinstance(trace_config_ctx.trace_request_ctx, RequestRecord):
+                trace_config_ctx.trace_request_ctx.mark(stage=stage)
+
+        return stage_callback
+
+    def summary(self,
+                start_sale_time: int) -> str:
+        summary_lines: list[str] = []
+
+        for request_kind in dict.fromkeys(record.request_kind for record in self.records):
+            total_latencies: list[float] = [
+                record.elapsed_ms(stage='body_parsed') for record in self.records
+                if record.request_kind == request_kind and 'body_parsed' in record.stages
+            ]
+
+            if not total_latencies:
+                continue
+
+            summary_lines.append(f'{request_kind}: {len(total_latencies)} requests, '
+                                 f'p50 {percentile(total_latencies, 50):.1f} ms, '
+                                 f'p90 {percentile(total_latencies, 90):.1f} ms, '
+                                 f'p99 {percentile(total_latencies, 99):.1f} ms')
+
+            for stage, from_stage in zip(STAGES[1:], STAGES[:-1]):
+                stage_latencies: list[float] = [
+                    record.elapsed_ms(stage=stage, from_stage=from_stage) for record in self.records
+                    if record.request_kind == request_kind and stage in record.stages and from_stage in record.stages
+                ]
+
+                if stage_latencies:
+                    summary_lines.append(f'  {from_stage} -> {stage}: '
+                                         f'p50 {percentile(stage_latencies, 50):.1f} ms, '
+                                         f'p99 {percentile(stage_latencies, 99):.1f} ms')
+
+            previous_bucket: float = 0
+
+            for bucket in HISTOGRAM_BUCKETS_MS + (math.inf,):
+                bucket_count: int = sum(previous_bucket <= latency < bucket for latency in total_latencies)
+
+                if bucket_count:
+                    summary_lines.append(f'  {previous_bucket:>6g}-{bucket:<6g} ms | {"#" * min(bucket_count, 50)} {bucket_count}')
+
+                previous_bucket: float = bucket
+
+        if self.hedge_wins:
+            hedged_orders_count: int = sum(self.hedge_wins.values())
+            hedge_wins_count: int = hedged_orders_count - self.hedge_wins.get(0, 0)
+            summary_lines.append(f'Hedged Orders: {hedged_orders_count}, '
+                                 f'Won By Hedge: {hedge_wins_count} ({hedge_wins_count / hedged_orders_count:.0%}), '
+                                 f'Wins By Copy: ' + ', '.join(f'#{hedge_index}: {wins_count}' for hedge_index, wins_count
+                                                               in sorted(self.hedge_wins.items())))
+
+        if self.first_accepted_wall is not None:
+            summary_lines.append(f'Start Sale Time -> First Accepted Order: '
+                                 f'{(self.first_accepted_wall * 1000 + self.clock_offset_ms) - start_sale_time * 1000:.1f} ms')
+
+        return '\n'.join(summary_lines)
+
+    def rehearsal_summary(self,
+                          start_sale_time: int,
+                          threads: int,
+                          request_kind: str = 'order') -> str:
+        order_records: list[RequestRecord] = [
+            record for record in self.records
+            if record.request_kind == request_kind and 'request_sent' in record.stages
+        ]
+
+        if not order_records:
+            return 'No Order Requests Sent'
+
+        sent_walls: list[float] = sorted(record.scheduled_wall + record.elapsed_ms(stage='request_sent') / 1000
+                                         for record in order_records)
+        total_latencies: list[float] = [record.elapsed_ms(stage='body_parsed') for record in order_records
+                                        if 'body_parsed' in record.stages]
+        burst_seconds: float = sent_walls[-1] - sent_walls[0]
+        request_rate: float = (len(sent_walls) - 1) / burst_seconds if burst_seconds > 0 else math.nan
+        summary_lines: list[str] = [
+            f'Start Sale Time -> First Request Sent: '
+            f'{sent_walls[0] * 1000 + self.clock_offset_ms - start_sale_time * 1000:.1f} ms',
+            f'Requests Sent: {len(sent_walls)} In {burst_seconds * 1000:.1f} ms, '
+            f'Rate: {request_rate:.1f} req/s, Per Thread: {request_rate / max(threads, 1):.1f} req/s'
+        ]
+
+        if total_latencies:
+            summary_lines.append(f'Round Trip: p50 {percentile(total_latencies, 50):.1f} ms, '
+                                 f'p99 {percentile(total_latencies, 99):.1f} ms, '
+                                 f'Completed: {len(total_latencies)}/{len(order_records)}')
+
+        return '\n'.join(summary_lines)
+
+    def write_records(self,
+                      file_path: str) -> None:
+        records: list[dict] = [record.to_dict() for record in self.records]
+
+        with open(file_path, 'w', encoding='utf-8', newline='') as file:
+            if file_path.endswith('.csv'):
+                writer: csv.DictWriter = csv.DictWriter(file, fieldnames=list(RequestRecord('', 0).to_dict()))
+                writer.writeheader()
+                writer.writerows(records)
+
+            else:
+                file.writelines(dumps(record) + '\n' for record in records)
@@ -1,9 +1,102 @@
+import math
+from json import dumps
 from sys import stderr
+from time import monotonic
 
 from loguru import logger
 
-logger.remove()
-logger.add(stderr, format='<white>{time:HH:mm:ss}</white>'
-                          ' | <level>{level: <8}</level>'
-                          ' | <cyan>{line}</cyan>'
-                          ' - <white>{message}</white>')
+CONSOLE_FORMAT: str = '<white>{time:HH:mm:ss}</white>' \
+                      ' | <level>{level: <8}</level>' \
+                      ' | <cyan>{line}</cyan>' \
+                      ' - <white>{message}</white>'
+REPEATED_LEVEL_NO: int = logger.level('WARNING').no
+
+
+class RepeatedMessagesFilter:
+    def __init__(self,
+                 window_seconds: float):
+        self.window_seconds: float = window_seconds
+        self.last_logged: dict[str, float] = {}
+        self.suppressed: dict[str, int] = {}
+
+    def __call__(self,
+                 record: dict) -> bool:
+        if record['extra'].get('structured'):
+            return False
+
+        if not self.window_seconds or record['level'].no < REPEATED_LEVEL_NO:
+            return True
+
+        current_time: float = monotonic()
+
+        if current_time - self.last_logged.get(record['message'], -math.inf) < self.window_seconds:
+            self.suppressed[record['message']] = self.suppressed.get(record['message'], 0) + 1
+            return False
+
+        self.last_logged[record['message']] = current_time
+        suppressed_count: int = self.suppressed.pop(record['message'], 0)
+
+        if suppressed_count:
+            record['message'] += f' (Repeated {suppressed_count} More Times)'
+
+        return True
+
+    def flush(self) -> None:
+        suppressed: dict[str, int] = self.suppressed
+        self.suppressed: dict[str, int] = {}
+        self.last_logged: dict[str, float] = {}
+
+        for message, suppressed_count in suppressed.items():
+            logger.warning(f'Repeated {suppressed_count} More Times: {message}')
+
+
+class StructuredLogSink:
+    def __init__(self,
+                 file_path: str):
+        self.file = open(file_path, 'a', encoding='utf-8', buffering=1)
+
+    def write(self,
+              message) -> None:
+        record: dict = message.record
+        self.file.write(dumps({
+            'time': record['time'].timestamp(),
+            'level': record['level'].name,
+            'message': record['message'],
+            **{key: value for key, value in record['extra'].items() if key != 'structured'}
+        }, default=str) + '\n')
+
+    def stop(self) -> None:
+        self.file.close()
+
+
+repeated_messages_filter: RepeatedMessagesFilter = RepeatedMessagesFilter(window_seconds=1)
+logger_settings: dict = {}
+
+
+def configure_logger(enqueue: bool = True,
+                     repeat_window: float = 1,
+                     structured_log_path: str | None = None) -> None:
+    logger_settings.update(enqueue=enqueue,
+                           repeat_window=repeat_window,
+                           structured_log_path=structured_log_path)
+    repeated_messages_filter.window_seconds = repeat_window
+
+    logger.remove()
+    logger.add(stderr,
+               level='INFO',
+               format=CONSOLE_FORMAT,
+               filter=repeated_messages_filter,
+               enqueue=enqueue)
+
+    if structured_log_path:
+        logger.add(StructuredLogSink(file_path=structured_log_path),
+                   level='DEBUG',
+                   format='{message}',
+                   enqueue=enqueue)
+
+
+def flush_repeated_messages() -> None:
+    repeated_messages_filter.flush()
+
+
+configure_logger()
@@ -0,0 +1,12 @@
+from utils.json_codec_file import JsonStruct
+
+
+class OrderAck(JsonStruct):
+    client_id: str
+    order_id: str | None = None
+    error: str | None = None
+    code: str | int | None = None
+
+    @property
+    def accepted(self) -> bool:
+        return self.error is None
@@ -0,0 +1,34 @@
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+
+def format_decimal(value: Decimal) -> str:
+    return format(value.normalize(), 'f')
+
+
+def build_order_ladder(total_quantity: float,
+                       orders_count: int,
+                       sale_price: float,
+                       price_step: float,
+                       base_increment: float,
+                       price_increment: float) -> list[tuple[str, str]]:
+    base_step: Decimal = Decimal(str(base_increment))
+    price_tick: Decimal = Decimal(str(price_increment))
+    total: Decimal = Decimal(str(total_quantity)).quantize(base_step, rounding=ROUND_DOWN)
+    order_quantity: Decimal = (total / orders_count).quantize(base_step, rounding=ROUND_DOWN)
+
+    if order_quantity <= 0:
+        order_quantity: Decimal = total
+        orders_count: int = 1
+
+    order_ladder: list[tuple[str, str]] = []
+
+    for order_index in range(orders_count):
+        current_quantity: Decimal = order_quantity if order_index < orders_count - 1 \
+            else total - order_quantity * (orders_count - 1)
+        current_price: Decimal = (Decimal(str(sale_price))
+                                  * (1 + Decimal(str(price_step)) * (order_index - Decimal(orders_count - 1) / 2)))
+        current_price: Decimal = max(current_price.quantize(price_tick, rounding=ROUND_HALF_UP), price_tick)
+
+        order_ladder.append((format_decimal(current_quantity), format_decimal(current_price)))
+
+    return order_ladder
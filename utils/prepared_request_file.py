@@ -0,0 +1,12 @@
+class PreparedRequest:
+    def __init__(self,
+                 request_url: str,
+                 body: bytes,
+                 headers: dict,
+                 sign_payload: bytes,
+                 order_quantities: dict[str, float]):
+        self.request_url: str = request_url
+        self.body: bytes = body
+        self.headers: dict = headers
+        self.sign_payload: bytes = sign_payload
+        self.order_quantities: dict[str, float] = order_quantities
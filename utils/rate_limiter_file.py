@@ -0,0 +1,152 @@
+import asyncio
+import math
+from time import time
+
+from utils import logger
+
+RESET_TOLERANCE_SECONDS: float = 0.05
+
+
+class TokenBucket:
+    def __init__(self,
+                 endpoint: str):
+        self.endpoint: str = endpoint
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float = 0
+        self.window_seconds: float = 0
+        self.in_flight: int = 0
+        self.waits: int = 0
+        self.waited_seconds: float = 0
+        self.throttled_window: float | None = None
+
+    async def acquire(self) -> None:
+        while True:
+            current_time: float = time()
+
+            if self.remaining is not None and current_time >= self.reset_at:
+                if self.limit:
+                    self.remaining: int = self.limit
+                    self.reset_at: float = self.reset_at + max(self.window_seconds,
+                                                               current_time - self.reset_at + RESET_TOLERANCE_SECONDS)
+
+                else:
+                    self.remaining: int | None = None
+
+            if self.remaining is None or self.remaining > 0:
+                if self.remaining is not None:
+                    self.remaining -= 1
+
+                self.in_flight += 1
+                return
+
+            if self.throttled_window != self.reset_at:
+                self.throttled_window: float = self.reset_at
+                logger.warning(f'Rate Limit Reached: {self.endpoint}, '
+                               f'Waiting {(self.reset_at - current_time) * 1000:.0f} ms Until Reset')
+
+            wait_seconds: float = max(self.reset_at - current_time, 0)
+            self.waits += 1
+            self.waited_seconds += wait_seconds
+            await asyncio.sleep(wait_seconds)
+
+    def seed(self,
+             limit: int,
+             window_seconds: float) -> None:
+        if self.remaining is not None:
+            return
+
+        self.limit: int = limit
+        self.remaining: int = limit
+        self.window_seconds: float = window_seconds
+        self.reset_at: float = time() + window_seconds
+
+    def release(self,
+                limit: int | None = None,
+                remaining: int | None = None,
+                reset_at: float | None = None) -> None:
+        self.in_flight: int = max(self.in_flight - 1, 0)
+
+        if remaining is None or reset_at is None:
+            return
+
+        if limit:
+            self.limit: int = limit
+
+        self.window_seconds: float = max(self.window_seconds, reset_at - time())
+
+        if self.remaining is not None and reset_at < self.reset_at - RESET_TOLERANCE_SECONDS:
+            return
+
+        estimated_remaining: int = max(remaining - self.in_flight, 0)
+
+        if self.remaining is None or reset_at > self.reset_at + RESET_TOLERANCE_SECONDS:
+            self.remaining: int = estimated_remaining
+            self.reset_at: float = reset_at
+
+        else:
+            self.remaining: int = min(self.remaining, estimated_remaining)
+
+    def summary(self) -> str:
+        reset_in_ms: float = max(self.reset_at - time(), 0) * 1000 if self.remaining is not None else math.nan
+
+        return (f'{self.endpoint}: {self.remaining}/{self.limit} remaining, '
+                f'reset in {reset_in_ms:.0f} ms, '
+                f'{self.waits} waits, {self.waited_seconds * 1000:.0f} ms waited')
+
+
+class RateLimiter:
+    def __init__(self):
+        self.buckets: dict[str, TokenBucket] = {}
+        self.clock_offset_ms: float = 0
+
+    def get_bucket(self,
+                   endpoint: str) -> TokenBucket:
+        if endpoint not in self.buckets:
+            self.buckets[endpoint] = TokenBucket(endpoint=endpoint)
+
+        return self.buckets[endpoint]
+
+    def seed(self,
+             endpoint: str,
+             limit: int,
+             window_seconds: float) -> None:
+        self.get_bucket(endpoint=endpoint).seed(limit=limit,
+                                                window_seconds=window_seconds)
+
+    async def acquire(self,
+                      endpoint: str) -> None:
+        await self.get_bucket(endpoint=endpoint).acquire()
+
+    def parse_headers(self,
+                      headers) -> tuple[int | None, int | None, float | None]:
+        if 'gw-ratelimit-remaining' in headers and 'gw-ratelimit-reset' in headers:
+            return (int(headers.get('gw-ratelimit-limit', 0)) or None,
+                    int(headers['gw-ratelimit-remaining']),
+                    time() + int(headers['gw-ratelimit-reset']) / 1000)
+
+        if 'X-Bapi-Limit-Status' in headers and 'X-Bapi-Limit-Reset-Timestamp' in headers:
+            return (int(headers.get('X-Bapi-Limit', 0)) or None,
+                    int(headers['X-Bapi-Limit-Status']),
+                    (int(headers['X-Bapi-Limit-Reset-Timestamp']) - self.clock_offset_ms) / 1000)
+
+        return None, None, None
+
+    def release(self,
+                endpoint: str,
+                headers=None) -> None:
+        limit, remaining, reset_at = None, None, None
+
+        if headers is not None:
+            try:
+                limit, remaining, reset_at = self.parse_headers(headers=headers)
+
+            except ValueError as error:
+                logger.error(f'Error When Parsing Rate Limit Headers: {error}')
+
+        self.get_bucket(endpoint=endpoint).release(limit=limit,
+                                                   remaining=remaining,
+                                                   reset_at=reset_at)
+
+    def summary(self) -> str:
+        return '\n'.join(bucket.summary() for bucket in self.buckets.values() if bucket.remaining is not None)
@@ -0,0 +1,43 @@
+from utils.json_codec_file import JsonStruct
+
+
+class KucoinServerTime(JsonStruct):
+    data: int
+
+
+class KucoinBalance(JsonStruct):
+    currency: str
+    type: str
+    balance: float
+
+
+class KucoinSymbol(JsonStruct):
+    base_currency: str
+    quote_currency: str
+    base_increment: float
+    price_increment: float
+    base_min_size: float
+    base_max_size: float
+
+
+class BybitServerTime(JsonStruct):
+    time_nano: int
+
+
+class BybitCoinBalance(JsonStruct):
+    coin: str
+    wallet_balance: float
+
+
+class BybitBalance(JsonStruct):
+    account_type: str
+    coin: list[BybitCoinBalance]
+
+
+class BybitSymbol(JsonStruct):
+    base_coin: str
+    quote_coin: str
+    base_precision: float
+    min_price_precision: float
+    min_trade_qty: float
+    max_trade_qty: float
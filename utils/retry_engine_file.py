@@ -0,0 +1,144 @@
+import asyncio
+from random import random
+from time import monotonic, perf_counter, time
+
+from exceptions import InvalidSymbol, RetryBudgetExhausted
+from utils import logger
+from utils.json_codec_file import decode_json
+from utils.latency_recorder_file import LatencyRecorder, RequestRecord
+
+SUCCESS: str = 'success'
+RETRYABLE: str = 'retryable'
+RATE_LIMITED: str = 'rate_limited'
+TERMINAL: str = 'terminal'
+
+
+class RetryPolicy:
+    def __init__(self,
+                 max_attempts: int = 20,
+                 max_seconds: float = 30,
+                 backoff_base: float = 0.05,
+                 backoff_max: float = 2,
+                 rate_limit_backoff: float = 1,
+                 jitter: float = 0.5):
+        self.max_attempts: int = max_attempts
+        self.max_seconds: float = max_seconds
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.rate_limit_backoff: float = rate_limit_backoff
+        self.jitter: float = jitter
+
+    def get_delay(self,
+                  attempt: int,
+                  error_kind: str) -> float:
+        delay: float = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+
+        if error_kind == RATE_LIMITED:
+            delay: float = max(delay, self.rate_limit_backoff)
+
+        return delay * (1 - self.jitter * random())
+
+    def is_exhausted(self,
+                     attempt: int,
+                     elapsed_seconds: float) -> bool:
+        return attempt >= self.max_attempts or elapsed_seconds > self.max_seconds
+
+
+class Classification:
+    def __init__(self,
+                 error_kind: str,
+                 code: str | int | None = None,
+                 message: str = '',
+                 exception_type: type | None = None):
+        self.error_kind: str = error_kind
+        self.code: str | int | None = code
+        self.message: str = message
+        self.exception_type: type | None = exception_type
+
+
+def retry_unlisted_symbol(classification: Classification,
+                          listing_deadline: float) -> Classification:
+    if classification.exception_type is InvalidSymbol and time() < listing_deadline:
+        return Classification(error_kind=RETRYABLE,
+                              code=classification.code,
+                              message=classification.message)
+
+    return classification
+
+
+async def send_with_retry(current_function,
+                          classify_response,
+                          retry_policy: RetryPolicy,
+                          request_kind: str = 'request',
+                          latency_recorder: LatencyRecorder | None = None,
+                          **kwargs) -> dict:
+    started: float = monotonic()
+    attempt: int = 0
+
+    while True:
+        attempt += 1
+        response_body: bytes | None = None
+        record: RequestRecord | None = None
+
+        if latency_recorder:
+            record: RequestRecord = latency_recorder.create_record(request_kind=request_kind,
+                                                                   attempt=attempt)
+            kwargs['trace_request_ctx'] = record
+
+        attempt_started: float = perf_counter()
+
+        try:
+            response = await current_function(**kwargs)
+            response_body: bytes = await response.read()
+            response_json: dict = decode_json(response_body)
+
+            if record:
+                record.mark(stage='body_parsed')
+
+            classification: Classification = classify_response(response.status, response_json)
+
+        except Exception as error:
+            if response_body is not None:
+                logger.error(f'Unexpected Error: {error}, response text: {response_body.decode(errors="replace")}')
+
+            else:
+                logger.error(f'Unexpected Error: {error}')
+
+            classification: Classification = Classification(error_kind=RETRYABLE,
+                                                             message=str(error))
+
+            if record:
+                record.error_kind = classification.error_kind
+
+        else:
+            if record:
+                record.code = classification.code
+                record.error_kind = classification.error_kind
+
+            if classification.error_kind != SUCCESS:
+                logger.error(f'Wrong Response: {response_body.decode(errors="replace")}')
+
+        logger.debug('Request',
+                     structured=True,
+                     request_kind=request_kind,
+                     attempt=attempt,
+                     code=classification.code,
+                     error_kind=classification.error_kind,
+                     latency_ms=round((perf_counter() - attempt_started) * 1000, 3))
+
+        if classification.error_kind == SUCCESS:
+            return response_json
+
+        if classification.error_kind == TERMINAL:
+            raise classification.exception_type(code=classification.code,
+                                                message=classification.message)
+
+        delay: float = retry_policy.get_delay(attempt=attempt,
+                                              error_kind=classification.error_kind)
+
+        if retry_policy.is_exhausted(attempt=attempt,
+                                     elapsed_seconds=monotonic() - started + delay):
+            raise RetryBudgetExhausted(code=classification.code,
+                                       message=f'{attempt} attempts, last error: {classification.message}')
+
+        await asyncio.sleep(delay)
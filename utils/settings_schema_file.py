@@ -0,0 +1,399 @@
+import os
+from json import JSONDecodeError, load, loads
+
+from exceptions import InvalidSettings
+
+ENV_PREFIX: str = 'AUTO_SELL_'
+EXCHANGES: tuple[str, ...] = ('kucoin', 'bybit')
+TRUE_STRINGS: set[str] = {'1', 'true', 'yes', 'on'}
+FALSE_STRINGS: set[str] = {'', '0', 'false', 'no', 'off'}
+
+
+def parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+
+    if isinstance(value, str) and value.strip().lower() in TRUE_STRINGS | FALSE_STRINGS:
+        return value.strip().lower() in TRUE_STRINGS
+
+    raise ValueError(f'expected true or false, got {value!r}')
+
+
+def parse_int(value) -> int:
+    if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+        raise ValueError(f'expected an integer, got {value!r}')
+
+    return int(value)
+
+
+def parse_float(value) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f'expected a number, got {value!r}')
+
+    return float(value)
+
+
+def parse_str(value) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f'expected a string, got {value!r}')
+
+    return value
+
+
+def parse_optional_str(value) -> str | None:
+    if value is None:
+        return None
+
+    return parse_str(value=value) or None
+
+
+def parse_timestamp(value) -> int:
+    timestamp: int = parse_int(value=value)
+
+    while timestamp >= 10 ** 11:
+        timestamp //= 1000
+
+    if timestamp <= 0:
+        raise ValueError(f'expected a UNIX timestamp, got {value!r}')
+
+    return timestamp
+
+
+def parse_json_value(value):
+    if not isinstance(value, str):
+        return value
+
+    try:
+        return loads(value)
+
+    except JSONDecodeError as error:
+        raise ValueError(f'expected JSON, got {value!r}: {error}')
+
+
+def parse_str_list(value) -> list[str]:
+    value = parse_json_value(value=value)
+
+    if not isinstance(value, list) or not all(isinstance(current_value, str) for current_value in value):
+        raise ValueError(f'expected a list of strings, got {value!r}')
+
+    return value
+
+
+def parse_endpoint_urls(value) -> dict[str, list[str]]:
+    value = parse_json_value(value=value)
+
+    if not isinstance(value, dict):
+        raise ValueError(f'expected an object with keys {", ".join(EXCHANGES)}, got {value!r}')
+
+    for exchange in value:
+        if exchange not in EXCHANGES:
+            raise ValueError(f'unknown exchange {exchange!r}, expected one of {", ".join(EXCHANGES)}')
+
+    return {exchange: parse_str_list(value=endpoint_urls) for exchange, endpoint_urls in value.items()}
+
+
+class SettingField:
+    def __init__(self,
+                 caster,
+                 default=None,
+                 required: bool = False,
+                 minimum: float | None = None,
+                 exclusive_minimum: float | None = None,
+                 choices: tuple | None = None):
+        self.caster = caster
+        self.default = default
+        self.required: bool = required
+        self.minimum: float | None = minimum
+        self.exclusive_minimum: float | None = exclusive_minimum
+        self.choices: tuple | None = choices
+
+    def parse(self,
+              value):
+        value = self.caster(value)
+
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f'must be >= {self.minimum}, got {value}')
+
+        if self.exclusive_minimum is not None and value <= self.exclusive_minimum:
+            raise ValueError(f'must be > {self.exclusive_minimum}, got {value}')
+
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f'must be one of {", ".join(map(str, self.choices))}, got {value!r}')
+
+        return value
+
+
+JOB_SCHEMA: dict[str, SettingField] = {
+    'name': SettingField(caster=parse_optional_str),
+    'exchange': SettingField(caster=lambda value: parse_str(value=value).lower(),
+                             required=True,
+                             choices=EXCHANGES),
+    'api_key': SettingField(caster=parse_str,
+                            required=True),
+    'api_secret': SettingField(caster=parse_str,
+                               required=True),
+    'api_pass_phrase': SettingField(caster=parse_str),
+    'token_from': SettingField(caster=lambda value: parse_str(value=value).lower(),
+                               required=True),
+    'token_to': SettingField(caster=lambda value: parse_str(value=value).lower(),
+                             required=True),
+    'start_sale_time': SettingField(caster=parse_timestamp,
+                                    required=True),
+    'sale_price': SettingField(caster=parse_float,
+                               required=True,
+                               exclusive_minimum=0),
+    'threads': SettingField(caster=parse_int,
+                            minimum=1),
+    'requests_count': SettingField(caster=parse_int,
+                                   minimum=1),
+    'endpoint_url': SettingField(caster=parse_str),
+    'endpoint_urls': SettingField(caster=parse_str_list),
+    'endpoint_spread_count': SettingField(caster=parse_int,
+                                          minimum=1),
+    'proxy': SettingField(caster=parse_str),
+    'proxies': SettingField(caster=parse_str_list),
+    'batch_orders_count': SettingField(caster=parse_int,
+                                       minimum=0),
+    'price_ladder_step': SettingField(caster=parse_float,
+                                      minimum=0),
+    'hedge_count': SettingField(caster=parse_int,
+                                minimum=1),
+    'order_rate_limit': SettingField(caster=parse_int,
+                                     minimum=0),
+    'order_rate_limit_window': SettingField(caster=parse_float,
+                                            exclusive_minimum=0),
+    'listing_stream': SettingField(caster=parse_bool),
+    'order_websocket': SettingField(caster=parse_bool)
+}
+
+
+def parse_jobs(value) -> list[dict]:
+    value = parse_json_value(value=value)
+
+    if not isinstance(value, list):
+        raise ValueError(f'expected a list of jobs, got {value!r}')
+
+    jobs: list[dict] = []
+    errors: list[str] = []
+
+    for job_index, current_job in enumerate(value, start=1):
+        if not isinstance(current_job, dict):
+            errors.append(f'job #{job_index}: expected an object, got {current_job!r}')
+            continue
+
+        job_settings, job_errors = parse_schema(raw_settings=current_job,
+                                                schema=JOB_SCHEMA,
+                                                keep_missing=False)
+
+        if job_settings.get('exchange') == 'kucoin' and not job_settings.get('api_pass_phrase'):
+            job_errors.append('api_pass_phrase: required for kucoin')
+
+        errors.extend(f'job #{job_index} {job_error}' for job_error in job_errors)
+        jobs.append(job_settings)
+
+    if errors:
+        raise ValueError('\n  '.join([''] + errors))
+
+    return jobs
+
+
+SETTINGS_SCHEMA: dict[str, SettingField] = {
+    'api_key': SettingField(caster=parse_str,
+                            default=''),
+    'api_secret': SettingField(caster=parse_str,
+                               default=''),
+    'api_pass_phrase': SettingField(caster=parse_str,
+                                    default=''),
+    'start_sale_time': SettingField(caster=parse_timestamp),
+    'sale_price': SettingField(caster=parse_float,
+                               exclusive_minimum=0),
+    'threads': SettingField(caster=parse_int,
+                            required=True,
+                            minimum=1),
+    'requests_count': SettingField(caster=parse_int,
+                                   required=True,
+                                   minimum=1),
+    'endpoint_url': SettingField(caster=parse_str,
+                                 default=''),
+    'endpoint_urls': SettingField(caster=parse_endpoint_urls,
+                                  default={}),
+    'endpoint_spread_count': SettingField(caster=parse_int,
+                                          default=1,
+                                          minimum=1),
+    'proxy': SettingField(caster=parse_optional_str),
+    'proxies': SettingField(caster=parse_str_list,
+                            default=[]),
+    'time_sync_samples': SettingField(caster=parse_int,
+                                      default=10,
+                                      minimum=1),
+    'keep_alive_interval': SettingField(caster=parse_float,
+                                        default=15,
+                                        exclusive_minimum=0),
+    'retry_max_attempts': SettingField(caster=parse_int,
+                                       default=20,
+                                       minimum=1),
+    'retry_max_seconds': SettingField(caster=parse_float,
+                                      default=30,
+                                      exclusive_minimum=0),
+    'retry_backoff_base': SettingField(caster=parse_float,
+                                       default=0.05,
+                                       minimum=0),
+    'retry_backoff_max': SettingField(caster=parse_float,
+                                      default=2,
+                                      minimum=0),
+    'retry_rate_limit_backoff': SettingField(caster=parse_float,
+                                             default=1,
+                                             minimum=0),
+    'retry_jitter': SettingField(caster=parse_float,
+                                 default=0.5,
+                                 minimum=0),
+    'batch_orders_count': SettingField(caster=parse_int,
+                                       default=0,
+                                       minimum=0),
+    'price_ladder_step': SettingField(caster=parse_float,
+                                      default=0,
+                                      minimum=0),
+    'hedge_count': SettingField(caster=parse_int,
+                                default=1,
+                                minimum=1),
+    'order_rate_limit': SettingField(caster=parse_int,
+                                     default=0,
+                                     minimum=0),
+    'order_rate_limit_window': SettingField(caster=parse_float,
+                                            default=1,
+                                            exclusive_minimum=0),
+    'fill_monitor_seconds': SettingField(caster=parse_float,
+                                         default=0,
+                                         minimum=0),
+    'reprice_schedule': SettingField(caster=parse_str,
+                                     default='time',
+                                     choices=('time', 'best_bid')),
+    'reprice_interval': SettingField(caster=parse_float,
+                                     default=5,
+                                     exclusive_minimum=0),
+    'reprice_step': SettingField(caster=parse_float,
+                                 default=0.01,
+                                 minimum=0),
+    'reprice_min_price': SettingField(caster=parse_float,
+                                      default=0,
+                                      minimum=0),
+    'order_poll_interval': SettingField(caster=parse_float,
+                                        default=1,
+                                        exclusive_minimum=0),
+    'order_updates_websocket': SettingField(caster=parse_bool,
+                                            default=True),
+    'listing_stream': SettingField(caster=parse_bool,
+                                   default=False),
+    'listing_stream_window': SettingField(caster=parse_float,
+                                          default=0.2,
+                                          minimum=0),
+    'order_websocket': SettingField(caster=parse_bool,
+                                    default=False),
+    'http_transport': SettingField(caster=parse_str,
+                                   default='aiohttp',
+                                   choices=('aiohttp', 'stream')),
+    'http_timeout': SettingField(caster=parse_float,
+                                 default=10,
+                                 exclusive_minimum=0),
+    'use_uvloop': SettingField(caster=parse_bool,
+                               default=False),
+    'worker_processes': SettingField(caster=parse_int,
+                                     default=1,
+                                     minimum=1),
+    'latency_report_path': SettingField(caster=parse_optional_str),
+    'log_enqueue': SettingField(caster=parse_bool,
+                                default=True),
+    'log_repeat_window': SettingField(caster=parse_float,
+                                      default=1,
+                                      minimum=0),
+    'structured_log_path': SettingField(caster=parse_optional_str),
+    'symbols_cache_dir': SettingField(caster=parse_optional_str),
+    'symbols_cache_ttl': SettingField(caster=parse_float,
+                                      default=3600,
+                                      minimum=0),
+    'jobs': SettingField(caster=parse_jobs,
+                         default=[]),
+    'jobs_file': SettingField(caster=parse_optional_str)
+}
+
+
+def parse_schema(raw_settings: dict,
+                 schema: dict[str, SettingField],
+                 keep_missing: bool = True) -> tuple[dict, list[str]]:
+    settings: dict = {}
+    errors: list[str] = [f'{key}: unknown setting' for key in raw_settings if key not in schema]
+
+    for key, setting_field in schema.items():
+        if raw_settings.get(key) is None or (setting_field.required and raw_settings[key] == ''):
+            if setting_field.required:
+                errors.append(f'{key}: required')
+
+            if keep_missing:
+                settings[key] = setting_field.default
+
+            continue
+
+        try:
+            settings[key] = setting_field.parse(value=raw_settings[key])
+
+        except (TypeError, ValueError) as error:
+            errors.append(f'{key}: {error}')
+
+    return settings, errors
+
+
+def load_settings(file_path: str,
+                  overrides: dict | None = None,
+                  exchange: str | None = None) -> dict:
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig') as file:
+            raw_settings: dict = load(file)
+
+    except (OSError, JSONDecodeError) as error:
+        raise InvalidSettings(errors=[f'{file_path}: {error}'])
+
+    if not isinstance(raw_settings, dict):
+        raise InvalidSettings(errors=[f'{file_path}: expected a JSON object'])
+
+    for key in SETTINGS_SCHEMA:
+        if f'{ENV_PREFIX}{key.upper()}' in os.environ:
+            raw_settings[key] = os.environ[f'{ENV_PREFIX}{key.upper()}']
+
+    raw_settings.update({key: value for key, value in (overrides or {}).items() if value is not None})
+
+    settings, errors = parse_schema(raw_settings=raw_settings,
+                                    schema=SETTINGS_SCHEMA)
+
+    if settings.get('jobs_file') and not errors:
+        try:
+            with open(settings['jobs_file'], 'r', encoding='utf-8-sig') as file:
+                settings['jobs'] = parse_jobs(value=load(file))
+
+        except (OSError, JSONDecodeError, ValueError) as error:
+            errors.append(f'jobs_file: {error}')
+
+    if not settings.get('jobs'):
+        for key in ('api_key', 'api_secret', 'start_sale_time', 'sale_price', 'endpoint_url'):
+            if not settings.get(key) and not any(error.startswith(f'{key}:') for error in errors):
+                errors.append(f'{key}: required when jobs are not set')
+
+    if errors:
+        raise InvalidSettings(errors=errors)
+
+    if exchange:
+        validate_exchange_settings(settings=settings,
+                                   exchange=exchange)
+
+    return settings
+
+
+def validate_exchange_settings(settings: dict,
+                               exchange: str) -> None:
+    if exchange not in EXCHANGES:
+        raise InvalidSettings(errors=[f'exchange: must be one of {", ".join(EXCHANGES)}, got {exchange!r}'])
+
+    if exchange == 'kucoin' and not settings['jobs'] and not settings['api_pass_phrase']:
+        raise InvalidSettings(errors=['api_pass_phrase: required for kucoin'])
@@ -0,0 +1,27 @@
+import asyncio
+
+SHARD_SIGNAL_POLL_INTERVAL: float = 0.001
+
+
+class ShardSignal:
+    def __init__(self,
+                 mp_context):
+        self.stop_event = mp_context.Event()
+        self.committed_quantity = mp_context.Value('d', 0)
+
+    @property
+    def is_stopped(self) -> bool:
+        return self.stop_event.is_set()
+
+    def add_committed(self,
+                      quantity: float) -> float:
+        with self.committed_quantity.get_lock():
+            self.committed_quantity.value += quantity
+            return self.committed_quantity.value
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    async def wait(self) -> None:
+        while not self.stop_event.is_set():
+            await asyncio.sleep(SHARD_SIGNAL_POLL_INTERVAL)
@@ -0,0 +1,56 @@
+import asyncio
+from json import dumps
+from time import monotonic
+
+import aiohttp
+
+from utils import logger
+from utils.time_sync_file import sleep_until
+
+
+async def receive_stream(websocket: aiohttp.ClientWebSocketResponse,
+                         ping_interval: float,
+                         ping_message: dict):
+    next_ping: float = monotonic() + ping_interval
+
+    while True:
+        try:
+            message: aiohttp.WSMessage = await websocket.receive(timeout=max(next_ping - monotonic(), 0))
+
+        except asyncio.TimeoutError:
+            await websocket.send_str(dumps(ping_message))
+            next_ping: float = monotonic() + ping_interval
+            continue
+
+        if message.type != aiohttp.WSMsgType.TEXT:
+            return
+
+        yield message.data
+
+
+async def wait_for_listing(watch_listing,
+                           launch_time_ms: float,
+                           window_seconds: float) -> str | None:
+    listing_task: asyncio.Task = asyncio.create_task(watch_listing(launch_time_ms - window_seconds * 1000))
+    deadline_task: asyncio.Task = asyncio.create_task(sleep_until(target_time_ms=launch_time_ms))
+
+    try:
+        await asyncio.wait({listing_task, deadline_task},
+                           return_when=asyncio.FIRST_COMPLETED)
+
+        if not listing_task.done():
+            logger.warning(f'No Listing Event Within {window_seconds} sec. Before Start Sale Time')
+            return None
+
+        try:
+            return listing_task.result()
+
+        except Exception as error:
+            logger.warning(f'Listing Stream Unavailable, Starting By Schedule: {error}')
+
+        await sleep_until(target_time_ms=launch_time_ms)
+        return None
+
+    finally:
+        listing_task.cancel()
+        deadline_task.cancel()
@@ -0,0 +1,110 @@
+import asyncio
+import os
+from json import dump, load
+from time import time
+
+from utils import logger
+
+
+class SymbolInfo:
+    def __init__(self,
+                 base: str,
+                 quote: str,
+                 base_increment: float,
+                 price_increment: float,
+                 min_size: float,
+                 max_size: float):
+        self.base: str = base.upper()
+        self.quote: str = quote.upper()
+        self.base_increment: float = base_increment
+        self.price_increment: float = price_increment
+        self.min_size: float = min_size
+        self.max_size: float = max_size
+
+    def to_dict(self) -> dict:
+        return {
+            'base': self.base,
+            'quote': self.quote,
+            'base_increment': self.base_increment,
+            'price_increment': self.price_increment,
+            'min_size': self.min_size,
+            'max_size': self.max_size
+        }
+
+
+class SymbolCache:
+    def __init__(self,
+                 file_path: str | None,
+                 ttl_seconds: float):
+        self.file_path: str | None = file_path
+        self.ttl_seconds: float = ttl_seconds
+        self.updated_at: float = 0
+        self.index: dict[tuple[str, str], SymbolInfo] = {}
+
+        if file_path and os.path.exists(file_path):
+            try:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    cache_json: dict = load(file)
+
+                self.updated_at: float = float(cache_json['updated_at'])
+                self.index: dict[tuple[str, str], SymbolInfo] = {
+                    (current_symbol['base'], current_symbol['quote']): SymbolInfo(**current_symbol)
+                    for current_symbol in cache_json['symbols']
+                }
+
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                logger.error(f'Error When Loading Symbol Cache {file_path}: {error}')
+
+    @property
+    def is_fresh(self) -> bool:
+        return time() - self.updated_at < self.ttl_seconds
+
+    def get(self,
+            base: str,
+            quote: str) -> SymbolInfo | None:
+        return self.index.get((base.upper(), quote.upper()))
+
+    def add(self,
+            symbol_info: SymbolInfo) -> None:
+        self.index[(symbol_info.base, symbol_info.quote)] = symbol_info
+
+    def update(self,
+               symbols: list[SymbolInfo]) -> None:
+        self.index: dict[tuple[str, str], SymbolInfo] = {
+            (symbol_info.base, symbol_info.quote): symbol_info for symbol_info in symbols
+        }
+        self.updated_at: float = time()
+        self.save()
+
+    def save(self) -> None:
+        if not self.file_path:
+            return
+
+        temp_file_path: str = f'{self.file_path}.tmp'
+
+        try:
+            os.makedirs(os.path.dirname(self.file_path) or '.', exist_ok=True)
+
+            with open(temp_file_path, 'w', encoding='utf-8') as file:
+                dump({
+                    'updated_at': self.updated_at,
+                    'symbols': [symbol_info.to_dict() for symbol_info in self.index.values()]
+                }, file)
+
+            os.replace(temp_file_path, self.file_path)
+
+        except OSError as error:
+            logger.error(f'Error When Saving Symbol Cache {self.file_path}: {error}')
+
+    async def refresh(self,
+                      fetch_symbols) -> None:
+        try:
+            symbols: list[SymbolInfo] = await fetch_symbols()
+
+        except Exception as error:
+            logger.error(f'Error When Refreshing Symbol Cache: {error}')
+            return
+
+        await asyncio.to_thread(self.update,
+                                symbols=symbols)
+        logger.info(f'Symbol Cache Refreshed: {len(symbols)} Symbols')
@@ -0,0 +1,90 @@
+import asyncio
+import math
+from statistics import median, pstdev
+from time import perf_counter, time
+
+from utils import logger
+from utils.json_codec_file import decode_json
+from utils.latency_recorder_file import LatencyRecorder, RequestRecord
+
+SPIN_THRESHOLD_SECONDS: float = 0.02
+REHEARSAL_LEAD_SECONDS: int = 5
+
+
+class ClockOffset:
+    def __init__(self,
+                 offset_ms: float,
+                 latency_ms: float,
+                 jitter_ms: float,
+                 samples_count: int):
+        self.offset_ms: float = offset_ms
+        self.latency_ms: float = latency_ms
+        self.jitter_ms: float = jitter_ms
+        self.samples_count: int = samples_count
+
+    def launch_time_ms(self,
+                       start_sale_time: int) -> float:
+        return start_sale_time * 1000 - self.offset_ms - self.latency_ms
+
+
+async def measure_clock_offset(current_function,
+                               url: str,
+                               parse_server_time,
+                               samples_count: int,
+                               best_samples_count: int = 3,
+                               latency_recorder: LatencyRecorder | None = None) -> ClockOffset | None:
+    samples: list[tuple[float, float]] = []
+
+    for sample_index in range(samples_count):
+        record: RequestRecord | None = latency_recorder.create_record(request_kind='time_sync',
+                                                                      attempt=sample_index + 1) \
+            if latency_recorder else None
+
+        try:
+            local_start_ms: float = time() * 1000
+            request_start: float = perf_counter()
+
+            response = await current_function(url=url,
+                                              trace_request_ctx=record)
+            response_body: bytes = await response.read()
+
+            round_trip_ms: float = (perf_counter() - request_start) * 1000
+            server_time_ms: float = parse_server_time(decode_json(response_body))
+
+            if record:
+                record.mark(stage='body_parsed')
+
+        except Exception as error:
+            logger.error(f'Unexpected Error When Syncing Time: {error}')
+            continue
+
+        samples.append((round_trip_ms, server_time_ms - (local_start_ms + round_trip_ms / 2)))
+
+    if not samples:
+        return None
+
+    samples.sort()
+    best_samples: list[tuple[float, float]] = samples[:best_samples_count]
+
+    return ClockOffset(offset_ms=median(current_offset for _, current_offset in best_samples),
+                       latency_ms=best_samples[0][0] / 2,
+                       jitter_ms=pstdev(current_round_trip for current_round_trip, _ in samples),
+                       samples_count=len(samples))
+
+
+async def sleep_until(target_time_ms: float) -> None:
+    while True:
+        remaining_seconds: float = target_time_ms / 1000 - time()
+
+        if remaining_seconds <= 0:
+            return
+
+        if remaining_seconds > SPIN_THRESHOLD_SECONDS:
+            await asyncio.sleep(remaining_seconds - SPIN_THRESHOLD_SECONDS)
+
+        else:
+            await asyncio.sleep(0)
+
+
+def rehearsal_start_time() -> int:
+    return math.ceil(time()) + REHEARSAL_LEAD_SECONDS
@@ -0,0 +1,108 @@
+import asyncio
+from json import dumps
+from uuid import uuid4
+
+import aiohttp
+
+from exceptions import InvalidCredentials
+from utils.json_codec_file import decode_json
+from utils.latency_recorder_file import RequestRecord
+from utils.stream_file import receive_stream
+
+AUTH_TIMEOUT_SECONDS: float = 10
+
+
+class SocketResponse:
+    def __init__(self,
+                 body: bytes,
+                 headers: dict):
+        self.status: int = 200
+        self.body: bytes = body
+        self.headers: dict = headers
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class TradeSocket:
+    def __init__(self,
+                 session: aiohttp.ClientSession,
+                 url: str,
+                 ping_interval: float,
+                 ping_message: dict):
+        self.session: aiohttp.ClientSession = session
+        self.url: str = url
+        self.ping_interval: float = ping_interval
+        self.ping_message: dict = ping_message
+        self.websocket: aiohttp.ClientWebSocketResponse | None = None
+        self.read_task: asyncio.Task | None = None
+        self.pending: dict[str, asyncio.Future] = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self.websocket is not None and not self.websocket.closed
+
+    async def connect(self,
+                      auth_message: dict) -> None:
+        self.websocket: aiohttp.ClientWebSocketResponse = await self.session.ws_connect(self.url)
+        await self.websocket.send_str(dumps(auth_message))
+        auth_json: dict = decode_json((await self.websocket.receive(timeout=AUTH_TIMEOUT_SECONDS)).data)
+
+        if auth_json.get('retCode') != 0:
+            await self.websocket.close()
+            raise InvalidCredentials(code=auth_json.get('retCode'),
+                                     message=str(auth_json.get('retMsg')))
+
+        self.read_task: asyncio.Task = asyncio.create_task(self.read_responses())
+
+    async def read_responses(self) -> None:
+        try:
+            async for message_data in receive_stream(websocket=self.websocket,
+                                                     ping_interval=self.ping_interval,
+                                                     ping_message=self.ping_message):
+                message_json: dict = decode_json(message_data)
+                response_future: asyncio.Future | None = self.pending.pop(message_json.get('reqId'), None)
+
+                if response_future and not response_future.done():
+                    response_future.set_result(SocketResponse(body=message_data.encode('utf-8'),
+                                                              headers=message_json.get('header') or {}))
+
+        finally:
+            for response_future in self.pending.values():
+                if not response_future.done():
+                    response_future.set_exception(ConnectionError('Trade WebSocket Closed'))
+
+            self.pending.clear()
+
+    async def request(self,
+                      operation: str,
+                      args: bytes,
+                      header: dict,
+                      trace_request_ctx: RequestRecord | None = None) -> SocketResponse:
+        request_id: str = uuid4().hex
+        response_future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = response_future
+
+        try:
+            await self.websocket.send_str(f'{{"reqId":"{request_id}","header":{dumps(header)},'
+                                          f'"op":"{operation}","args":[{args.decode("utf-8")}]}}')
+
+            if trace_request_ctx:
+                trace_request_ctx.mark(stage='request_sent')
+
+            socket_response: SocketResponse = await response_future
+
+        finally:
+            self.pending.pop(request_id, None)
+
+        if trace_request_ctx:
+            trace_request_ctx.mark(stage='first_byte')
+
+        return socket_response
+
+    async def close(self) -> None:
+        if self.read_task:
+            self.read_task.cancel()
+
+        if self.websocket:
+            await self.websocket.close()
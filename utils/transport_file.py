@@ -0,0 +1,291 @@
+import asyncio
+import ssl
+from json import dumps
+from urllib.parse import urlencode
+
+import aiohttp
+from aiohttp.http import SERVER_SOFTWARE
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from utils import logger
+from utils.connection_pool_file import ConnectionStats, REQUEST_TIMEOUT_SECONDS
+from utils.latency_recorder_file import RequestRecord
+
+AIOHTTP_TRANSPORT: str = 'aiohttp'
+STREAM_TRANSPORT: str = 'stream'
+TRANSPORTS: tuple[str, ...] = (AIOHTTP_TRANSPORT, STREAM_TRANSPORT)
+BODYLESS_STATUSES: set[int] = {204, 304}
+
+
+class AiohttpTransport:
+    def __init__(self,
+                 session: aiohttp.ClientSession):
+        self.session: aiohttp.ClientSession = session
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      **kwargs) -> aiohttp.ClientResponse:
+        return await self.session.request(method=method,
+                                          url=url,
+                                          **kwargs)
+
+    async def close(self) -> None:
+        return None
+
+
+class StreamResponse:
+    def __init__(self,
+                 status: int,
+                 headers: CIMultiDictProxy,
+                 body: bytes):
+        self.status: int = status
+        self.headers: CIMultiDictProxy = headers
+        self.body: bytes = body
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class StreamConnection:
+    def __init__(self,
+                 reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+
+    @property
+    def is_usable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class StreamTransport:
+    def __init__(self,
+                 connections_count: int,
+                 connection_stats: ConnectionStats,
+                 request_timeout: float = REQUEST_TIMEOUT_SECONDS):
+        self.connection_stats: ConnectionStats = connection_stats
+        self.request_timeout: float = request_timeout
+        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(value=max(connections_count, 1))
+        self.idle_connections: dict[tuple[str, str, int], list[StreamConnection]] = {}
+        self.ssl_context: ssl.SSLContext = ssl.create_default_context()
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      headers: dict | None = None,
+                      params: dict | None = None,
+                      data: bytes | str | None = None,
+                      json: dict | list | None = None,
+                      trace_request_ctx: RequestRecord | None = None) -> StreamResponse:
+        record: RequestRecord | None = trace_request_ctx if isinstance(trace_request_ctx, RequestRecord) else None
+
+        if record:
+            record.mark(stage='signed')
+
+        request_url: URL = URL(url)
+        request_bytes: bytes = self.make_request_bytes(method=method,
+                                                       request_url=request_url,
+                                                       headers=headers,
+                                                       params=params,
+                                                       data=data,
+                                                       json=json)
+        connection_key: tuple[str, str, int] = request_url.scheme, request_url.raw_host, request_url.port
+
+        async with self.semaphore, asyncio.timeout(self.request_timeout):
+            while True:
+                connection, reused = await self.acquire(connection_key=connection_key)
+
+                if record:
+                    record.mark(stage='connection_acquired')
+
+                try:
+                    response_result: tuple[StreamResponse, bool] | None = await self.send_request(
+                        connection=connection,
+                        request_bytes=request_bytes,
+                        method=method,
+                        record=record,
+                        reused=reused)
+
+                except BaseException:
+                    connection.close()
+                    raise
+
+                if response_result is None:
+                    connection.close()
+                    continue
+
+                response, keep_alive = response_result
+
+                if keep_alive:
+                    self.idle_connections.setdefault(connection_key, []).append(connection)
+
+                else:
+                    connection.close()
+
+                return response
+
+    @staticmethod
+    def make_request_bytes(method: str,
+                           request_url: URL,
+                           headers: dict | None,
+                           params: dict | None,
+                           data: bytes | str | None,
+                           json: dict | list | None) -> bytes:
+        request_target: str = request_url.raw_path_qs
+
+        if params:
+            request_target += ('&' if request_url.raw_query_string else '?') + urlencode(params)
+
+        if json is not None:
+            body: bytes = dumps(json).encode('utf-8')
+
+        elif isinstance(data, str):
+            body: bytes = data.encode('utf-8')
+
+        else:
+            body: bytes = data or b''
+
+        request_headers: CIMultiDict = CIMultiDict(headers or {})
+        request_headers.setdefault('Host', request_url.raw_host if request_url.is_default_port()
+                                   else f'{request_url.raw_host}:{request_url.port}')
+        request_headers.setdefault('User-Agent', SERVER_SOFTWARE)
+
+        if json is not None:
+            request_headers.setdefault('Content-Type', 'application/json')
+
+        if body or method not in ('GET', 'HEAD'):
+            request_headers['Content-Length'] = str(len(body))
+
+        return (f'{method} {request_target} HTTP/1.1\r\n'
+                + ''.join(f'{header_name}: {header_value}\r\n' for header_name, header_value in request_headers.items())
+                + '\r\n').encode('latin-1') + body
+
+    async def acquire(self,
+                      connection_key: tuple[str, str, int]) -> tuple[StreamConnection, bool]:
+        idle_connections: list[StreamConnection] = self.idle_connections.get(connection_key, [])
+
+        while idle_connections:
+            connection: StreamConnection = idle_connections.pop()
+
+            if connection.is_usable:
+                self.connection_stats.reused += 1
+                return connection, True
+
+            connection.close()
+
+        scheme, host, port = connection_key
+        reader, writer = await asyncio.open_connection(host=host,
+                                                       port=port,
+                                                       ssl=self.ssl_context if scheme == 'https' else None)
+        self.connection_stats.created += 1
+
+        return StreamConnection(reader=reader,
+                                writer=writer), False
+
+    async def send_request(self,
+                           connection: StreamConnection,
+                           request_bytes: bytes,
+                           method: str,
+                           record: RequestRecord | None,
+                           reused: bool) -> tuple[StreamResponse, bool] | None:
+        connection.writer.write(request_bytes)
+
+        if reused and connection.writer.is_closing():
+            return None
+
+        await connection.writer.drain()
+
+        if record:
+            record.mark(stage='request_sent')
+
+        try:
+            response_head: bytes = await connection.reader.readuntil(b'\r\n\r\n')
+
+        except asyncio.IncompleteReadError as error:
+            if error.partial:
+                raise
+
+            raise ConnectionResetError('Server Disconnected')
+
+        if record:
+            record.mark(stage='first_byte')
+
+        status_line, *header_lines = response_head.decode('latin-1').split('\r\n')[:-2]
+        http_version, status, *_ = status_line.split(' ', 2)
+        status: int = int(status)
+        response_headers: CIMultiDict = CIMultiDict()
+
+        for header_line in header_lines:
+            header_name, _, header_value = header_line.partition(':')
+            response_headers.add(header_name.strip(), header_value.strip())
+
+        keep_alive: bool = http_version == 'HTTP/1.1' and response_headers.get('Connection', '').lower() != 'close'
+
+        if method == 'HEAD' or status in BODYLESS_STATUSES or status < 200:
+            body: bytes = b''
+
+        elif 'chunked' in response_headers.get('Transfer-Encoding', '').lower():
+            body: bytes = await self.read_chunked(reader=connection.reader)
+
+        elif 'Content-Length' in response_headers:
+            body: bytes = await connection.reader.readexactly(int(response_headers['Content-Length']))
+
+        else:
+            body: bytes = await connection.reader.read()
+            keep_alive: bool = False
+
+        return StreamResponse(status=status,
+                              headers=CIMultiDictProxy(response_headers),
+                              body=body), keep_alive
+
+    @staticmethod
+    async def read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks: list[bytes] = []
+
+        while True:
+            chunk_size: int = int((await reader.readline()).split(b';', 1)[0].strip(), 16)
+
+            if not chunk_size:
+                while (await reader.readline()).strip():
+                    pass
+
+                return b''.join(chunks)
+
+            chunks.append(await reader.readexactly(chunk_size))
+            await reader.readexactly(2)
+
+    async def close(self) -> None:
+        connections: list[StreamConnection] = [connection for idle_connections in self.idle_connections.values()
+                                               for connection in idle_connections]
+        self.idle_connections.clear()
+
+        for connection in connections:
+            connection.close()
+
+        await asyncio.gather(*[connection.writer.wait_closed() for connection in connections],
+                             return_exceptions=True)
+
+
+def create_transport(transport: str,
+                     proxy_str: str | None,
+                     session: aiohttp.ClientSession,
+                     connections_count: int,
+                     connection_stats: ConnectionStats,
+                     request_timeout: float = REQUEST_TIMEOUT_SECONDS) -> AiohttpTransport | StreamTransport:
+    if transport not in TRANSPORTS:
+        raise ValueError(f'Unknown Transport: {transport}')
+
+    if transport == STREAM_TRANSPORT and not proxy_str:
+        return StreamTransport(connections_count=connections_count,
+                               connection_stats=connection_stats,
+                               request_timeout=request_timeout)
+
+    if transport == STREAM_TRANSPORT:
+        logger.warning(f'Stream Transport Does Not Support Proxies, Using aiohttp For {URL(proxy_str).host}')
+
+    return AiohttpTransport(session=session)